@@ -12,45 +12,45 @@ REMOVE_PATHS: list[str] = [
     "{% if not cookiecutter.add_rust_extension %}.github/workflows/lint-rust.yml{% endif %}",
     "{% if not cookiecutter.add_rust_extension %}.github/workflows/build-rust.yml{% endif %}",
     "{% if not cookiecutter.add_rust_extension %}.github/workflows/test-rust.yml{% endif %}",
+    "{% if not cookiecutter.add_rust_extension %}scripts/build-wheels.py{% endif %}",
     "{% if cookiecutter.repository_provider != 'github' %}.github{% endif %}",
     "{% if cookiecutter.repository_provider != 'gitlab' %}.gitlab-ci.yml{% endif %}",
     "{% if cookiecutter.repository_provider != 'bitbucket' %}bitbucket-pipelines.yml{% endif %}",
 ]
 
 
-def post_gen_project() -> None:
+def post_gen_project(project_folder: Path) -> None:
     """Run post-generation tasks."""
-    reindent_cookiecutter_json()
-    remove_undesired_files()
+    reindent_cookiecutter_json(project_folder)
+    remove_undesired_files(project_folder)
 
 
-def reindent_cookiecutter_json():
+def reindent_cookiecutter_json(project_folder: Path) -> None:
     """Indent .cookiecutter.json using two spaces.
 
     The jsonify extension distributed with Cookiecutter uses an indentation
     width of four spaces. This conflicts with the default indentation width of
     Prettier for JSON files. Prettier is run as a pre-commit hook in CI.
     """
-    path = Path(".cookiecutter.json")
+    path = project_folder / ".cookiecutter.json"
+    path.write_text(reindent_json(path.read_text()))
 
-    with path.open() as io:
-        data = json.load(io)
 
-    with path.open(mode="w") as io:
-        json.dump(data, io, sort_keys=True, indent=2)
-        io.write("\n")
+def reindent_json(text: str) -> str:
+    """Returns the json text with sorted keys and an indentation width of two spaces."""
+    return json.dumps(json.loads(text), sort_keys=True, indent=2) + "\n"
 
 
-def remove_undesired_files() -> None:
+def remove_undesired_files(project_folder: Path, remove_paths: list[str] = REMOVE_PATHS) -> None:
     """Removes any files that are not desired in the generated project based on the cookiecutter.json.
 
     This is done to avoid issues that tend to arise when the name of the template file contains a conditional.
     """
-    for path in REMOVE_PATHS:
+    for path in remove_paths:
         if path == "":
             continue
 
-        path: Path = Path.cwd() / path
+        path: Path = project_folder / path
         if path.is_dir():
             shutil.rmtree(path, onerror=remove_readonly)
         else:
@@ -67,4 +67,4 @@ def remove_readonly(func: Callable[[str], Any], path: str, _: Any) -> None:
 
 
 if __name__ == "__main__":
-    post_gen_project()
+    post_gen_project(Path.cwd())
@@ -122,17 +122,14 @@ def test(session: Session) -> None:
     session.run("pytest", "tests")
 
 
-@nox.parametrize(arg_names="add_rust_extension", arg_values_list=[False, True], ids=["no-rust", "rust"])
 @nox.session(python=DEFAULT_TEMPLATE_PYTHON_VERSION, name="update-demo")
-def update_demo(session: Session, add_rust_extension: bool) -> None:
+def update_demo(session: Session) -> None:
+    """Update the generated project demos, updating every variant concurrently unless told otherwise after '--'."""
     session.log("Installing script dependencies for updating generated project demos...")
     session.install("cookiecutter", "cruft", "platformdirs", "loguru", "typer")
 
     session.log("Updating generated project demos...")
-    args: list[str] = [*UPDATE_DEMO_OPTIONS]
-    if add_rust_extension:
-        args.append("--add-rust-extension")
-    session.run("python", UPDATE_DEMO_SCRIPT, *args)
+    session.run("python", UPDATE_DEMO_SCRIPT, *UPDATE_DEMO_OPTIONS, *(session.posargs or ["--all-variants"]))
 
 
 @nox.session(python=False, name="release-template")
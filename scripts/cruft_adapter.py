@@ -0,0 +1,53 @@
+"""Module containing the only uses of cruft's internals in cookiecutter-robust-python scripts.
+
+cruft's public update command renders and diffs the template separately for every project it updates, so update-fleet
+calls the functions cruft uses to do so itself in order to share a single render and diff between projects. Demos and
+profile-render are rendered through TemplateRenderer rather than cruft.create, and write .cruft.json the way cruft
+does. None of these are part of cruft's public API, so cruft is pinned to a single minor version in pyproject.toml and
+nothing outside of this module imports from cruft._commands.
+"""
+import re
+from pathlib import Path
+from typing import Any
+from typing import Optional
+
+from cruft._commands.utils.cruft import json_dumps
+from cruft._commands.utils.diff import DIFF_DST_PREFIX
+from cruft._commands.utils.diff import DIFF_SRC_PREFIX
+from cruft._commands.utils.diff import get_diff
+from cruft._commands.utils.generate import _generate_output
+
+
+DIFF_HEADER_PATTERN: re.Pattern = re.compile(
+    rf"^diff --git {re.escape(DIFF_SRC_PREFIX)}(?P<old>.+) {re.escape(DIFF_DST_PREFIX)}(?P<new>.+)$"
+)
+
+
+def render_cruft_project(
+    cruft_state: dict[str, Any], commit: str, template_folder: Path, output_folder: Path
+) -> dict[str, Any]:
+    """Renders the context recorded in the cruft state from a checkout of the template at the commit.
+
+    Returns:
+        The context the project was rendered with, to be recorded as the project's new cruft state context.
+    """
+    return _generate_output(cruft_state, commit, template_folder, False, output_folder)
+
+
+def diff_folders(old_folder: Path, new_folder: Path) -> dict[str, str]:
+    """Returns cruft's diff of two rendered projects, split into the chunk for each file keyed by its relative path."""
+    chunks: dict[str, str] = {}
+    current: Optional[str] = None
+    for line in get_diff(old_folder, new_folder).splitlines(keepends=True):
+        match: Optional[re.Match] = DIFF_HEADER_PATTERN.match(line.rstrip("\n"))
+        if match is not None:
+            current = match.group("new").lstrip("/")
+            chunks[current] = ""
+        if current is not None:
+            chunks[current] += line
+    return chunks
+
+
+def dump_cruft_state(cruft_state: dict[str, Any]) -> str:
+    """Returns the contents of a .cruft.json holding the cruft state, formatted as cruft writes it."""
+    return json_dumps(cruft_state)
@@ -1,19 +1,39 @@
+"""Python script for printing restructuredText tables of the generated project's dependencies."""
+import hashlib
+import json
 import re
+import sys
+import urllib.request
+from importlib import metadata
 from pathlib import Path
+from typing import Annotated
+from typing import Any
+from typing import Optional
 
 import tomli
+import typer
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.generate import generate_context
+from cookiecutter.prompt import prompt_for_config
+from renderer import CACHE_FOLDER
+from util import REPO_FOLDER
+from util import TEMPLATE_FOLDER
 
 
-PROJECT = Path("{{cookiecutter.project_name}}")
-JINJA_PATTERN = re.compile(r"{%.*%}")
-JINJA_PATTERN2 = re.compile(r"{{[^{]*}}")
+LOCK_INDEX_FOLDER: Path = CACHE_FOLDER / "lock-index"
+PYPI_JSON_URL: str = "https://pypi.org/pypi/{name}/json"
+
 LINE_FORMAT = "   {name:{width}} {description}"
 CANONICALIZE_PATTERN = re.compile(r"[-_.]+")
 DESCRIPTION_PATTERN = re.compile(r"\. .*")
+REQUIREMENT_NAME_PATTERN = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+cli: typer.Typer = typer.Typer()
 
 
 def canonicalize_name(name: str) -> str:
-    # From ``packaging.utils.canonicalize_name`` (PEP 503)
+    """Returns the PEP 503 normalized form of the name, as in ``packaging.utils.canonicalize_name``."""
     return CANONICALIZE_PATTERN.sub("-", name).lower()
 
 
@@ -27,46 +47,165 @@ def format_dependency(dependency: str) -> str:
     return "coverage__" if dependency == "coverage" else f"{dependency}_"
 
 
-def main() -> None:
-    """Print restructuredText table of dependencies."""
-    path = PROJECT / "pyproject.toml"
-    text = path.read_text()
-    text = JINJA_PATTERN.sub("", text)
-    text = JINJA_PATTERN2.sub("x", text)
-    data = tomli.loads(text)
-
-    dependencies = {
-        canonicalize_name(dependency)
-        for section in ["dependencies", "dev-dependencies"]
-        for dependency in data["tool"]["poetry"][section].keys()
-        if dependency != "python"
-    }
-
-    path = PROJECT / "poetry.lock"
-    text = path.read_text()
-    data = tomli.loads(text)
-
-    descriptions = {
-        canonicalize_name(package["name"]): truncate_description(package["description"])
-        for package in data["package"]
-        if package["name"] in dependencies
-    }
-
-    table = {format_dependency(dependency): descriptions[dependency] for dependency in sorted(dependencies)}
-
-    width = max(len(name) for name in table)
-    width2 = max(len(description) for description in table.values())
-    separator = LINE_FORMAT.format(name="=" * width, width=width, description="=" * width2)
+def requirement_name(requirement: str) -> str:
+    """Returns the canonical name of the distribution referenced by a PEP 508 requirement string."""
+    match: Optional[re.Match] = REQUIREMENT_NAME_PATTERN.match(requirement)
+    if match is None:
+        raise ValueError(f"Unable to parse requirement {requirement=}.")
+    return canonicalize_name(match.group(1))
 
-    print(separator)
 
-    for name, description in table.items():
-        line = LINE_FORMAT.format(name=name, width=width, description=description)
+def render_pyproject(project: Path) -> dict[str, Any]:
+    """Returns the parsed pyproject.toml of the project, rendering it with default context if it is the template."""
+    text: str = (project / "pyproject.toml").read_text()
+    if project.resolve() == TEMPLATE_FOLDER.resolve():
+        context: dict[str, Any] = generate_context(context_file=str(REPO_FOLDER / "cookiecutter.json"))
+        context["cookiecutter"] = prompt_for_config(context, no_input=True)
+        environment: StrictEnvironment = StrictEnvironment(context=context, keep_trailing_newline=True)
+        text = environment.from_string(text).render(**context)
+    return tomli.loads(text)
 
-        print(line)
 
-    print(separator)
+def get_dependency_groups(pyproject: dict[str, Any]) -> dict[str, list[str]]:
+    """Returns the canonical dependency names of the project's dependencies and every dependency group."""
+    groups: dict[str, list[str]] = {
+        "dependencies": [requirement_name(requirement) for requirement in pyproject["project"].get("dependencies", [])]
+    }
+    declared: dict[str, list[Any]] = pyproject.get("dependency-groups", {})
+    for group in declared:
+        groups[group] = sorted(set(_expand_group(declared, group)))
+    return groups
+
+
+def _expand_group(declared: dict[str, list[Any]], group: str) -> list[str]:
+    """Expands a dependency group, following any include-group entries."""
+    names: list[str] = []
+    for entry in declared[group]:
+        if isinstance(entry, dict):
+            names.extend(_expand_group(declared, entry["include-group"]))
+        else:
+            names.append(requirement_name(entry))
+    return names
+
+
+def hash_lockfile(lockfile: Path) -> str:
+    """Returns the sha256 hex digest of the lockfile's contents."""
+    return hashlib.sha256(lockfile.read_bytes()).hexdigest()
+
+
+def get_lock_index_path(lockfile: Path) -> Path:
+    """Returns the path of the cached index for the lockfile's current contents."""
+    return LOCK_INDEX_FOLDER / f"{hash_lockfile(lockfile)}.json"
+
+
+def load_lock_index(lockfile: Path, index_path: Path) -> dict[str, dict[str, Any]]:
+    """Returns an index of the lockfile's packages, reusing the cached index if the lockfile hasn't changed."""
+    if index_path.exists():
+        return json.loads(index_path.read_text())
+
+    index: dict[str, dict[str, Any]] = {}
+    for package in tomli.loads(lockfile.read_text()).get("package", []):
+        entry: dict[str, Any] = index.setdefault(canonicalize_name(package["name"]), {"versions": []})
+        if "version" in package:
+            entry["versions"].append(package["version"])
+    save_lock_index(index_path=index_path, index=index)
+    return index
+
+
+def save_lock_index(index_path: Path, index: dict[str, dict[str, Any]]) -> None:
+    """Writes the lock index to the cache."""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(json.dumps(index, indent=2, sort_keys=True))
+
+
+def get_description(name: str, offline: bool) -> str:
+    """Returns the package summary from installed metadata, falling back to PyPI unless offline."""
+    try:
+        return metadata.metadata(name)["Summary"] or ""
+    except metadata.PackageNotFoundError:
+        pass
+    if offline:
+        return ""
+    try:
+        with urllib.request.urlopen(PYPI_JSON_URL.format(name=name), timeout=10) as response:  # noqa: S310
+            return json.load(response)["info"]["summary"] or ""
+    except OSError:
+        return ""
+
+
+def describe(index: dict[str, dict[str, Any]], names: list[str], offline: bool) -> bool:
+    """Fills in missing descriptions for the provided names, returning whether the index changed.
+
+    Packages without a description are left undescribed rather than cached as empty, so that a run that couldn't find
+    one, such as an offline run, doesn't stop later runs from looking it up.
+    """
+    changed: bool = False
+    for name in names:
+        entry: dict[str, Any] = index.setdefault(name, {"versions": []})
+        if "description" in entry:
+            continue
+        description: str = truncate_description(get_description(name, offline=offline))
+        if description:
+            entry["description"] = description
+            changed = True
+    return changed
+
+
+def format_table(title: str, index: dict[str, dict[str, Any]], names: list[str]) -> list[str]:
+    """Returns the lines of a restructuredText table of the provided dependencies."""
+    table: dict[str, str] = {
+        format_dependency(name): " ".join(filter(None, [_format_versions(index[name]), index[name].get("description")]))
+        for name in sorted(names)
+    }
+    width: int = max(len(name) for name in table)
+    width2: int = max([len(description) for description in table.values()] + [1])
+    separator: str = LINE_FORMAT.format(name="=" * width, width=width, description="=" * width2)
+
+    lines: list[str] = [title, "-" * len(title), "", separator]
+    lines.extend(LINE_FORMAT.format(name=name, width=width, description=description) for name, description in table.items())
+    lines.extend([separator, ""])
+    return lines
+
+
+def _format_versions(entry: dict[str, Any]) -> str:
+    """Returns the locked versions of a package as a compact string."""
+    versions: list[str] = entry["versions"]
+    return f"({', '.join(versions)})" if versions else ""
+
+
+@cli.callback(invoke_without_command=True)
+def main(
+    project: Annotated[Path, typer.Option("--project", "-p", file_okay=False, resolve_path=True)] = TEMPLATE_FOLDER,
+    lockfile: Annotated[Optional[Path], typer.Option("--lockfile", "-l", dir_okay=False, resolve_path=True)] = None,
+    offline: Annotated[bool, typer.Option("--offline", "-o")] = False,
+) -> None:
+    """Print restructuredText tables of dependencies for the project and each of its dependency groups."""
+    if lockfile is None and project == TEMPLATE_FOLDER.resolve():
+        typer.secho(
+            "error: The template has no uv.lock of its own. Pass --lockfile with the uv.lock of a generated demo, or "
+            "--project with the path of a generated project.",
+            fg="red",
+            err=True,
+        )
+        sys.exit(1)
+
+    lockfile = lockfile or project / "uv.lock"
+    if not lockfile.exists():
+        typer.secho(f"error: No uv.lock found at {lockfile=}. Pass --lockfile from a generated project.", fg="red")
+        sys.exit(1)
+
+    groups: dict[str, list[str]] = get_dependency_groups(render_pyproject(project))
+    index_path: Path = get_lock_index_path(lockfile)
+    index: dict[str, dict[str, Any]] = load_lock_index(lockfile=lockfile, index_path=index_path)
+    all_names: list[str] = sorted({name for names in groups.values() for name in names})
+    if describe(index=index, names=all_names, offline=offline):
+        save_lock_index(index_path=index_path, index=index)
+
+    for group, names in groups.items():
+        if not names:
+            continue
+        print("\n".join(format_table(title=group, index=index, names=names)))
 
 
 if __name__ == "__main__":
-    main()
+    cli()
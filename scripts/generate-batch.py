@@ -0,0 +1,148 @@
+"""Python script for generating many projects from a stream of extra contexts.
+
+Each input line is a JSON object of extra context, for example:
+
+    {"project_name": "billing-service", "add_rust_extension": false}
+
+Projects are rendered by a pool of worker processes that each load and compile the template once. Only a bounded
+window of contexts is in flight at any time, so memory use stays flat regardless of the size of the input. A JSON
+result line is written to stdout as each project finishes, in completion order rather than input order. Contexts that
+repeat an earlier project_name are rejected rather than rendered over the earlier project.
+"""
+import json
+import os
+import sys
+import time
+from concurrent.futures import ALL_COMPLETED
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import IO
+from typing import Annotated
+from typing import Any
+from typing import Iterator
+from typing import Optional
+
+import typer
+from renderer import TemplateRenderer
+from util import FolderOption
+
+
+cli: typer.Typer = typer.Typer()
+
+_renderer: Optional[TemplateRenderer] = None
+
+
+def _initialize_worker() -> None:
+    """Loads the template once per worker process."""
+    global _renderer
+    _renderer = TemplateRenderer()
+
+
+def render_context(line_number: int, extra_context: dict[str, Any], output_dir: Path) -> dict[str, Any]:
+    """Renders a single project within a worker process and returns its result record."""
+    start: float = time.perf_counter()
+    result: dict[str, Any] = {"line": line_number, "status": "ok"}
+    try:
+        result["path"] = str(_renderer.render(output_dir=output_dir, extra_context=extra_context))
+    except Exception as error:  # noqa: BLE001
+        result["status"] = "error"
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def read_contexts(reader: IO[str]) -> Iterator[tuple[int, Any]]:
+    """Lazily yields the line number and parsed JSON of each non-empty line, or the decode error if invalid."""
+    for line_number, line in enumerate(reader, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as error:
+            yield line_number, error
+
+
+def check_context(extra_context: Any, project_names: set[Optional[str]]) -> Optional[str]:
+    """Returns why the context can't be rendered, or None if it can.
+
+    Contexts without a project_name share the template's default, so only the first of them is rendered.
+    """
+    if isinstance(extra_context, json.JSONDecodeError):
+        return f"Invalid context: {extra_context}"
+    if not isinstance(extra_context, dict):
+        return "Invalid context: expected a JSON object"
+    project_name: Optional[str] = extra_context.get("project_name")
+    if project_name in project_names:
+        return f"Duplicate project_name: {project_name or 'the template default'!r}"
+    return None
+
+
+def generate_batch(reader: IO[str], writer: IO[str], output_dir: Path, workers: int, window: int) -> int:
+    """Renders every context from the reader, writing each result as it completes, and returns the failure count."""
+    failures: int = 0
+    pending: dict[Future, int] = {}
+    project_names: set[Optional[str]] = set()
+
+    def emit(result: dict[str, Any]) -> None:
+        nonlocal failures
+        failures += result["status"] != "ok"
+        writer.write(json.dumps(result) + "\n")
+        writer.flush()
+
+    def drain(return_when: str) -> None:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            line_number: int = pending.pop(future)
+            try:
+                emit(future.result())
+            except BrokenProcessPool as error:
+                emit({"line": line_number, "status": "error", "error": f"Worker process died: {error}"})
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker) as executor:
+        for line_number, extra_context in read_contexts(reader):
+            error: Optional[str] = check_context(extra_context=extra_context, project_names=project_names)
+            if error is not None:
+                emit({"line": line_number, "status": "error", "error": error})
+                continue
+            project_names.add(extra_context.get("project_name"))
+            if len(pending) >= window:
+                drain(return_when=FIRST_COMPLETED)
+            try:
+                pending[executor.submit(render_context, line_number, extra_context, output_dir)] = line_number
+            except BrokenProcessPool as error:
+                emit({"line": line_number, "status": "error", "error": f"Worker process died: {error}"})
+        if pending:
+            drain(return_when=ALL_COMPLETED)
+    return failures
+
+
+@cli.callback(invoke_without_command=True)
+def main(
+    output_dir: Annotated[Path, FolderOption("--output-dir", "-o")],
+    contexts: Annotated[str, typer.Argument(help="JSONL file of extra contexts, or - to read from stdin.")] = "-",
+    workers: Annotated[int, typer.Option("--workers", "-w", min=1)] = os.cpu_count() or 1,
+    window: Annotated[Optional[int], typer.Option("--window", help="Max contexts in flight at once.")] = None,
+) -> None:
+    """Generates a project for each extra context, reporting each result as a JSON line."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    window = window or workers * 2
+    if contexts == "-":
+        failures: int = generate_batch(
+            reader=sys.stdin, writer=sys.stdout, output_dir=output_dir, workers=workers, window=window
+        )
+    else:
+        with Path(contexts).open(encoding="utf-8") as reader:
+            failures = generate_batch(
+                reader=reader, writer=sys.stdout, output_dir=output_dir, workers=workers, window=window
+            )
+    if failures:
+        typer.secho(f"{failures} project(s) failed to generate.", fg="red", err=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
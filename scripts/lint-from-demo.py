@@ -1,14 +1,20 @@
+"""Python script for linting generated demo projects and applying the fixes back to the template."""
+import subprocess
+import sys
 from pathlib import Path
 from typing import Annotated
 
-import pre_commit.main
 import typer
 from retrocookie.core import retrocookie
-
-from util import git
+from retrocookie.git import CommandError
+from util import REPO_FOLDER
 from util import FolderOption
-from util import in_new_demo
+from util import generate_demo
+from util import get_demo_variants
+from util import git
+from util import remove_existing_demos
 from util import require_clean_and_up_to_date_repo
+from util import run_for_demo_variants
 
 
 # These still may need linted, but retrocookie shouldn't be used on them
@@ -17,34 +23,72 @@ IGNORED_FILES: list[str] = [
     "uv.lock",
 ]
 
+LINT_BRANCH: str = "temp/lint-from-demo"
+
 
 cli: typer.Typer = typer.Typer()
 
 
+def lint_demo_variant(demos_cache_folder: Path, add_rust_extension: bool) -> Path:
+    """Runs pre-commit in a newly generated demo and commits the results to a temporary branch of the demo."""
+    demo_path: Path = generate_demo(
+        demos_cache_folder=demos_cache_folder, add_rust_extension=add_rust_extension, no_cache=False
+    )
+    require_clean_and_up_to_date_repo(cwd=demo_path)
+    git("checkout", "develop", cwd=demo_path)
+    git("branch", "-D", LINT_BRANCH, ignore_error=True, cwd=demo_path)
+    git("checkout", "-b", LINT_BRANCH, "develop", cwd=demo_path)
+
+    # pre-commit exits with an error whenever a hook modifies files, which is the whole point here
+    process: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-m", "pre_commit", "run", "--all-files", "--show-diff-on-failure"],
+        cwd=demo_path,
+        capture_output=True,
+        text=True,
+    )
+    typer.echo(f"{demo_path.name}:\n{process.stdout}")
+    if process.stderr:
+        typer.echo(process.stderr, err=True)
+
+    for path in IGNORED_FILES:
+        git("checkout", "HEAD", "--", path, cwd=demo_path)
+    git("add", ".", cwd=demo_path)
+    git("commit", "-m", "meta: lint-from-demo", "--no-verify", cwd=demo_path)
+    return demo_path
+
+
 @cli.callback(invoke_without_command=True)
 def lint_from_demo(
     demos_cache_folder: Annotated[Path, FolderOption("--demos-cache-folder", "-c")],
     add_rust_extension: Annotated[bool, typer.Option("--add-rust-extension", "-r")] = False,
+    all_variants: Annotated[bool, typer.Option("--all-variants", "-a", help="Lint every demo concurrently.")] = False,
     no_cache: Annotated[bool, typer.Option("--no-cache", "-n")] = False
 ) -> None:
-    """Runs precommit in a generated project and matches the template to the results."""
-    with in_new_demo(
-        demos_cache_folder=demos_cache_folder,
-        add_rust_extension=add_rust_extension,
-        no_cache=no_cache
-    ) as demo_path:
-        require_clean_and_up_to_date_repo()
-        git("checkout", "develop")
-        git("branch", "-D", "temp/lint-from-demo", ignore_error=True)
-        git("checkout", "-b", "temp/lint-from-demo", "develop")
-        pre_commit.main.main(["run", "--all-files", "--show-diff-on-failure"])
-
-        for path in IGNORED_FILES:
-            git("checkout", "HEAD", "--", path)
-        git("add", ".")
-        git("commit", "-m", "meta: lint-from-demo", "--no-verify")
-    retrocookie(instance_path=demo_path, commits=["develop..temp/lint-from-demo"])
-
-
-if __name__ == '__main__':
+    """Runs precommit in generated projects and matches the template to the results.
+
+    Any existing demos are removed first when not using the cache, after which each demo is generated and linted
+    concurrently in its own repo. Retrocookie then applies the lint commits of each demo to the template one demo at a
+    time, since every run writes to the template's working tree.
+    """
+    variants: list[bool] = get_demo_variants(add_rust_extension=add_rust_extension, all_variants=all_variants)
+    if no_cache:
+        remove_existing_demos(demos_cache_folder=demos_cache_folder, variants=variants)
+    demo_paths: dict[bool, Path] = run_for_demo_variants(
+        lambda variant: lint_demo_variant(demos_cache_folder=demos_cache_folder, add_rust_extension=variant),
+        variants=variants,
+    )
+    failed: bool = len(demo_paths) < len(variants)
+    for variant in variants:
+        if variant not in demo_paths:
+            continue
+        try:
+            retrocookie(instance_path=demo_paths[variant], commits=[f"develop..{LINT_BRANCH}"], path=REPO_FOLDER)
+        except CommandError as error:
+            typer.secho(f"error: {demo_paths[variant].name}: {error}", fg="red", err=True)
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
     cli()
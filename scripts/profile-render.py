@@ -0,0 +1,150 @@
+"""Python script for profiling a render of the template.
+
+Every step of the render is timed, including compiling and rendering each template file, evaluating and applying each
+of the post gen hook's REMOVE_PATHS, and cruft's bookkeeping. Files under a removed path are also rendered so that the
+work cookiecutter spends rendering files it then deletes is visible. A sorted report is printed and the full trace is
+written in the Chrome trace event format, which can be opened in Perfetto or chrome://tracing.
+"""
+import json
+from pathlib import Path
+from typing import Annotated
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+import typer
+from cruft_adapter import dump_cruft_state
+from renderer import BYTECODE_CACHE_FOLDER
+from renderer import ProfileEvent
+from renderer import RenderedProject
+from renderer import RenderProfiler
+from renderer import TemplateRenderer
+from util import REPO_FOLDER
+from util import git
+
+
+cli: typer.Typer = typer.Typer()
+
+FILE_CATEGORIES: tuple[str, ...] = ("path", "compile", "render", "copy")
+
+
+def profile_render(
+    extra_context: dict[str, Any], output_dir: Optional[Path], use_bytecode_cache: bool
+) -> RenderProfiler:
+    """Renders the template once with profiling enabled and returns the profiler."""
+    profiler: RenderProfiler = RenderProfiler()
+    renderer: TemplateRenderer = TemplateRenderer(
+        bytecode_cache_folder=BYTECODE_CACHE_FOLDER if use_bytecode_cache else None, profiler=profiler
+    )
+
+    with profiler.measure("cruft", "git rev-parse HEAD"):
+        commit: str = git("-C", str(REPO_FOLDER), "rev-parse", "HEAD").stdout.strip()
+    with profiler.measure("cruft", "context"):
+        context: dict[str, Any] = renderer.get_cruft_context(commit=commit, extra_context=extra_context)
+
+    project: RenderedProject = renderer.render_project(context)
+    if output_dir is None:
+        for _ in project.values():
+            pass
+    else:
+        project_folder: Path = project.write(output_dir=output_dir)
+
+    with profiler.measure("cruft", ".cruft.json") as span:
+        cruft_json: str = dump_cruft_state(
+            {"template": str(REPO_FOLDER), "commit": commit, "checkout": None, "context": context, "directory": None}
+        )
+        if output_dir is not None:
+            (project_folder / ".cruft.json").write_text(cruft_json)
+        span["size"] = len(cruft_json.encode())
+
+    renderer.profiler = None
+    for removed, template_files in project.removed_files.items():
+        for path, template_file in template_files.items():
+            with profiler.measure("deleted", f"{removed}: {path}") as span:
+                span["size"] = len(renderer.render_file(template_file, context))
+    return profiler
+
+
+def write_trace(events: list[ProfileEvent], path: Path) -> None:
+    """Writes the events as a Chrome trace event file."""
+    trace: dict[str, Any] = {
+        "traceEvents": [
+            {
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": round(event.start * 1_000_000, 3),
+                "dur": round(event.seconds * 1_000_000, 3),
+                "pid": 1,
+                "tid": 1,
+                "args": {"bytes": event.size},
+            }
+            for event in events
+        ],
+        "displayTimeUnit": "ms",
+    }
+    path.write_text(json.dumps(trace, indent=2))
+
+
+def print_report(events: list[ProfileEvent], top: int) -> None:
+    """Prints the events summarized by category, template file, removed path, and cruft step, slowest first."""
+    _print_table("Totals by category", _sum_by(events, key=lambda event: event.category))
+    _print_table(
+        f"Slowest {top} template files (path + compile + render)",
+        _sum_by([event for event in events if event.category in FILE_CATEGORIES], key=lambda event: event.name),
+        limit=top,
+    )
+    _print_table("REMOVE_PATHS evaluations", _sum_by(_of(events, "remove"), key=lambda event: event.name))
+    _print_table("REMOVE_PATHS deletions", _sum_by(_of(events, "delete"), key=lambda event: event.name))
+    _print_table(
+        "Rendered then deleted by REMOVE_PATHS",
+        _sum_by(_of(events, "deleted"), key=lambda event: event.name.split(": ", 1)[0]),
+    )
+    _print_table("Cruft bookkeeping", _sum_by(_of(events, "cruft"), key=lambda event: event.name))
+
+
+def _of(events: list[ProfileEvent], category: str) -> list[ProfileEvent]:
+    """Returns the events in the category."""
+    return [event for event in events if event.category == category]
+
+
+def _sum_by(events: list[ProfileEvent], key: Callable[[ProfileEvent], str]) -> dict[str, tuple[float, int, int]]:
+    """Returns the total seconds, bytes, and count of the events for each key."""
+    totals: dict[str, tuple[float, int, int]] = {}
+    for event in events:
+        seconds, size, count = totals.get(key(event), (0.0, 0, 0))
+        totals[key(event)] = (seconds + event.seconds, size + event.size, count + 1)
+    return totals
+
+
+def _print_table(title: str, totals: dict[str, tuple[float, int, int]], limit: Optional[int] = None) -> None:
+    """Prints the totals for each name sorted from slowest to fastest."""
+    typer.secho(f"\n{title}", bold=True)
+    typer.echo(f"{'ms':>10} {'bytes':>10} {'count':>6}  name")
+    for name, (seconds, size, count) in sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:limit]:
+        typer.echo(f"{seconds * 1000:>10.3f} {size:>10} {count:>6}  {name}")
+
+
+@cli.callback(invoke_without_command=True)
+def main(
+    extra_context: Annotated[str, typer.Option("--extra-context", "-x", help="JSON object of extra context.")] = "{}",
+    output_dir: Annotated[
+        Optional[Path], typer.Option("--output-dir", "-o", help="Write the project to disk instead of to memory.")
+    ] = None,
+    trace: Annotated[Path, typer.Option("--trace", "-t", help="Path to write the Chrome trace to.")] = Path(
+        "render-trace.json"
+    ),
+    top: Annotated[int, typer.Option("--top", "-n", help="Number of template files to report.")] = 25,
+    no_bytecode_cache: Annotated[bool, typer.Option("--no-bytecode-cache", help="Compile every template.")] = False,
+) -> None:
+    """Profiles a single render of the template, printing a report and writing a trace."""
+    profiler: RenderProfiler = profile_render(
+        extra_context=json.loads(extra_context), output_dir=output_dir, use_bytecode_cache=not no_bytecode_cache
+    )
+    print_report(events=profiler.events, top=top)
+    write_trace(events=profiler.events, path=trace)
+    typer.secho(f"\nWrote trace of {len(profiler.events)} events to {trace}.", fg="green")
+
+
+if __name__ == "__main__":
+    cli()
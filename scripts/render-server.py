@@ -0,0 +1,128 @@
+"""Python script for serving renders of the template from a long-running process.
+
+Requests and responses are JSON objects, one per line, read from stdin and written to stdout or exchanged over a
+localhost TCP socket when --port is provided. A request looks like:
+
+    {"id": 1, "extra_context": {"project_name": "my-service"}, "output_dir": "/srv/projects"}
+
+When output_dir is omitted the rendered files are returned in the response instead of being written to disk, each as
+an object holding its content and the encoding of that content, which is utf-8 for text and base64 for anything else:
+
+    {"id": 1, "status": "ok", "files": {"README.md": {"encoding": "utf-8", "content": "..."}}, "seconds": 0.05}
+
+Every response includes the seconds spent handling its request, including error responses to invalid JSON.
+"""
+import base64
+import contextlib
+import io
+import json
+import socketserver
+import sys
+import time
+from pathlib import Path
+from typing import IO
+from typing import Annotated
+from typing import Any
+from typing import Optional
+
+import typer
+from renderer import TemplateRenderer
+
+
+cli: typer.Typer = typer.Typer()
+
+
+def encode_file(content: bytes) -> dict[str, str]:
+    """Returns the file's content as text when it's valid utf-8, and as base64 otherwise, along with its encoding."""
+    try:
+        return {"encoding": "utf-8", "content": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"encoding": "base64", "content": base64.b64encode(content).decode("ascii")}
+
+
+def handle_request(renderer: TemplateRenderer, request: dict[str, Any]) -> dict[str, Any]:
+    """Renders the requested project and returns the response for it."""
+    start: float = time.perf_counter()
+    response: dict[str, Any] = {"id": request.get("id"), "status": "ok"}
+    try:
+        extra_context: dict[str, Any] = request.get("extra_context", {})
+        if request.get("output_dir") is not None:
+            project_folder: Path = renderer.render(output_dir=Path(request["output_dir"]), extra_context=extra_context)
+            response["path"] = str(project_folder)
+        else:
+            context: dict[str, Any] = renderer.get_context(extra_context=extra_context)
+            files: dict[str, bytes] = renderer.render_files(context)
+            response["files"] = {path: encode_file(content) for path, content in files.items()}
+    except Exception as error:  # noqa: BLE001
+        response = {"id": request.get("id"), "status": "error", "error": f"{type(error).__name__}: {error}"}
+    response["seconds"] = round(time.perf_counter() - start, 6)
+    return response
+
+
+def serve_stream(renderer: TemplateRenderer, reader: IO[str], writer: IO[str]) -> None:
+    """Handles one JSON request per line from the reader, writing one JSON response per line to the writer."""
+    for line in reader:
+        if not line.strip():
+            continue
+        start: float = time.perf_counter()
+        try:
+            request: dict[str, Any] = json.loads(line)
+        except json.JSONDecodeError as error:
+            response: dict[str, Any] = {
+                "id": None,
+                "status": "error",
+                "error": f"Invalid request: {error}",
+                "seconds": round(time.perf_counter() - start, 6),
+            }
+        else:
+            response = handle_request(renderer=renderer, request=request)
+        writer.write(json.dumps(response) + "\n")
+        writer.flush()
+
+
+class RenderServer(socketserver.ThreadingTCPServer):
+    """Threaded localhost TCP server sharing a single renderer between its connections."""
+
+    allow_reuse_address: bool = True
+    daemon_threads: bool = True
+
+    def __init__(self, port: int, renderer: TemplateRenderer) -> None:
+        """Binds the server to the provided localhost port."""
+        super().__init__(("127.0.0.1", port), RenderRequestHandler)
+        self.renderer: TemplateRenderer = renderer
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    """Handles the line delimited render requests of a single connection."""
+
+    server: RenderServer
+
+    def handle(self) -> None:
+        """Serves requests until the client closes the connection."""
+        reader: io.TextIOWrapper = io.TextIOWrapper(self.rfile, encoding="utf-8")
+        writer: io.TextIOWrapper = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+        serve_stream(renderer=self.server.renderer, reader=reader, writer=writer)
+
+
+def serve_socket(renderer: TemplateRenderer, port: int) -> None:
+    """Serves render requests over a localhost TCP socket until interrupted."""
+    with RenderServer(port=port, renderer=renderer) as server:
+        typer.secho(f"Serving renders on 127.0.0.1:{server.server_address[1]}", fg="green", err=True)
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+
+
+@cli.callback(invoke_without_command=True)
+def main(
+    port: Annotated[Optional[int], typer.Option("--port", "-p", help="Serve over TCP instead of stdin.")] = None,
+) -> None:
+    """Loads and compiles the template once, then renders projects on request."""
+    renderer: TemplateRenderer = TemplateRenderer()
+    if port is None:
+        serve_stream(renderer=renderer, reader=sys.stdin, writer=sys.stdout)
+    else:
+        serve_socket(renderer=renderer, port=port)
+
+
+if __name__ == "__main__":
+    cli()
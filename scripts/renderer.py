@@ -0,0 +1,360 @@
+"""Module containing an in-process renderer for the cookiecutter-robust-python template.
+
+Unlike calling cookiecutter directly, the renderer reads cookiecutter.json, walks the template, and compiles every
+Jinja template once, then reuses all of it for each project it renders. The post generation hook's logic is applied
+in-process rather than in a subprocess. Compiled templates are also kept in an on-disk bytecode cache so that new
+processes can skip compiling templates that haven't changed.
+
+Passing a RenderProfiler to the renderer records the time and output size of every step of a render.
+"""
+import copy
+import hashlib
+import importlib.util
+import os
+import stat
+import sys
+import time
+from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextlib import nullcontext
+from pathlib import Path
+from pathlib import PurePath
+from types import ModuleType
+from typing import Any
+from typing import ContextManager
+from typing import Generator
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+
+import cookiecutter
+import jinja2
+import platformdirs
+from binaryornot.check import is_binary
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.generate import apply_overwrites_to_context
+from cookiecutter.generate import generate_context
+from cookiecutter.prompt import prompt_for_config
+from jinja2 import Environment
+from jinja2 import FileSystemLoader
+from jinja2 import Template
+from jinja2.bccache import Bucket
+from jinja2.bccache import FileSystemBytecodeCache
+
+
+REPO_FOLDER: Path = Path(__file__).resolve().parent.parent
+TEMPLATE_FOLDER_NAME: str = "{{cookiecutter.project_name}}"
+
+CACHE_FOLDER: Path = Path(
+    platformdirs.user_cache_path(appname="cookiecutter-robust-python", appauthor="56kyle")
+).resolve()
+BYTECODE_CACHE_FOLDER: Path = (
+    CACHE_FOLDER
+    / "jinja-bytecode"
+    / f"{sys.implementation.cache_tag}-jinja-{jinja2.__version__}-cookiecutter-{cookiecutter.__version__}"
+)
+
+
+class TemplateFile(NamedTuple):
+    """A file within the template folder."""
+
+    path: str
+    binary: bool
+    mode: int
+    newline: str
+
+
+class ProfileEvent(NamedTuple):
+    """A single timed step of a render, with its start relative to when profiling began."""
+
+    category: str
+    name: str
+    start: float
+    seconds: float
+    size: int = 0
+
+
+class RenderProfiler:
+    """Records how long each step of a render takes and how many bytes it produces."""
+
+    def __init__(self) -> None:
+        """Starts the profiler's clock."""
+        self.origin: float = time.perf_counter()
+        self.events: list[ProfileEvent] = []
+
+    @contextmanager
+    def measure(self, category: str, name: str) -> Generator[dict[str, int], None, None]:
+        """Times the enclosed step, yielding a dict whose "size" may be set to the number of bytes it produced."""
+        span: dict[str, int] = {"size": 0}
+        start: float = time.perf_counter()
+        try:
+            yield span
+        finally:
+            end: float = time.perf_counter()
+            self.events.append(
+                ProfileEvent(
+                    category=category, name=name, start=start - self.origin, seconds=end - start, size=span["size"]
+                )
+            )
+
+
+class ContentBytecodeCache(FileSystemBytecodeCache):
+    """Jinja bytecode cache keyed by the name and source of each template rather than by its location on disk.
+
+    Keying by content lets renders from any checkout or worktree of the template share compiled templates, while any
+    edit to a template simply misses the cache. The cache folder is versioned by Python, Jinja, and cookiecutter.
+    """
+
+    def get_bucket(self, environment: Environment, name: str, _filename: Optional[str], source: str) -> Bucket:
+        """Returns the cache bucket for the template, loading any bytecode previously stored for its content.
+
+        The template's filename is ignored, since it differs between checkouts of the same template.
+        """
+        key: str = hashlib.sha256(f"{name}\0{source}".encode()).hexdigest()
+        bucket: Bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+
+class TemplateRenderer:
+    """Renders projects from a template that is loaded and compiled once."""
+
+    def __init__(
+        self,
+        repo_folder: Path = REPO_FOLDER,
+        bytecode_cache_folder: Optional[Path] = BYTECODE_CACHE_FOLDER,
+        profiler: Optional[RenderProfiler] = None,
+    ) -> None:
+        """Loads the template's context, files, and post generation hook.
+
+        Compiled templates are cached under the bytecode cache folder, which can be set to None to disable caching.
+        """
+        self.repo_folder: Path = repo_folder
+        self.template_folder: Path = repo_folder / TEMPLATE_FOLDER_NAME
+        self.profiler: Optional[RenderProfiler] = profiler
+        with self.measure("load", "cookiecutter.json"):
+            self.defaults: dict[str, Any] = generate_context(context_file=str(repo_folder / "cookiecutter.json"))
+        bytecode_cache: Optional[ContentBytecodeCache] = None
+        if bytecode_cache_folder is not None:
+            bytecode_cache_folder.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = ContentBytecodeCache(directory=str(bytecode_cache_folder))
+        self.environment: StrictEnvironment = StrictEnvironment(
+            context=self.defaults,
+            keep_trailing_newline=True,
+            loader=FileSystemLoader(str(self.template_folder)),
+            bytecode_cache=bytecode_cache,
+        )
+        with self.measure("load", "template files"):
+            self.files: list[TemplateFile] = list(self._walk_template())
+        with self.measure("load", "post gen hook"):
+            self.hook: ModuleType = load_hook(repo_folder / "hooks" / "post_gen_project.py")
+        self._path_templates: dict[str, Template] = {}
+        self._remove_path_templates: list[Template] = [
+            self.environment.from_string(path) for path in self.hook.REMOVE_PATHS
+        ]
+
+    def measure(self, category: str, name: str) -> ContextManager[dict[str, int]]:
+        """Times the enclosed step if profiling, otherwise does nothing."""
+        if self.profiler is None:
+            return nullcontext({"size": 0})
+        return self.profiler.measure(category=category, name=name)
+
+    def _walk_template(self) -> list[TemplateFile]:
+        """Returns every file in the template folder in the same order cookiecutter renders them."""
+        files: list[TemplateFile] = []
+        for root, dirs, filenames in os.walk(self.template_folder):
+            dirs.sort()
+            for filename in sorted(filenames):
+                path: Path = Path(root, filename)
+                binary: bool = is_binary(str(path))
+                newline: str = "\n"
+                if not binary:
+                    with path.open(encoding="utf-8") as io:
+                        io.readline()
+                    newline = io.newlines[0] if isinstance(io.newlines, tuple) else io.newlines or "\n"
+                files.append(
+                    TemplateFile(
+                        path=path.relative_to(self.template_folder).as_posix(),
+                        binary=binary,
+                        mode=stat.S_IMODE(path.stat().st_mode),
+                        newline=newline,
+                    )
+                )
+        return files
+
+    def get_context(self, extra_context: Optional[dict[str, Any]] = None, output_dir: str = ".") -> dict[str, Any]:
+        """Returns the full cookiecutter context for the provided extra context, as cookiecutter would build it."""
+        context: dict[str, Any] = copy.deepcopy(self.defaults)
+        if extra_context:
+            apply_overwrites_to_context(context["cookiecutter"], extra_context)
+        context["_cookiecutter"] = {k: v for k, v in context["cookiecutter"].items() if not k.startswith("_")}
+        context["cookiecutter"] = prompt_for_config(context, no_input=True)
+        context["cookiecutter"]["_template"] = str(self.repo_folder)
+        context["cookiecutter"]["_output_dir"] = str(Path(output_dir).resolve())
+        context["cookiecutter"]["_repo_dir"] = str(self.repo_folder)
+        context["cookiecutter"]["_checkout"] = None
+        return context
+
+    def get_cruft_context(
+        self, commit: str, extra_context: Optional[dict[str, Any]] = None, template: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Returns the context cruft would build when creating a project from the template at the provided commit.
+
+        The template is the location cruft was given, defaulting to the repo folder the renderer loaded.
+        """
+        context: dict[str, Any] = copy.deepcopy(self.defaults)
+        if extra_context:
+            apply_overwrites_to_context(context["cookiecutter"], extra_context)
+        context["cookiecutter"] = prompt_for_config(context, no_input=True)
+        context["cookiecutter"]["_template"] = template or str(self.repo_folder)
+        context["cookiecutter"]["_commit"] = commit
+        return context
+
+    def render_path(self, template_path: str, context: dict[str, Any]) -> str:
+        """Returns the rendered relative path of a template file, which is empty if the file shouldn't exist."""
+        with self.measure("path", template_path):
+            if template_path not in self._path_templates:
+                self._path_templates[template_path] = self.environment.from_string(template_path)
+            rendered: str = self._path_templates[template_path].render(**context)
+        return "" if rendered.endswith("/") else rendered
+
+    def render_file(self, template_file: TemplateFile, context: dict[str, Any]) -> bytes:
+        """Returns the rendered contents of a template file."""
+        if template_file.binary:
+            with self.measure("copy", template_file.path) as span:
+                content: bytes = (self.template_folder / template_file.path).read_bytes()
+                span["size"] = len(content)
+            return content
+
+        with self.measure("compile", template_file.path):
+            template: Template = self.environment.get_template(template_file.path)
+        with self.measure("render", template_file.path) as span:
+            text: str = template.render(**context)
+            if template_file.newline != "\n":
+                text = text.replace("\n", template_file.newline)
+            content = text.encode("utf-8")
+            span["size"] = len(content)
+        return content
+
+    def render_files(self, context: dict[str, Any]) -> dict[str, bytes]:
+        """Returns the rendered project as a map of relative paths to contents, with the post gen hook applied."""
+        return dict(self.render_project(context))
+
+    def render_project(self, context: dict[str, Any]) -> "RenderedProject":
+        """Returns the rendered project held in memory, rendering each file only when it is read."""
+        return RenderedProject(renderer=self, context=context)
+
+    def get_remove_paths(self, context: dict[str, Any]) -> list[str]:
+        """Returns the relative paths the post gen hook would remove for the context."""
+        paths: list[str] = []
+        for source, template in zip(self.hook.REMOVE_PATHS, self._remove_path_templates):
+            with self.measure("remove", source):
+                paths.append(template.render(**context))
+        return [path for path in paths if path != ""]
+
+    def render(self, output_dir: Path, extra_context: Optional[dict[str, Any]] = None) -> Path:
+        """Renders a project into the output directory, overwriting any existing files, and returns its path."""
+        context: dict[str, Any] = self.get_context(extra_context=extra_context, output_dir=str(output_dir))
+        return self.write_project(output_dir=output_dir, context=context)
+
+    def write_project(self, output_dir: Path, context: dict[str, Any]) -> Path:
+        """Renders the project for an already built context into the output directory and returns its path."""
+        return self.render_project(context).write(output_dir=output_dir)
+
+
+class RenderedProject(Mapping[str, bytes]):
+    """A rendered project held in memory as a map of relative paths to contents.
+
+    Which files exist is decided up front from the rendered paths and the post gen hook's removals, while the contents
+    of each file are only rendered the first time they are read.
+    """
+
+    def __init__(self, renderer: TemplateRenderer, context: dict[str, Any]) -> None:
+        """Resolves the rendered path of every template file that survives the post gen hook."""
+        self.renderer: TemplateRenderer = renderer
+        self.context: dict[str, Any] = context
+        self.removed_paths: list[str] = renderer.get_remove_paths(context)
+        self.removed_files: dict[str, dict[str, TemplateFile]] = {removed: {} for removed in self.removed_paths}
+        self._template_files: dict[str, TemplateFile] = {}
+        for template_file in renderer.files:
+            path: str = renderer.render_path(template_file.path, context)
+            if path:
+                self._template_files[path] = template_file
+        for removed in self.removed_paths:
+            with renderer.measure("delete", removed):
+                for path in [path for path in self._template_files if _is_within(path, removed)]:
+                    self.removed_files[removed][path] = self._template_files.pop(path)
+        self._contents: dict[str, bytes] = {}
+
+    def __getitem__(self, path: Union[str, PurePath]) -> bytes:
+        """Returns the contents of the file at the relative path, rendering it if it hasn't been already."""
+        key: str = _normalize(path)
+        if key not in self._contents:
+            content: bytes = self.renderer.render_file(self._template_files[key], self.context)
+            if key == ".cookiecutter.json":
+                content = self.renderer.hook.reindent_json(content.decode()).encode()
+            self._contents[key] = content
+        return self._contents[key]
+
+    def __contains__(self, path: object) -> bool:
+        """Checks whether a file exists at the relative path without rendering it."""
+        return isinstance(path, (str, PurePath)) and _normalize(path) in self._template_files
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the relative path of every file in the project."""
+        return iter(self._template_files)
+
+    def __len__(self) -> int:
+        """Returns the number of files in the project."""
+        return len(self._template_files)
+
+    def exists(self, path: Union[str, PurePath]) -> bool:
+        """Checks whether a file or folder exists at the relative path."""
+        key: str = _normalize(path)
+        return any(_is_within(other, key) for other in self._template_files)
+
+    def read_text(self, path: Union[str, PurePath], encoding: str = "utf-8") -> str:
+        """Returns the decoded contents of the file at the relative path."""
+        return self[path].decode(encoding)
+
+    @property
+    def modes(self) -> dict[str, int]:
+        """The file mode of each rendered relative path."""
+        return {path: template_file.mode for path, template_file in self._template_files.items()}
+
+    def write(self, output_dir: Path) -> Path:
+        """Writes the project into the output directory, overwriting any existing files, and returns its path."""
+        project_folder: Path = output_dir / self.renderer.render_path(TEMPLATE_FOLDER_NAME, self.context)
+        with self.renderer.measure("write", str(project_folder)) as span:
+            write_files(project_folder=project_folder, files=self, modes=self.modes)
+            span["size"] = sum(len(content) for content in self.values())
+        return project_folder
+
+
+def _is_within(path: str, folder: str) -> bool:
+    """Checks whether the relative path is, or is within, the relative folder."""
+    return path == folder or path.startswith(f"{folder}/")
+
+
+def _normalize(path: Union[str, PurePath]) -> str:
+    """Returns the relative path in the posix form used as a key by RenderedProject."""
+    return PurePath(path).as_posix()
+
+
+def load_hook(path: Path) -> ModuleType:
+    """Imports an unrendered hook module so that its functions and REMOVE_PATHS can be used in-process."""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_files(project_folder: Path, files: Mapping[str, bytes], modes: dict[str, int]) -> None:
+    """Writes a rendered file map to disk under the project folder."""
+    for relative_path, content in files.items():
+        path: Path = project_folder / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        if relative_path in modes:
+            path.chmod(modes[relative_path])
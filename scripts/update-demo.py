@@ -1,47 +1,56 @@
+"""Python script for updating the generated demo projects to the latest template."""
 import sys
 from pathlib import Path
 from typing import Annotated
 
 import cruft
 import typer
-from cookiecutter.utils import work_in
-
+from util import CRUFT_LOCK
+from util import REPO_FOLDER
+from util import FolderOption
 from util import get_demo_name
+from util import get_demo_variants
 from util import git
-from util import FolderOption
-from util import REPO_FOLDER
 from util import require_clean_and_up_to_date_repo
+from util import run_for_demo_variants
 
 
 cli: typer.Typer = typer.Typer()
 
 
+def update_demo_variant(demos_cache_folder: Path, add_rust_extension: bool) -> None:
+    """Updates a single demo to the latest template and pushes the result."""
+    demo_name: str = get_demo_name(add_rust_extension=add_rust_extension)
+    demo_path: Path = demos_cache_folder / demo_name
+    typer.secho(f"Updating demo project at {demo_path=}.", fg="yellow")
+    require_clean_and_up_to_date_repo(cwd=demo_path)
+    git("checkout", "develop", cwd=demo_path)
+    with CRUFT_LOCK:
+        cruft.update(
+            project_dir=demo_path,
+            template_path=REPO_FOLDER,
+            extra_context={"project_name": demo_name, "add_rust_extension": add_rust_extension},
+        )
+    git("add", ".", cwd=demo_path)
+    git("commit", "-m", "chore: update demo to the latest cookiecutter-robust-python", "--no-verify", cwd=demo_path)
+    git("push", cwd=demo_path)
+
+
 @cli.callback(invoke_without_command=True)
 def update_demo(
     demos_cache_folder: Annotated[Path, FolderOption("--demos-cache-folder", "-c")],
-    add_rust_extension: Annotated[bool, typer.Option("--add-rust-extension", "-r")] = False
+    add_rust_extension: Annotated[bool, typer.Option("--add-rust-extension", "-r")] = False,
+    all_variants: Annotated[bool, typer.Option("--all-variants", "-a", help="Update every demo concurrently.")] = False,
 ) -> None:
-    """Runs precommit in a generated project and matches the template to the results."""
-    try:
-        demo_name: str = get_demo_name(add_rust_extension=add_rust_extension)
-        demo_path: Path = demos_cache_folder / demo_name
-        typer.secho(f"Updating demo project at {demo_path=}.", fg="yellow")
-        with work_in(demo_path):
-            require_clean_and_up_to_date_repo()
-            git("checkout", "develop")
-            cruft.update(
-                project_dir=demo_path,
-                template_path=REPO_FOLDER,
-                extra_context={"project_name": demo_name, "add_rust_extension": add_rust_extension},
-            )
-            git("add", ".")
-            git("commit", "-m", "chore: update demo to the latest cookiecutter-robust-python", "--no-verify")
-            git("push")
-
-    except Exception as error:
-        typer.secho(f"error: {error}", fg="red")
+    """Updates the requested demos to the latest template, each in its own repo at the same time."""
+    variants: list[bool] = get_demo_variants(add_rust_extension=add_rust_extension, all_variants=all_variants)
+    results: dict[bool, None] = run_for_demo_variants(
+        lambda variant: update_demo_variant(demos_cache_folder=demos_cache_folder, add_rust_extension=variant),
+        variants=variants,
+    )
+    if len(results) < len(variants):
         sys.exit(1)
 
 
-if __name__ == '__main__':
+if __name__ == "__main__":
     cli()
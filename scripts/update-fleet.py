@@ -0,0 +1,296 @@
+"""Python script for updating many projects generated from this template at once.
+
+Projects are grouped by the template commit and context recorded in their .cruft.json. The template is only rendered
+and diffed once per group, after which the diff is applied to every project in the group concurrently. Each project's
+cruft skip paths and deleted files are filtered out of the shared diff rather than triggering a render of their own.
+"""
+
+import copy
+import fnmatch
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Annotated
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+
+import typer
+from cruft_adapter import diff_folders
+from cruft_adapter import dump_cruft_state
+from cruft_adapter import render_cruft_project
+from util import REPO_FOLDER
+from util import FolderOption
+from util import git
+from util import template_worktree
+
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    import tomli as tomllib
+
+
+cli: typer.Typer = typer.Typer()
+
+
+class Project(NamedTuple):
+    """A project generated from the template along with its cruft state."""
+
+    path: Path
+    cruft_state: dict[str, Any]
+
+    @property
+    def group_key(self) -> tuple[str, str, str]:
+        """Returns the key shared by every project that renders to the same template output."""
+        return (
+            self.cruft_state["commit"],
+            self.cruft_state.get("directory") or "",
+            json.dumps(self.cruft_state["context"]["cookiecutter"], sort_keys=True),
+        )
+
+
+class Result(NamedTuple):
+    """The outcome of updating a single project."""
+
+    path: Path
+    status: str
+    detail: str = ""
+    files: int = 0
+    seconds: float = 0.0
+
+
+class TemplateDiff(NamedTuple):
+    """A diff between the rendered output of two template commits for one context."""
+
+    old_folder: Path
+    new_context: dict[str, Any]
+    chunks: dict[str, str]
+
+
+def load_project(path: Path) -> Project:
+    """Loads the cruft state of the project at the provided path."""
+    return Project(path=path, cruft_state=json.loads((path / ".cruft.json").read_text()))
+
+
+def group_projects(projects: list[Project]) -> dict[tuple[str, str, str], list[Project]]:
+    """Groups projects that share a template commit and context."""
+    groups: dict[tuple[str, str, str], list[Project]] = {}
+    for project in projects:
+        groups.setdefault(project.group_key, []).append(project)
+    return groups
+
+
+def render_template_diff(
+    template_folder: Path, new_template_folder: Path, new_commit: str, project: Project, work_folder: Path
+) -> TemplateDiff:
+    """Renders a project's context at its recorded and new template commits and returns the diff between them."""
+    old_folder: Path = work_folder / "old"
+    new_folder: Path = work_folder / "new"
+    old_commit: str = project.cruft_state["commit"]
+    with template_worktree(template_folder, old_commit, work_folder / "template") as old_template_folder:
+        render_cruft_project(project.cruft_state, old_commit, old_template_folder, old_folder)
+    new_context: dict[str, Any] = render_cruft_project(project.cruft_state, new_commit, new_template_folder, new_folder)
+    return TemplateDiff(old_folder=old_folder, new_context=new_context, chunks=diff_folders(old_folder, new_folder))
+
+
+def get_skipped_paths(project: Project, template_diff: TemplateDiff) -> list[str]:
+    """Returns the relative paths and patterns of the diff that shouldn't be applied to the project.
+
+    These are the project's cruft skip entries and any template files that have since been deleted from the project,
+    matching what cruft removes from its own renders before diffing.
+    """
+    skipped: list[str] = list(project.cruft_state.get("skip", []))
+    pyproject_path: Path = project.path / "pyproject.toml"
+    if pyproject_path.is_file():
+        skipped.extend(tomllib.loads(pyproject_path.read_text()).get("tool", {}).get("cruft", {}).get("skip", []))
+    for path in template_diff.old_folder.rglob("*"):
+        relative_path: str = path.relative_to(template_diff.old_folder).as_posix()
+        if path.is_file() and not (project.path / relative_path).exists():
+            skipped.append(relative_path)
+    return skipped
+
+
+def is_skipped(relative_path: str, skipped: list[str]) -> bool:
+    """Checks whether the relative path matches any of the skipped paths or patterns."""
+    for pattern in skipped:
+        pattern = pattern.rstrip("/")
+        if relative_path == pattern or relative_path.startswith(f"{pattern}/"):
+            return True
+        if "*" in pattern and fnmatch.fnmatch(relative_path, pattern):
+            return True
+    return False
+
+
+def update_project(project: Project, template_diff: TemplateDiff, new_commit: str, checkout: Optional[str]) -> Result:
+    """Applies the shared template diff to a single project and records the new cruft state.
+
+    A project whose diff is entirely skipped is up to date once its new cruft state is recorded. The cruft state of a
+    project with conflicts is left as is, so that updating it again retries the same diff once it's cleaned up.
+    """
+    start: float = time.perf_counter()
+    skipped: list[str] = get_skipped_paths(project=project, template_diff=template_diff)
+    chunks: dict[str, str] = {
+        path: chunk
+        for path, chunk in template_diff.chunks.items()
+        if not is_skipped(relative_path=path, skipped=skipped)
+    }
+
+    status: str = "up-to-date"
+    detail: str = ""
+    if chunks:
+        status, detail = apply_diff(project=project, chunks=chunks)
+
+    if status != "conflict":
+        cruft_state: dict[str, Any] = copy.deepcopy(project.cruft_state)
+        cruft_state["commit"] = new_commit
+        cruft_state["checkout"] = checkout
+        cruft_state["context"] = template_diff.new_context
+        (project.path / ".cruft.json").write_text(dump_cruft_state(cruft_state))
+    return Result(
+        path=project.path, status=status, detail=detail, files=len(chunks), seconds=time.perf_counter() - start
+    )
+
+
+def apply_diff(project: Project, chunks: dict[str, str]) -> tuple[str, str]:
+    """Applies the diff chunks to the project, returning the resulting status along with any files that failed to apply.
+
+    Like cruft, a three-way merge is attempted first. Any diff that can't be merged is applied hunk by hunk, leaving a
+    .rej file next to each file with hunks that couldn't be applied.
+    """
+    with tempfile.TemporaryDirectory() as temp_folder:
+        patch_path: Path = Path(temp_folder, "template.patch")
+        patch_path.write_text("".join(chunks.values()))
+        if is_git_repo(project):
+            if _git_apply(project, patch_path, "-3"):
+                return "updated", ""
+            if not is_clean(project):
+                return "conflict", "merge conflicts left in the working tree"
+
+        if _git_apply(project, patch_path, "--reject"):
+            return "updated", ""
+    rejected: list[str] = [path for path in chunks if (project.path / f"{path}.rej").exists()]
+    return "conflict", f"rejected hunks in {', '.join(rejected)}"
+
+
+def _git_apply(project: Project, patch_path: Path, *args: str) -> bool:
+    """Runs git apply on the patch within the project, returning whether it applied cleanly."""
+    return git("-C", str(project.path), "apply", *args, str(patch_path), ignore_error=True) is not None
+
+
+def is_git_repo(project: Project) -> bool:
+    """Checks whether the project is a git repository."""
+    return (project.path / ".git").exists()
+
+
+def is_clean(project: Project) -> bool:
+    """Checks whether the project has no uncommitted changes, treating projects outside of git as clean."""
+    if not is_git_repo(project):
+        return True
+    return git("-C", str(project.path), "status", "--porcelain").stdout.strip() == ""
+
+
+def update_fleet(projects: list[Project], template_folder: Path, checkout: Optional[str], workers: int) -> list[Result]:
+    """Updates every project, rendering and diffing each distinct template output once."""
+    new_commit: str = git("-C", str(template_folder), "rev-parse", checkout or "HEAD").stdout.strip()
+    results: list[Result] = []
+    with ExitStack() as stack:
+        executor: ThreadPoolExecutor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+        temp_folder: str = stack.enter_context(tempfile.TemporaryDirectory())
+        new_template_folder: Path = stack.enter_context(
+            template_worktree(template_folder, new_commit, Path(temp_folder, "template"))
+        )
+        futures: dict[Future, Project] = {}
+        for index, group in enumerate(group_projects(projects).values()):
+            ready: list[Project] = []
+            for project in group:
+                if project.cruft_state["commit"] == new_commit:
+                    results.append(report(Result(path=project.path, status="up-to-date")))
+                elif not is_clean(project):
+                    results.append(report(Result(path=project.path, status="skipped", detail="uncommitted changes")))
+                else:
+                    ready.append(project)
+            if not ready:
+                continue
+
+            start: float = time.perf_counter()
+            try:
+                template_diff: TemplateDiff = render_template_diff(
+                    template_folder=template_folder,
+                    new_template_folder=new_template_folder,
+                    new_commit=new_commit,
+                    project=ready[0],
+                    work_folder=Path(temp_folder, str(index)),
+                )
+            except Exception as error:  # noqa: BLE001
+                for project in ready:
+                    results.append(report(Result(path=project.path, status="failed", detail=str(error).strip())))
+                continue
+            typer.secho(
+                f"Rendered template diff for {len(ready)} project(s) in {time.perf_counter() - start:.2f}s.",
+                fg="cyan",
+                err=True,
+            )
+            futures.update(
+                {
+                    executor.submit(update_project, project, template_diff, new_commit, checkout): project
+                    for project in ready
+                }
+            )
+
+        for future in as_completed(futures):
+            try:
+                result: Result = future.result()
+            except Exception as error:  # noqa: BLE001
+                result = Result(path=futures[future].path, status="error", detail=f"{type(error).__name__}: {error}")
+            results.append(report(result))
+    return results
+
+
+def report(result: Result) -> Result:
+    """Prints a single project's result as soon as it is known."""
+    color: str = {"updated": "green", "up-to-date": "green", "conflict": "yellow"}.get(result.status, "red")
+    line: str = f"{result.status:<10} {result.path} ({result.files} file(s), {result.seconds:.2f}s)"
+    typer.secho(f"{line} {result.detail}".rstrip(), fg=color)
+    return result
+
+
+@cli.callback(invoke_without_command=True)
+def main(
+    project_paths: Annotated[Optional[list[Path]], typer.Argument(help="Paths of the projects to update.")] = None,
+    projects_file: Annotated[
+        Optional[Path], typer.Option("--projects-file", "-f", help="File listing one project path per line.")
+    ] = None,
+    template_folder: Annotated[Path, FolderOption("--template", "-t")] = REPO_FOLDER,
+    checkout: Annotated[Optional[str], typer.Option("--checkout", "-c", help="Template ref to update to.")] = None,
+    workers: Annotated[int, typer.Option("--workers", "-w", min=1)] = 8,
+) -> None:
+    """Updates a fleet of projects to the latest template, reporting the outcome for each."""
+    paths: list[Path] = list(project_paths or [])
+    if projects_file is not None:
+        paths.extend(Path(line.strip()) for line in projects_file.read_text().splitlines() if line.strip())
+    if not paths:
+        typer.secho("No projects provided.", fg="red", err=True)
+        sys.exit(1)
+
+    projects: list[Project] = [load_project(path.resolve()) for path in paths]
+    results: list[Result] = update_fleet(
+        projects=projects, template_folder=template_folder, checkout=checkout, workers=workers
+    )
+
+    counts: dict[str, int] = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    typer.secho(", ".join(f"{count} {status}" for status, count in sorted(counts.items())), err=True)
+    if any(result.status in ("conflict", "failed", "error") for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
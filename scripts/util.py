@@ -4,6 +4,11 @@ import shutil
 import stat
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
@@ -12,16 +17,35 @@ from typing import Callable
 from typing import Generator
 from typing import Literal
 from typing import Optional
+from typing import TypeVar
 from typing import overload
 
-import cruft
 import typer
+from cookiecutter.exceptions import CookiecutterException
 from cookiecutter.utils import work_in
+from cruft.exceptions import CruftError
+from cruft_adapter import dump_cruft_state
+from renderer import TemplateRenderer
 from typer.models import OptionInfo
 
 
-REPO_FOLDER: Path = Path(__file__).resolve().parent.parent
+T = TypeVar("T")
+
+# Errors from git, cookiecutter, cruft, and the checks made of each demo, rather than bugs in the scripts themselves
+DEMO_VARIANT_ERRORS: tuple[type[Exception], ...] = (
+    subprocess.CalledProcessError,
+    OSError,
+    ValueError,
+    CookiecutterException,
+    CruftError,
+    typer.Abort,
+)
 
+# Held around cruft and cookiecutter calls made by demo variants, which change the working directory every thread shares
+CRUFT_LOCK: threading.Lock = threading.Lock()
+
+REPO_FOLDER: Path = Path(__file__).resolve().parent.parent
+TEMPLATE_FOLDER: Path = REPO_FOLDER / "{{cookiecutter.project_name}}"
 
 FolderOption: partial[OptionInfo] = partial(
     typer.Option, dir_okay=True, file_okay=False, resolve_path=True, path_type=Path
@@ -38,19 +62,25 @@ def remove_readonly(func: Callable[[str], Any], path: str, _: Any) -> None:
 
 
 @overload
-def run_command(command: str, *args: str, ignore_error: Literal[True]) -> Optional[subprocess.CompletedProcess]:
+def run_command(
+    command: str, *args: str, ignore_error: Literal[True], cwd: Optional[Path] = ...
+) -> Optional[subprocess.CompletedProcess]:
     ...
 
 
 @overload
-def run_command(command: str, *args: str, ignore_error: Literal[False] = ...) -> subprocess.CompletedProcess:
+def run_command(
+    command: str, *args: str, ignore_error: Literal[False] = ..., cwd: Optional[Path] = ...
+) -> subprocess.CompletedProcess:
     ...
 
 
-def run_command(command: str, *args: str, ignore_error: bool = False) -> Optional[subprocess.CompletedProcess]:
-    """Runs the provided command in a subprocess."""
+def run_command(
+    command: str, *args: str, ignore_error: bool = False, cwd: Optional[Path] = None
+) -> Optional[subprocess.CompletedProcess]:
+    """Runs the provided command in a subprocess, within cwd if provided rather than the current directory."""
     try:
-        process = subprocess.run([command, *args], check=True, capture_output=True, text=True)
+        process = subprocess.run([command, *args], check=True, capture_output=True, text=True, cwd=cwd)
         return process
     except subprocess.CalledProcessError as error:
         if ignore_error:
@@ -64,26 +94,26 @@ git: partial[subprocess.CompletedProcess] = partial(run_command, "git")
 uv: partial[subprocess.CompletedProcess] = partial(run_command, "uv")
 
 
-def require_clean_and_up_to_date_repo() -> None:
+def require_clean_and_up_to_date_repo(cwd: Optional[Path] = None) -> None:
     """Checks if the repo is clean and up to date with any important branches."""
-    git("fetch")
-    git("status", "--porcelain")
-    if not is_branch_synced_with_remote("develop"):
+    git("fetch", cwd=cwd)
+    git("status", "--porcelain", cwd=cwd)
+    if not is_branch_synced_with_remote("develop", cwd=cwd):
         raise ValueError("develop is not synced with origin/develop")
-    if not is_branch_synced_with_remote("main"):
+    if not is_branch_synced_with_remote("main", cwd=cwd):
         raise ValueError("main is not synced with origin/main")
-    if not is_ancestor("main", "develop"):
+    if not is_ancestor("main", "develop", cwd=cwd):
         raise ValueError("main is not an ancestor of develop")
 
 
-def is_branch_synced_with_remote(branch: str) -> bool:
+def is_branch_synced_with_remote(branch: str, cwd: Optional[Path] = None) -> bool:
     """Checks if the branch is synced with its remote."""
-    return is_ancestor(branch, f"origin/{branch}") and is_ancestor(f"origin/{branch}", branch)
+    return is_ancestor(branch, f"origin/{branch}", cwd=cwd) and is_ancestor(f"origin/{branch}", branch, cwd=cwd)
 
 
-def is_ancestor(ancestor: str, descendent: str) -> bool:
+def is_ancestor(ancestor: str, descendent: str, cwd: Optional[Path] = None) -> bool:
     """Checks if the branch is synced with its remote."""
-    return git("merge-base", "--is-ancestor", ancestor, descendent).returncode == 0
+    return git("merge-base", "--is-ancestor", ancestor, descendent, cwd=cwd).returncode == 0
 
 
 @contextmanager
@@ -110,19 +140,47 @@ def generate_demo(
     no_cache: bool,
     **kwargs: Any
 ) -> Path:
-    """Generates a demo project and returns its root path."""
+    """Generates a demo project and returns its root path.
+
+    Like cruft.create, the demo is rendered from the template as committed at HEAD, checked out into a temporary
+    worktree, and HEAD is recorded in its .cruft.json. Rendering goes through TemplateRenderer, so compiled templates
+    are reused from the bytecode cache.
+    """
     demo_name: str = get_demo_name(add_rust_extension=add_rust_extension)
     demos_cache_folder.mkdir(exist_ok=True)
     if no_cache:
         _remove_existing_demo(demo_path=demos_cache_folder / demo_name)
-    cruft.create(
-        template_git_url=str(REPO_FOLDER),
-        output_dir=demos_cache_folder,
-        extra_context={"project_name": demo_name, "add_rust_extension": add_rust_extension, **kwargs},
-        no_input=True,
-        overwrite_if_exists=True
-    )
-    return demos_cache_folder / demo_name
+
+    commit: str = git("-C", str(REPO_FOLDER), "rev-parse", "HEAD").stdout.strip()
+    with tempfile.TemporaryDirectory() as temp_folder:
+        worktree_path: Path = Path(temp_folder, "template")
+        with template_worktree(REPO_FOLDER, commit, worktree_path) as template_folder:
+            renderer: TemplateRenderer = TemplateRenderer(repo_folder=template_folder)
+            context: dict[str, Any] = renderer.get_cruft_context(
+                commit=commit,
+                extra_context={"project_name": demo_name, "add_rust_extension": add_rust_extension, **kwargs},
+                template=str(REPO_FOLDER),
+            )
+            demo_path: Path = renderer.write_project(output_dir=demos_cache_folder, context=context)
+    cruft_state: dict[str, Any] = {
+        "template": str(REPO_FOLDER),
+        "commit": commit,
+        "checkout": None,
+        "context": context,
+        "directory": None,
+    }
+    (demo_path / ".cruft.json").write_text(dump_cruft_state(cruft_state))
+    return demo_path
+
+
+@contextmanager
+def template_worktree(template_folder: Path, commit: str, path: Path) -> Generator[Path, None, None]:
+    """Checks out a template commit into a temporary git worktree, removing it afterwards."""
+    git("-C", str(template_folder), "worktree", "add", "--detach", str(path), commit)
+    try:
+        yield path
+    finally:
+        git("-C", str(template_folder), "worktree", "remove", "--force", str(path))
 
 
 def _remove_existing_demo(demo_path: Path) -> None:
@@ -142,6 +200,38 @@ def _remove_existing_demo(demo_path: Path) -> None:
         shutil.rmtree(demo_path, onerror=remove_readonly)
 
 
+def remove_existing_demos(demos_cache_folder: Path, variants: list[bool]) -> None:
+    """Removes the existing demo of each variant, asking for any confirmation before the variants are run concurrently."""
+    for variant in variants:
+        _remove_existing_demo(demo_path=demos_cache_folder / get_demo_name(add_rust_extension=variant))
+
+
+def get_demo_variants(add_rust_extension: bool, all_variants: bool) -> list[bool]:
+    """Returns the add_rust_extension value of each demo variant requested."""
+    return [False, True] if all_variants else [add_rust_extension]
+
+
+def run_for_demo_variants(function: Callable[[bool], T], variants: list[bool]) -> dict[bool, T]:
+    """Runs the function for each demo variant concurrently, returning the results of the variants that succeeded.
+
+    A variant failing with one of DEMO_VARIANT_ERRORS is reported as soon as it fails without interrupting the others,
+    while any other exception is raised once every variant has finished. Since the working directory is shared by
+    every thread, the function must pass cwd to anything it runs rather than changing directories, and hold CRUFT_LOCK
+    around cruft or cookiecutter calls that change it themselves. Nothing may prompt from within the function, so
+    anything needing confirmation has to be done before the variants are run.
+    """
+    results: dict[bool, T] = {}
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        futures: dict[Future, bool] = {executor.submit(function, variant): variant for variant in variants}
+        for future in as_completed(futures):
+            variant: bool = futures[future]
+            try:
+                results[variant] = future.result()
+            except DEMO_VARIANT_ERRORS as error:
+                typer.secho(f"error: {get_demo_name(add_rust_extension=variant)}: {error}", fg="red")
+    return results
+
+
 def get_demo_name(add_rust_extension: bool) -> str:
     name_modifier: str = "maturin" if add_rust_extension else "python"
     return f"robust-{name_modifier}-demo"
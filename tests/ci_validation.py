@@ -0,0 +1,399 @@
+"""Module containing a validation engine for the CI configuration rendered by the template.
+
+Only the CI configuration files and the noxfile are rendered for each context. Parsed YAML and noxfiles are cached by
+a hash of their rendered content, so contexts that render identical files share the work of parsing and summarizing
+them. Besides parsing, each file is checked against a handful of structural rules, the most important being that
+every nox session and tag referenced by a CI job exists in the rendered noxfile.
+"""
+
+import ast
+import fnmatch
+import hashlib
+import re
+import shlex
+from pathlib import PurePosixPath
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+
+import yaml
+
+from scripts.renderer import RenderedProject
+from scripts.renderer import TemplateRenderer
+
+
+CI_FILE_PATTERNS: tuple[str, ...] = (".github/workflows/*.yml", ".gitlab-ci.yml", "bitbucket-pipelines.yml")
+NOXFILE_PATH: str = "noxfile.py"
+
+NOX_COMMAND_PATTERN: re.Pattern = re.compile(r"\bnox\s+(?P<args>[^;&|\n]*)")
+GITHUB_EXPRESSION_PATTERN: re.Pattern = re.compile(r"\$\{\{\s*(?P<expression>.+?)\s*\}\}")
+SHELL_VARIABLE_PATTERN: re.Pattern = re.compile(
+    r"\$\{(?P<name>\w+)(?://(?P<pattern>[^/}]*)(?:/(?P<replacement>[^}]*))?)?\}|\$(?P<bare>\w+)"
+)
+SESSION_OPTIONS: tuple[str, ...] = ("-s", "-e", "--session", "--sessions")
+TAG_OPTIONS: tuple[str, ...] = ("-t", "--tag", "--tags")
+GITLAB_RESERVED_KEYS: tuple[str, ...] = (
+    "after_script",
+    "before_script",
+    "cache",
+    "default",
+    "image",
+    "include",
+    "services",
+    "stages",
+    "variables",
+    "workflow",
+)
+SAFE_BUILTINS: dict[str, Any] = {"int": int, "len": len, "list": list, "range": range, "str": str}
+
+_YAML_CACHE: dict[str, tuple[Any, Optional[str]]] = {}
+_NOXFILE_CACHE: dict[str, "Noxfile"] = {}
+
+
+class Problem(NamedTuple):
+    """A rule violation found in a rendered CI configuration file."""
+
+    path: str
+    location: str
+    message: str
+
+    def __str__(self) -> str:
+        """Returns the problem formatted for an assertion message."""
+        return f"{self.path}:{self.location}: {self.message}"
+
+
+class Noxfile(NamedTuple):
+    """The session names and tags that a rendered noxfile makes available on the command line."""
+
+    sessions: frozenset[str]
+    tags: frozenset[str]
+
+
+class UniqueKeyLoader(yaml.SafeLoader):
+    """Safe YAML loader that rejects mappings containing the same key more than once."""
+
+    def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> dict[Any, Any]:
+        """Constructs the mapping, raising if any key other than a merge key is repeated."""
+        seen: set[Any] = set()
+        for key_node, _ in node.value:
+            if key_node.tag == "tag:yaml.org,2002:merge":
+                continue
+            key: Any = self.construct_object(key_node, deep=deep)
+            if key in seen:
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping", node.start_mark, f"found duplicate key {key!r}", key_node.start_mark
+                )
+            seen.add(key)
+        return super().construct_mapping(node, deep=deep)
+
+
+def content_hash(text: str) -> str:
+    """Returns the hash used to cache results for a rendered file."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def load_yaml(text: str) -> tuple[Any, Optional[str]]:
+    """Returns the parsed YAML along with the parse error if it couldn't be parsed, caching both by content."""
+    key: str = content_hash(text)
+    if key not in _YAML_CACHE:
+        try:
+            _YAML_CACHE[key] = (yaml.load(text, Loader=UniqueKeyLoader), None)  # noqa: S506
+        except yaml.YAMLError as error:
+            _YAML_CACHE[key] = (None, str(error))
+    return _YAML_CACHE[key]
+
+
+def load_noxfile(text: str) -> Noxfile:
+    """Returns the sessions and tags defined by the noxfile source, caching the result by content."""
+    key: str = content_hash(text)
+    if key not in _NOXFILE_CACHE:
+        _NOXFILE_CACHE[key] = _parse_noxfile(text)
+    return _NOXFILE_CACHE[key]
+
+
+def _parse_noxfile(text: str) -> Noxfile:
+    """Statically summarizes a noxfile without importing it.
+
+    Module level constants are evaluated where they only depend on other constants, which is enough to resolve the
+    python versions and tags that sessions are declared with.
+    """
+    tree: ast.Module = ast.parse(text)
+    constants: dict[str, Any] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets: list[ast.expr] = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        try:
+            value: Any = _evaluate(node.value, constants)
+        except (NameError, AttributeError, TypeError, KeyError, ValueError):
+            # The value depends on more than other constants, such as an import or the environment
+            continue
+        constants.update({target.id: value for target in targets if isinstance(target, ast.Name)})
+
+    sessions: set[str] = set()
+    tags: set[str] = set()
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            if not _is_nox_session(decorator):
+                continue
+            keywords: dict[str, ast.expr] = {keyword.arg: keyword.value for keyword in decorator.keywords}
+            name: str = _evaluate(keywords["name"], constants) if "name" in keywords else node.name
+            python: Any = _evaluate(keywords["python"], constants) if "python" in keywords else None
+            python_versions: list[str] = [python] if isinstance(python, str) else list(python or [])
+            sessions.add(name)
+            sessions.update(f"{name}-{python_version}" for python_version in python_versions)
+            if "tags" in keywords:
+                tags.update(_evaluate(keywords["tags"], constants))
+    return Noxfile(sessions=frozenset(sessions), tags=frozenset(tags))
+
+
+def _evaluate(node: ast.expr, constants: dict[str, Any]) -> Any:
+    """Evaluates an expression from the noxfile using only its constants and a few builtins."""
+    code = compile(ast.Expression(node), filename=NOXFILE_PATH, mode="eval")
+    return eval(code, {"__builtins__": SAFE_BUILTINS, **constants})  # noqa: S307
+
+
+def _is_nox_session(decorator: ast.expr) -> bool:
+    """Checks whether the decorator is a call to nox.session."""
+    if not isinstance(decorator, ast.Call):
+        return False
+    function: ast.expr = decorator.func
+    return isinstance(function, ast.Attribute) and function.attr == "session"
+
+
+def render_ci_files(renderer: TemplateRenderer, extra_context: dict[str, Any]) -> dict[str, str]:
+    """Renders only the CI configuration files and noxfile for the context."""
+    project: RenderedProject = renderer.render_project(renderer.get_context(extra_context=extra_context))
+    paths: list[str] = [path for path in project if is_ci_file(path)]
+    return {path: project.read_text(path) for path in [NOXFILE_PATH, *paths]}
+
+
+def is_ci_file(path: str) -> bool:
+    """Checks whether the relative path is a CI configuration file."""
+    return any(PurePosixPath(path).match(pattern) for pattern in CI_FILE_PATTERNS)
+
+
+def validate_ci(renderer: TemplateRenderer, extra_context: dict[str, Any]) -> list[Problem]:
+    """Renders the CI configuration for the context and returns every problem found in it."""
+    files: dict[str, str] = render_ci_files(renderer=renderer, extra_context=extra_context)
+    noxfile: Noxfile = load_noxfile(files.pop(NOXFILE_PATH))
+    problems: list[Problem] = []
+    for path, text in files.items():
+        problems.extend(validate_ci_file(path=path, text=text, noxfile=noxfile))
+    return problems
+
+
+def validate_ci_file(path: str, text: str, noxfile: Noxfile) -> list[Problem]:
+    """Returns every problem found in a single rendered CI configuration file."""
+    data, error = load_yaml(text)
+    if error is not None:
+        return [Problem(path=path, location="", message=f"invalid YAML: {error}")]
+    if not isinstance(data, dict):
+        return [Problem(path=path, location="", message="expected a mapping at the top level")]
+
+    problems: list[Problem] = []
+    if path.startswith(".github/"):
+        problems.extend(_check_github_workflow(path=path, data=data))
+    elif path == ".gitlab-ci.yml":
+        problems.extend(_check_gitlab_ci(path=path, data=data))
+    else:
+        problems.extend(_check_bitbucket_pipelines(path=path, data=data))
+    problems.extend(_check_nox_references(path=path, node=data, location=[], scopes=[], noxfile=noxfile))
+    return problems
+
+
+def _check_github_workflow(path: str, data: dict[str, Any]) -> list[Problem]:
+    """Checks that a GitHub workflow has jobs that each say where and what to run."""
+    jobs: Any = data.get("jobs")
+    if not isinstance(jobs, dict) or not jobs:
+        return [Problem(path=path, location="jobs", message="workflow has no jobs")]
+    problems: list[Problem] = []
+    for name, job in jobs.items():
+        if "uses" in job:
+            continue
+        if "runs-on" not in job:
+            problems.append(Problem(path=path, location=f"jobs/{name}", message="job has no runs-on"))
+        if not job.get("steps"):
+            problems.append(Problem(path=path, location=f"jobs/{name}", message="job has no steps"))
+    return problems
+
+
+def _check_gitlab_ci(path: str, data: dict[str, Any]) -> list[Problem]:
+    """Checks that every GitLab job belongs to a declared stage and has a script."""
+    stages: list[str] = data.get("stages", [])
+    problems: list[Problem] = []
+    for name, job in data.items():
+        if name.startswith(".") or name in GITLAB_RESERVED_KEYS or not isinstance(job, dict):
+            continue
+        if "stage" in job and job["stage"] not in stages:
+            problems.append(Problem(path=path, location=name, message=f"stage {job['stage']!r} is not declared"))
+        if not any(key in job for key in ("script", "trigger", "extends")):
+            problems.append(Problem(path=path, location=name, message="job has no script"))
+    return problems
+
+
+def _check_bitbucket_pipelines(path: str, data: dict[str, Any]) -> list[Problem]:
+    """Checks that Bitbucket pipelines are defined and that every step has a script."""
+    if not isinstance(data.get("pipelines"), dict):
+        return [Problem(path=path, location="pipelines", message="no pipelines are defined")]
+    problems: list[Problem] = []
+
+    def visit(node: Any, location: list[str]) -> None:
+        if isinstance(node, dict):
+            step: Any = node.get("step")
+            if isinstance(step, dict) and not step.get("script"):
+                problems.append(Problem(path=path, location="/".join(location), message="step has no script"))
+            for key, value in node.items():
+                visit(value, [*location, str(key)])
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                visit(value, [*location, str(index)])
+
+    visit(data["pipelines"], ["pipelines"])
+    return problems
+
+
+def _check_nox_references(
+    path: str, node: Any, location: list[str], scopes: list[dict[str, Any]], noxfile: Noxfile
+) -> list[Problem]:
+    """Checks that every nox session and tag referenced by a string in the file exists in the noxfile.
+
+    Variables are resolved from the matrices and variables of the enclosing mappings. Anything that can't be resolved
+    is treated as a wildcard, so only references that are known not to match anything are reported.
+    """
+    problems: list[Problem] = []
+    if isinstance(node, dict):
+        for key, value in node.items():
+            problems.extend(_check_nox_references(path, value, [*location, str(key)], [node, *scopes], noxfile))
+    elif isinstance(node, list):
+        for index, value in enumerate(node):
+            problems.extend(_check_nox_references(path, value, [*location, str(index)], scopes, noxfile))
+    elif isinstance(node, str):
+        for match in NOX_COMMAND_PATTERN.finditer(node):
+            for command in expand_variables(match.group("args"), lookup=lambda name: _lookup(name, scopes)):
+                sessions, tags = parse_nox_args(command)
+                problems.extend(
+                    Problem(path=path, location="/".join(location), message=f"nox session {session!r} does not exist")
+                    for session in sessions
+                    if not _matches_any(session, noxfile.sessions)
+                )
+                problems.extend(
+                    Problem(path=path, location="/".join(location), message=f"nox tag {tag!r} does not exist")
+                    for tag in tags
+                    if not _matches_any(tag, noxfile.tags)
+                )
+    return list(dict.fromkeys(problems))
+
+
+def expand_variables(text: str, lookup: Callable[[str], Optional[list[str]]]) -> list[str]:
+    """Returns every expansion of the GitHub expressions and shell variables in the text.
+
+    Expressions are resolved through the lookup, which returns the possible values of a variable or None if they are
+    unknown, in which case the expression is replaced by a wildcard.
+    """
+    expansions: list[str] = [text]
+    for pattern, resolve in ((GITHUB_EXPRESSION_PATTERN, _resolve_github), (SHELL_VARIABLE_PATTERN, _resolve_shell)):
+        expanded: list[str] = []
+        for expansion in expansions:
+            expanded.extend(
+                _expand(expansion, pattern=pattern, resolve=lambda match, resolve=resolve: resolve(match, lookup))
+            )
+        expansions = expanded
+    return list(dict.fromkeys(expansions))
+
+
+def _expand(text: str, pattern: re.Pattern, resolve: Callable[[re.Match], list[str]], start: int = 0) -> list[str]:
+    """Returns every substitution of the pattern's matches in the text by their resolved values."""
+    match: Optional[re.Match] = pattern.search(text, start)
+    if match is None:
+        return [text]
+    expansions: list[str] = []
+    for value in resolve(match):
+        substituted: str = text[: match.start()] + value + text[match.end() :]
+        expansions.extend(_expand(substituted, pattern=pattern, resolve=resolve, start=match.start() + len(value)))
+    return expansions
+
+
+def _resolve_github(match: re.Match, lookup: Callable[[str], Optional[list[str]]]) -> list[str]:
+    """Returns the possible values of a GitHub expression, which are only known for matrix values."""
+    expression: str = match.group("expression")
+    if expression.startswith("matrix."):
+        return lookup(expression) or ["*"]
+    return ["*"]
+
+
+def _resolve_shell(match: re.Match, lookup: Callable[[str], Optional[list[str]]]) -> list[str]:
+    """Returns the possible values of a shell variable, applying any ${NAME//pattern/replacement} substitution."""
+    name: str = match.group("name") or match.group("bare")
+    values: Optional[list[str]] = lookup(name)
+    if values is None:
+        return ["*"]
+    if match.group("pattern") is not None:
+        values = [value.replace(match.group("pattern"), match.group("replacement") or "") for value in values]
+    return values
+
+
+def _lookup(name: str, scopes: list[dict[str, Any]]) -> Optional[list[str]]:
+    """Returns the possible values of a variable from the innermost mapping that defines it."""
+    for scope in scopes:
+        values: Optional[list[str]] = _get_scope_values(name, scope)
+        if values is not None:
+            return values
+    return None
+
+
+def _get_scope_values(name: str, scope: dict[str, Any]) -> Optional[list[str]]:
+    """Returns the possible values a single mapping gives a variable through its matrix or variables, if any."""
+    if name.startswith("matrix."):
+        matrix: Any = scope.get("strategy", {}).get("matrix") if isinstance(scope.get("strategy"), dict) else None
+        if not isinstance(matrix, dict):
+            return None
+        key: str = name.removeprefix("matrix.")
+        values: list[Any] = list(matrix.get(key, [])) if isinstance(matrix.get(key), list) else []
+        values.extend(entry[key] for entry in matrix.get("include", []) if key in entry)
+        return [str(value) for value in dict.fromkeys(values)] or None
+
+    parallel: Any = scope.get("parallel")
+    if isinstance(parallel, dict):
+        values = []
+        for entry in parallel.get("matrix", []):
+            value: Any = entry.get(name)
+            values.extend(value if isinstance(value, list) else [] if value is None else [value])
+        if values:
+            return [str(value) for value in dict.fromkeys(values)]
+    variables: Any = scope.get("variables")
+    if isinstance(variables, dict) and name in variables:
+        return [str(variables[name])]
+    return None
+
+
+def parse_nox_args(command: str) -> tuple[list[str], list[str]]:
+    """Returns the sessions and tags selected by the arguments of a nox command."""
+    sessions: list[str] = []
+    tags: list[str] = []
+    selected: Optional[list[str]] = None
+    for arg in shlex.split(command):
+        if arg == "--":
+            break
+        if arg in SESSION_OPTIONS:
+            selected = sessions
+        elif arg in TAG_OPTIONS:
+            selected = tags
+        elif arg.startswith("-"):
+            selected = None
+        elif selected is not None:
+            selected.append(arg)
+    return sessions, tags
+
+
+def _matches_any(reference: str, names: frozenset[str]) -> bool:
+    """Checks whether a possibly wildcarded reference matches any of the names."""
+    if any(character in reference for character in "*?["):
+        return any(fnmatch.fnmatchcase(name, reference) for name in names)
+    return reference in names
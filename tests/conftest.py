@@ -1,8 +1,10 @@
 """Fixtures used in all tests for cookiecutter-robust-python."""
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Any
+from typing import Generator
 from typing import Literal
 
 import pytest
@@ -10,9 +12,14 @@ import toml
 import yaml
 from _pytest.fixtures import FixtureRequest
 from _pytest.tmpdir import TempPathFactory
-from cookiecutter.main import cookiecutter
 
-from tests.constants import REPO_FOLDER
+from scripts.renderer import RenderedProject
+from scripts.renderer import TemplateRenderer
+from tests.constants import CARGO_TARGET_FOLDER
+from tests.constants import WHEELHOUSE_FOLDER
+from tests.simple_index import build_simple_index
+from tests.simple_index import prefetch_wheelhouse
+from tests.simple_index import serve_simple_index
 
 
 pytest_plugins: list[str] = ["pytester"]
@@ -24,6 +31,44 @@ def demos_folder(tmp_path_factory: TempPathFactory) -> Path:
     return tmp_path_factory.mktemp("demos")
 
 
+@pytest.fixture(scope="session")
+def local_index_url(tmp_path_factory: TempPathFactory) -> Generator[str, None, None]:
+    """Url of a local simple index serving the prefetched wheelhouse.
+
+    The wheelhouse is prefetched the first time it's needed, which requires network access. Every later run is served
+    from it without any.
+    """
+    if not any(WHEELHOUSE_FOLDER.glob("*.whl")):
+        try:
+            prefetch_wheelhouse(wheelhouse=WHEELHOUSE_FOLDER, demos_folder=tmp_path_factory.mktemp("prefetch"))
+        except subprocess.CalledProcessError as error:
+            pytest.fail(
+                f"Failed to prefetch the wheelhouse at {WHEELHOUSE_FOLDER}, which needs network access the first time "
+                f"the tests are run: {error}\n{error.stdout}{error.stderr}",
+                pytrace=False,
+            )
+
+    index_folder: Path = tmp_path_factory.mktemp("simple-index")
+    build_simple_index(wheelhouse=WHEELHOUSE_FOLDER, index_folder=index_folder)
+    with serve_simple_index(index_folder=index_folder) as url:
+        yield url
+
+
+@pytest.fixture(scope="session")
+def robust_env(local_index_url: str) -> dict[str, str]:
+    """Environment for commands run in demos, pointing every uv and pip invocation at the local index.
+
+    Every demo also shares one cargo target dir, so the Rust extension's dependencies are only compiled once.
+    """
+    return {
+        "CARGO_TARGET_DIR": str(CARGO_TARGET_FOLDER),
+        **os.environ,
+        "UV_DEFAULT_INDEX": local_index_url,
+        "PIP_INDEX_URL": local_index_url,
+        "UV_PYTHON_DOWNLOADS": "never",
+    }
+
+
 @pytest.fixture(scope="session")
 def robust_yaml(request: FixtureRequest, robust_file: str) -> dict[str, Any]:
     return getattr(request, "param", yaml.safe_load(robust_file))
@@ -35,9 +80,12 @@ def robust_toml(request: FixtureRequest, robust_file: str) -> dict[str, Any]:
 
 
 @pytest.fixture(scope="session")
-def robust_file(request: FixtureRequest, robust_file__path: Path) -> str:
-    text: str = robust_file__path.read_text()
-    return getattr(request, "param", text)
+def robust_file(request: FixtureRequest, robust_project: RenderedProject, robust_file__path__relative: str) -> str:
+    if hasattr(request, "param"):
+        return request.param
+    if robust_file__path__relative not in robust_project:
+        pytest.skip(f"{robust_file__path__relative} is removed by the post gen hook for this variant.")
+    return robust_project.read_text(robust_file__path__relative)
 
 
 @pytest.fixture(scope="session")
@@ -50,23 +98,34 @@ def robust_file__path__relative(request: FixtureRequest) -> str:
     return getattr(request, "param", "./pyproject.toml")
 
 
+@pytest.fixture(scope="session")
+def template_renderer() -> TemplateRenderer:
+    """Renderer that loads and compiles the template once for every test."""
+    return TemplateRenderer()
+
+
+@pytest.fixture(scope="session")
+def robust_project(
+    template_renderer: TemplateRenderer, robust_demo__extra_context: dict[str, Any]
+) -> RenderedProject:
+    """The demo project rendered in memory, without touching the disk or running any setup."""
+    return template_renderer.render_project(template_renderer.get_context(extra_context=robust_demo__extra_context))
+
+
 @pytest.fixture(scope="session")
 def robust_demo(
+    request: FixtureRequest,
     demos_folder: Path,
     robust_demo__path: Path,
     robust_demo__extra_context: dict[str, Any],
-    robust_demo__is_setup: bool
+    robust_demo__is_setup: bool,
+    template_renderer: TemplateRenderer
 ) -> Path:
-    cookiecutter(
-        str(REPO_FOLDER),
-        no_input=True,
-        overwrite_if_exists=True,
-        output_dir=demos_folder,
-        extra_context=robust_demo__extra_context,
-    )
+    template_renderer.render(output_dir=demos_folder, extra_context=robust_demo__extra_context)
     if robust_demo__is_setup:
-        subprocess.run(["nox", "-s", "setup-git"], cwd=robust_demo__path, capture_output=True)
-        subprocess.run(["nox", "-s", "setup-venv"], cwd=robust_demo__path, capture_output=True)
+        robust_env: dict[str, str] = request.getfixturevalue("robust_env")
+        subprocess.run(["nox", "-s", "setup-git"], cwd=robust_demo__path, env=robust_env, capture_output=True)
+        subprocess.run(["nox", "-s", "setup-venv"], cwd=robust_demo__path, env=robust_env, capture_output=True)
     return robust_demo__path
 
 
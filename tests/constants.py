@@ -1,9 +1,12 @@
 """Module containing constants used throughout all tests."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
+import platformdirs
+
 
 REPO_FOLDER: Path = Path(__file__).parent.parent
 COOKIECUTTER_FOLDER: Path = REPO_FOLDER / "{{cookiecutter.project_name}}"
@@ -11,6 +14,17 @@ HOOKS_FOLDER: Path = REPO_FOLDER / "hooks"
 SCRIPTS_FOLDER: Path = REPO_FOLDER / "scripts"
 GITHUB_ACTIONS_FOLDER: Path = COOKIECUTTER_FOLDER / ".github"
 
+CACHE_FOLDER: Path = Path(
+    platformdirs.user_cache_path(appname="cookiecutter-robust-python", appauthor="56kyle")
+).resolve()
+WHEELHOUSE_FOLDER: Path = Path(
+    os.getenv("COOKIECUTTER_ROBUST_PYTHON_WHEELHOUSE", default=CACHE_FOLDER / "wheelhouse")
+).resolve()
+
+CARGO_TARGET_FOLDER: Path = Path(
+    os.getenv("COOKIECUTTER_ROBUST_PYTHON_CARGO_TARGET_DIR", default=CACHE_FOLDER / "cargo-target")
+).resolve()
+
 COOKIECUTTER_JSON_PATH: Path = REPO_FOLDER / "cookiecutter.json"
 COOKIECUTTER_JSON: dict[str, Any] = json.loads(COOKIECUTTER_JSON_PATH.read_text())
 
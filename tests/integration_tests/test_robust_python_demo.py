@@ -1,5 +1,6 @@
 """Tests project generation and template functionality using a Python build backend."""
 
+import re
 import subprocess
 from pathlib import Path
 
@@ -9,12 +10,13 @@ from tests.constants import IDEMPOTENT_NOX_SESSIONS
 
 
 @pytest.mark.parametrize("session", IDEMPOTENT_NOX_SESSIONS)
-def test_demo_project_nox_session(robust_demo: Path, session: str) -> None:
+def test_demo_project_nox_session(robust_demo: Path, robust_env: dict[str, str], session: str) -> None:
     command: list[str] = ["nox", "-s", session]
     try:
         subprocess.run(
             command,
             cwd=robust_demo,
+            env=robust_env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
@@ -28,11 +30,12 @@ def test_demo_project_nox_session(robust_demo: Path, session: str) -> None:
         )
 
 
-def test_demo_project_nox_pre_commit(robust_demo: Path) -> None:
+def test_demo_project_nox_pre_commit(robust_demo: Path, robust_env: dict[str, str]) -> None:
     command: list[str] = ["nox", "-s", "pre-commit"]
     result: subprocess.CompletedProcess = subprocess.run(
         command,
         cwd=robust_demo,
+        env=robust_env,
         capture_output=True,
         text=True,
         timeout=20.0
@@ -42,7 +45,7 @@ def test_demo_project_nox_pre_commit(robust_demo: Path) -> None:
 
 @pytest.mark.parametrize(argnames="robust_demo__add_rust_extension", argvalues=[True, False], indirect=True)
 @pytest.mark.parametrize(argnames="robust_demo__is_setup", argvalues=[False], indirect=True)
-def test_demo_project_nox_pre_commit_with_install(robust_demo: Path) -> None:
+def test_demo_project_nox_pre_commit_with_install(robust_demo: Path, robust_env: dict[str, str]) -> None:
     command: list[str] = ["nox", "-s", "pre-commit", "--", "install"]
     pre_commit_hook_path: Path = robust_demo / ".git" / "hooks" / "pre-commit"
     assert not pre_commit_hook_path.exists()
@@ -50,6 +53,7 @@ def test_demo_project_nox_pre_commit_with_install(robust_demo: Path) -> None:
     result: subprocess.CompletedProcess = subprocess.run(
         command,
         cwd=robust_demo,
+        env=robust_env,
         capture_output=True,
         text=True,
         timeout=20.0
@@ -58,3 +62,32 @@ def test_demo_project_nox_pre_commit_with_install(robust_demo: Path) -> None:
     assert pre_commit_hook_path.is_file()
 
     assert result.returncode == 0
+
+
+def test_demo_project_nox_pre_commit_changed_fails_only_the_modifying_hook(
+    robust_demo: Path, robust_env: dict[str, str]
+) -> None:
+    staged_files: dict[str, str] = {
+        "badly_formatted.py": '"""Module that ruff format rewrites."""\n\nvalue=[1,2 ,3]\n',
+        "settings.yaml": "key: value\n",
+    }
+    for relative_path, content in staged_files.items():
+        (robust_demo / relative_path).write_text(content)
+    subprocess.run(["git", "add", *staged_files], cwd=robust_demo, check=True)
+    try:
+        result: subprocess.CompletedProcess = subprocess.run(
+            ["nox", "-s", "pre-commit-changed", "--", "--staged"],
+            cwd=robust_demo,
+            env=robust_env,
+            capture_output=True,
+            text=True
+        )
+    finally:
+        subprocess.run(["git", "rm", "--cached", "-q", *staged_files], cwd=robust_demo, check=True)
+        for relative_path in staged_files:
+            (robust_demo / relative_path).unlink()
+
+    failed_hooks: list[str] = re.findall(r"^(.+?)\.+Failed$", result.stdout, flags=re.MULTILINE)
+    assert result.returncode != 0
+    assert failed_hooks == ["Ruff Format"], result.stdout
+    assert "Check Yaml" in result.stdout
@@ -0,0 +1,125 @@
+"""Module containing a local PEP 503 simple index that stands in for PyPI during tests, and the wheelhouse it serves."""
+
+import html
+import os
+import re
+import shutil
+import subprocess
+import threading
+from contextlib import contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from typing import Generator
+
+from cookiecutter.main import cookiecutter
+
+from tests.constants import REPO_FOLDER
+
+
+CANONICALIZE_PATTERN: re.Pattern = re.compile(r"[-_.]+")
+SDIST_SUFFIXES: tuple[str, ...] = (".tar.gz", ".zip")
+
+PAGE_TEMPLATE: str = """<!DOCTYPE html>
+<html>
+  <body>
+{links}
+  </body>
+</html>
+"""
+LINK_TEMPLATE: str = '    <a href="{href}">{text}</a><br/>'
+
+
+def canonicalize_name(name: str) -> str:
+    """Normalizes a project name as described by PEP 503."""
+    return CANONICALIZE_PATTERN.sub("-", name).lower()
+
+
+def get_distribution_name(filename: str) -> str:
+    """Returns the canonical project name of a wheel or sdist filename."""
+    if filename.endswith(".whl"):
+        return canonicalize_name(filename.split("-")[0])
+    for suffix in SDIST_SUFFIXES:
+        if filename.endswith(suffix):
+            return canonicalize_name(filename[: -len(suffix)].rsplit("-", 1)[0])
+    raise ValueError(f"{filename=} is not a wheel or sdist.")
+
+
+def prefetch_wheelhouse(wheelhouse: Path, demos_folder: Path) -> None:
+    """Fills the wheelhouse with the locked dependencies of every demo variant, using each demo's prefetch session.
+
+    Requires network access, so it's only run when the wheelhouse is empty.
+
+    Raises:
+        subprocess.CalledProcessError: If a demo's nox session fails, with its output captured.
+    """
+    wheelhouse.mkdir(parents=True, exist_ok=True)
+    for add_rust_extension in (False, True):
+        demo_name: str = f"robust-prefetch-{'maturin' if add_rust_extension else 'python'}"
+        cookiecutter(
+            str(REPO_FOLDER),
+            no_input=True,
+            overwrite_if_exists=True,
+            output_dir=str(demos_folder),
+            extra_context={"project_name": demo_name, "add_rust_extension": add_rust_extension},
+        )
+        env: dict[str, str] = {**os.environ, f"{demo_name.replace('-', '_').upper()}__WHEELHOUSE": str(wheelhouse)}
+        for session in ("setup-venv", "prefetch"):
+            subprocess.run(
+                ["nox", "-s", session], cwd=demos_folder / demo_name, env=env, capture_output=True, text=True, check=True
+            )
+
+
+def build_simple_index(wheelhouse: Path, index_folder: Path) -> dict[str, list[str]]:
+    """Writes a simple index for every distribution in the wheelhouse and returns the files found per project.
+
+    The index is written to index_folder/simple, with the distributions themselves exposed under index_folder/files.
+    """
+    projects: dict[str, list[str]] = {}
+    for path in sorted(wheelhouse.iterdir()):
+        if path.name.endswith((".whl", *SDIST_SUFFIXES)):
+            projects.setdefault(get_distribution_name(path.name), []).append(path.name)
+
+    files_folder: Path = index_folder / "files"
+    try:
+        files_folder.symlink_to(wheelhouse.resolve(), target_is_directory=True)
+    except OSError:
+        shutil.copytree(wheelhouse, files_folder)
+
+    simple_folder: Path = index_folder / "simple"
+    simple_folder.mkdir(parents=True, exist_ok=True)
+    _write_page(simple_folder / "index.html", {f"{project}/": project for project in projects})
+    for project, filenames in projects.items():
+        project_folder: Path = simple_folder / project
+        project_folder.mkdir(exist_ok=True)
+        _write_page(project_folder / "index.html", {f"../../files/{name}": name for name in filenames})
+    return projects
+
+
+def _write_page(path: Path, links: dict[str, str]) -> None:
+    """Writes a simple index html page containing the provided href to text links."""
+    lines: list[str] = [LINK_TEMPLATE.format(href=html.escape(href), text=html.escape(text)) for href, text in links.items()]
+    path.write_text(PAGE_TEMPLATE.format(links="\n".join(lines)))
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Request handler that doesn't log every request to stderr."""
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Silences request logging."""
+
+
+@contextmanager
+def serve_simple_index(index_folder: Path) -> Generator[str, None, None]:
+    """Serves the index folder over http on an ephemeral localhost port, yielding the simple index url."""
+    handler: partial[_QuietHandler] = partial(_QuietHandler, directory=str(index_folder))
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/simple/"
+    finally:
+        server.shutdown()
+        server.server_close()
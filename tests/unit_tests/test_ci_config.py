@@ -0,0 +1,103 @@
+import itertools
+from typing import Any
+
+import pytest
+
+from scripts.renderer import TemplateRenderer
+from tests.ci_validation import Noxfile
+from tests.ci_validation import Problem
+from tests.ci_validation import expand_variables
+from tests.ci_validation import parse_nox_args
+from tests.ci_validation import validate_ci
+from tests.ci_validation import validate_ci_file
+
+
+PROVIDERS: list[str] = ["github", "gitlab", "bitbucket"]
+RUST_OPTIONS: list[bool] = [False, True]
+PYTHON_RANGES: list[tuple[str, str]] = [("3.9", "3.13"), ("3.10", "3.13"), ("3.9", "3.11")]
+
+NOXFILE: Noxfile = Noxfile(
+    sessions=frozenset({"tests-python", "tests-python-3.12", "tests-python-3.13", "lint-python"}),
+    tags=frozenset({"lint"}),
+)
+
+
+@pytest.fixture(scope="module")
+def renderer() -> TemplateRenderer:
+    return TemplateRenderer()
+
+
+@pytest.mark.parametrize(
+    argnames=("repository_provider", "add_rust_extension", "python_range"),
+    argvalues=list(itertools.product(PROVIDERS, RUST_OPTIONS, PYTHON_RANGES)),
+)
+def test_ci_config_is_valid(
+    renderer: TemplateRenderer, repository_provider: str, add_rust_extension: bool, python_range: tuple[str, str]
+) -> None:
+    extra_context: dict[str, Any] = {
+        "repository_provider": repository_provider,
+        "add_rust_extension": add_rust_extension,
+        "min_python_version": python_range[0],
+        "max_python_version": python_range[1],
+    }
+    problems: list[Problem] = validate_ci(renderer=renderer, extra_context=extra_context)
+    assert not problems, "\n".join(str(problem) for problem in problems)
+
+
+def test_duplicate_keys_are_reported() -> None:
+    text: str = "jobs:\n  lint:\n    runs-on: ubuntu-latest\n    runs-on: windows-latest\n    steps: [{run: ls}]\n"
+    problems: list[Problem] = validate_ci_file(path=".github/workflows/lint.yml", text=text, noxfile=NOXFILE)
+    assert len(problems) == 1
+    assert "duplicate key 'runs-on'" in problems[0].message
+
+
+def test_missing_github_matrix_session_is_reported() -> None:
+    text: str = (
+        "jobs:\n"
+        "  tests:\n"
+        "    runs-on: ubuntu-latest\n"
+        "    strategy:\n"
+        "      matrix:\n"
+        "        python: ['3.12']\n"
+        "        include: [{python: '3.11'}]\n"
+        "    steps:\n"
+        "      - run: uvx nox -s tests-python-${{ matrix.python }}\n"
+    )
+    problems: list[Problem] = validate_ci_file(path=".github/workflows/tests.yml", text=text, noxfile=NOXFILE)
+    assert [problem.message for problem in problems] == ["nox session 'tests-python-3.11' does not exist"]
+
+
+def test_gitlab_variables_are_resolved() -> None:
+    text: str = (
+        "stages: [test]\n"
+        "tests-python:\n"
+        "  stage: test\n"
+        "  parallel:\n"
+        "    matrix:\n"
+        "      - PYTHON_VERSION: ['3.12', '3.13']\n"
+        "  script:\n"
+        "    - nox -s tests-python-${PYTHON_VERSION} -t lint\n"
+        "lint:\n"
+        "  stage: lint\n"
+        "  script: [nox -t $TAG]\n"
+        "  variables:\n"
+        "    TAG: format\n"
+    )
+    problems: list[Problem] = validate_ci_file(path=".gitlab-ci.yml", text=text, noxfile=NOXFILE)
+    assert sorted(problem.message for problem in problems) == [
+        "nox tag 'format' does not exist",
+        "stage 'lint' is not declared",
+    ]
+
+
+def test_expand_variables() -> None:
+    values: dict[str, list[str]] = {"matrix.python": ["3.12", "3.13"], "VERSION": ["3.12"]}
+    assert expand_variables("-s a-${{ matrix.python }} b-${VERSION//.}", lookup=values.get) == [
+        "-s a-3.12 b-312",
+        "-s a-3.13 b-312",
+    ]
+    assert expand_variables("-s a-${{ github.ref }}-$UNKNOWN", lookup=values.get) == ["-s a-*-*"]
+
+
+def test_parse_nox_args() -> None:
+    assert parse_nox_args("-s a b --no-venv -t c -- d") == (["a", "b"], ["c"])
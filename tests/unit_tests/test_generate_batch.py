@@ -0,0 +1,97 @@
+import io
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Iterator
+
+import pytest
+
+from tests.util import import_script
+
+
+generate_batch: ModuleType = import_script("generate-batch")
+
+
+def _run_batch(lines: list[str], output_dir: Path, workers: int = 2, window: int = 4) -> tuple[int, list[dict[str, Any]]]:
+    """Generates the batch from the JSONL lines, returning the failure count and the results in input order."""
+    contexts_path: Path = output_dir.parent / "contexts.jsonl"
+    contexts_path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    writer: io.StringIO = io.StringIO()
+    with contexts_path.open(encoding="utf-8") as reader:
+        failures: int = generate_batch.generate_batch(
+            reader=reader, writer=writer, output_dir=output_dir, workers=workers, window=window
+        )
+    results: list[dict[str, Any]] = [json.loads(line) for line in writer.getvalue().splitlines()]
+    return failures, sorted(results, key=lambda result: result["line"])
+
+
+def _exit_worker(line_number: int, extra_context: dict[str, Any], output_dir: Path) -> dict[str, Any]:
+    """Stands in for render_context, killing the worker process as a crash would."""
+    os._exit(1)
+
+
+def test_generate_batch_renders_each_context(tmp_path: Path) -> None:
+    lines: list[str] = [json.dumps({"project_name": "batch-one"}), "", json.dumps({"project_name": "batch-two"})]
+    failures, results = _run_batch(lines, output_dir=tmp_path / "out")
+
+    assert failures == 0
+    assert [(result["line"], result["status"]) for result in results] == [(1, "ok"), (3, "ok")]
+    assert [Path(result["path"]).name for result in results] == ["batch-one", "batch-two"]
+    assert (tmp_path / "out" / "batch-two" / "pyproject.toml").is_file()
+
+
+def test_generate_batch_rejects_duplicate_project_names(tmp_path: Path) -> None:
+    lines: list[str] = [
+        json.dumps({"project_name": "batch-one"}),
+        json.dumps({"project_name": "batch-one", "license": "GPL-3.0"}),
+        json.dumps({}),
+        json.dumps({"license": "GPL-3.0"}),
+    ]
+    failures, results = _run_batch(lines, output_dir=tmp_path / "out")
+
+    assert failures == 2
+    assert [result["status"] for result in results] == ["ok", "error", "ok", "error"]
+    assert results[1]["error"] == "Duplicate project_name: 'batch-one'"
+    assert results[3]["error"] == "Duplicate project_name: 'the template default'"
+
+
+def test_generate_batch_reports_invalid_contexts(tmp_path: Path) -> None:
+    failures, results = _run_batch(["{not json", json.dumps(["batch-one"])], output_dir=tmp_path / "out")
+
+    assert failures == 2
+    assert results[0]["error"].startswith("Invalid context: ")
+    assert results[1]["error"] == "Invalid context: expected a JSON object"
+
+
+def test_generate_batch_bounds_contexts_in_flight(tmp_path: Path) -> None:
+    window: int = 2
+    writer: io.StringIO = io.StringIO()
+    results_when_read: list[int] = []
+
+    def read_lines() -> Iterator[str]:
+        for index in range(8):
+            results_when_read.append(len(writer.getvalue().splitlines()))
+            yield json.dumps({"project_name": f"batch-{index}"}) + "\n"
+
+    failures: int = generate_batch.generate_batch(
+        reader=read_lines(), writer=writer, output_dir=tmp_path, workers=1, window=window
+    )
+
+    assert failures == 0
+    assert len(writer.getvalue().splitlines()) == 8
+    for lines_read, results_written in enumerate(results_when_read):
+        assert lines_read - results_written <= window
+
+
+def test_generate_batch_reports_dead_workers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(generate_batch, "render_context", _exit_worker)
+    failures, results = _run_batch(
+        [json.dumps({"project_name": "batch-one"}), json.dumps({"project_name": "batch-two"})],
+        output_dir=tmp_path / "out",
+        workers=1,
+    )
+
+    assert failures == 2
+    assert all(result["error"].startswith("Worker process died: ") for result in results)
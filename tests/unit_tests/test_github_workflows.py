@@ -2,7 +2,6 @@ from functools import partial
 from typing import Any
 
 import pytest
-
 from util import templates_matching
 
 
@@ -1,6 +1,12 @@
+import json
 from pathlib import Path
+from typing import Any
 
 import pytest
+from cookiecutter.main import cookiecutter
+
+from scripts.renderer import RenderedProject
+from tests.constants import REPO_FOLDER
 
 
 @pytest.mark.parametrize(
@@ -12,9 +18,8 @@ import pytest
     argvalues=["github"],
     indirect=True
 )
-def test_files_removed_for_github(robust_demo: Path, removed_relative_path: str) -> None:
-    path: Path = robust_demo / removed_relative_path
-    assert not path.exists()
+def test_files_removed_for_github(robust_project: RenderedProject, removed_relative_path: str) -> None:
+    assert not robust_project.exists(removed_relative_path)
 
 
 @pytest.mark.parametrize(
@@ -26,9 +31,8 @@ def test_files_removed_for_github(robust_demo: Path, removed_relative_path: str)
     argvalues=["gitlab"],
     indirect=True
 )
-def test_files_removed_for_gitlab(robust_demo: Path, removed_relative_path: str) -> None:
-    path: Path = robust_demo / removed_relative_path
-    assert not path.exists()
+def test_files_removed_for_gitlab(robust_project: RenderedProject, removed_relative_path: str) -> None:
+    assert not robust_project.exists(removed_relative_path)
 
 
 @pytest.mark.parametrize(
@@ -40,9 +44,8 @@ def test_files_removed_for_gitlab(robust_demo: Path, removed_relative_path: str)
     argvalues=["bitbucket"],
     indirect=True
 )
-def test_files_removed_for_bitbucket(robust_demo: Path, removed_relative_path: str) -> None:
-    path: Path = robust_demo / removed_relative_path
-    assert not path.exists()
+def test_files_removed_for_bitbucket(robust_project: RenderedProject, removed_relative_path: str) -> None:
+    assert not robust_project.exists(removed_relative_path)
 
 
 @pytest.mark.parametrize(
@@ -65,6 +68,32 @@ def test_files_removed_for_bitbucket(robust_demo: Path, removed_relative_path: s
     argvalues=["github"],
     indirect=True,
 )
-def test_files_removed_for_no_rust_extension(robust_demo: Path, removed_relative_path: str) -> None:
-    path: Path = robust_demo / removed_relative_path
-    assert not path.exists()
+def test_files_removed_for_no_rust_extension(robust_project: RenderedProject, removed_relative_path: str) -> None:
+    assert not robust_project.exists(removed_relative_path)
+
+
+@pytest.mark.parametrize(
+    argnames="robust_demo__add_rust_extension",
+    argvalues=[False, True],
+    indirect=True,
+    ids=["no-rust", "rust"]
+)
+@pytest.mark.parametrize(
+    argnames="robust_demo__repository_provider",
+    argvalues=["github", "gitlab", "bitbucket"],
+    indirect=True
+)
+def test_post_gen_hook_matches_rendered_project(
+    tmp_path: Path, robust_project: RenderedProject, robust_demo__extra_context: dict[str, Any]
+) -> None:
+    """Cookiecutter running the real hook leaves exactly the files the renderer's in-process copy of it keeps."""
+    project_folder: Path = Path(
+        cookiecutter(
+            str(REPO_FOLDER), no_input=True, extra_context=robust_demo__extra_context, output_dir=str(tmp_path)
+        )
+    )
+    files: set[str] = {path.relative_to(project_folder).as_posix() for path in project_folder.rglob("*") if path.is_file()}
+    assert files == set(robust_project)
+
+    cookiecutter_json: str = (project_folder / ".cookiecutter.json").read_text()
+    assert cookiecutter_json == json.dumps(json.loads(cookiecutter_json), sort_keys=True, indent=2) + "\n"
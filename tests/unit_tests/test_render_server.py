@@ -0,0 +1,66 @@
+import base64
+import io
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from scripts.renderer import TemplateRenderer
+from tests.util import import_script
+
+
+render_server: ModuleType = import_script("render-server")
+
+
+def _serve_lines(renderer: TemplateRenderer, lines: list[str]) -> list[dict[str, Any]]:
+    """Serves the request lines through an in-memory stream and returns the parsed responses."""
+    reader: io.StringIO = io.StringIO("".join(f"{line}\n" for line in lines))
+    writer: io.StringIO = io.StringIO()
+    render_server.serve_stream(renderer=renderer, reader=reader, writer=writer)
+    return [json.loads(line) for line in writer.getvalue().splitlines()]
+
+
+def test_serve_stream_returns_rendered_files(template_renderer: TemplateRenderer) -> None:
+    request: dict[str, Any] = {"id": 1, "extra_context": {"project_name": "served-demo"}}
+    (response,) = _serve_lines(template_renderer, [json.dumps(request)])
+
+    assert response["id"] == 1
+    assert response["status"] == "ok"
+    assert response["seconds"] >= 0
+    assert response["files"]["pyproject.toml"]["encoding"] == "utf-8"
+    assert 'name = "served-demo"' in response["files"]["pyproject.toml"]["content"]
+
+
+def test_serve_stream_writes_to_output_dir(template_renderer: TemplateRenderer, tmp_path: Path) -> None:
+    request: dict[str, Any] = {"id": "disk", "extra_context": {"project_name": "served-demo"}, "output_dir": str(tmp_path)}
+    (response,) = _serve_lines(template_renderer, [json.dumps(request)])
+
+    assert response["status"] == "ok"
+    assert response["path"] == str(tmp_path / "served-demo")
+    assert "files" not in response
+    assert (tmp_path / "served-demo" / "pyproject.toml").is_file()
+
+
+def test_serve_stream_reports_errors_with_their_timing(template_renderer: TemplateRenderer) -> None:
+    request: dict[str, Any] = {"id": 2, "extra_context": {"license": "not-a-license"}}
+    invalid, failed = _serve_lines(template_renderer, ["{not json", "", json.dumps(request)])
+
+    assert invalid["id"] is None
+    assert invalid["status"] == "error"
+    assert invalid["error"].startswith("Invalid request: ")
+    assert failed["id"] == 2
+    assert failed["status"] == "error"
+    assert "not-a-license" in failed["error"]
+    assert set(invalid) == set(failed) == {"id", "status", "error", "seconds"}
+
+
+def test_encode_file_returns_text_as_is() -> None:
+    assert render_server.encode_file("café\n".encode()) == {"encoding": "utf-8", "content": "café\n"}
+
+
+def test_encode_file_returns_binary_as_base64() -> None:
+    content: bytes = b"\x89PNG\r\n\x1a\n\xff\xfe"
+    encoded: dict[str, str] = render_server.encode_file(content)
+
+    assert encoded["encoding"] == "base64"
+    assert base64.b64decode(encoded["content"]) == content
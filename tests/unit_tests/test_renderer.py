@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cookiecutter.main import cookiecutter
+
+from scripts.renderer import ProfileEvent
+from scripts.renderer import RenderedProject
+from scripts.renderer import RenderProfiler
+from scripts.renderer import TemplateRenderer
+from tests.constants import REPO_FOLDER
+
+
+@pytest.fixture(scope="module")
+def renderer() -> TemplateRenderer:
+    return TemplateRenderer()
+
+
+@pytest.mark.parametrize(
+    argnames="extra_context",
+    argvalues=[
+        {"project_name": "renderer-demo"},
+        {"project_name": "renderer-demo", "add_rust_extension": True, "repository_provider": "gitlab"},
+        {"project_name": "renderer-demo", "repository_provider": "bitbucket", "license": "GPL-3.0"},
+    ],
+    ids=["default", "maturin-gitlab", "bitbucket-gpl"]
+)
+def test_render_matches_cookiecutter(
+    renderer: TemplateRenderer, tmp_path: Path, extra_context: dict[str, Any]
+) -> None:
+    expected_folder: Path = Path(
+        cookiecutter(str(REPO_FOLDER), no_input=True, output_dir=tmp_path / "expected", extra_context=extra_context)
+    )
+    actual_folder: Path = renderer.render(output_dir=tmp_path / "actual", extra_context=extra_context)
+
+    expected: dict[str, bytes] = _read_tree(expected_folder)
+    actual: dict[str, bytes] = _read_tree(actual_folder)
+    assert sorted(actual) == sorted(expected)
+    for path, content in expected.items():
+        if path == ".cookiecutter.json":
+            assert _without_output_dir(actual[path]) == _without_output_dir(content)
+        else:
+            assert actual[path] == content, path
+
+
+def test_render_project_renders_files_on_demand(renderer: TemplateRenderer) -> None:
+    project: RenderedProject = renderer.render_project(renderer.get_context(extra_context={"project_name": "lazy"}))
+
+    assert "./pyproject.toml" in project
+    assert project.exists(".github/workflows")
+    assert not project.exists("rust")
+    assert project._contents == {}
+    assert 'name = "lazy"' in project.read_text("pyproject.toml")
+    assert list(project._contents) == ["pyproject.toml"]
+
+
+def test_render_profiler_records_each_step() -> None:
+    profiler: RenderProfiler = RenderProfiler()
+    renderer: TemplateRenderer = TemplateRenderer(profiler=profiler)
+    project: RenderedProject = renderer.render_project(renderer.get_context(extra_context={"project_name": "profiled"}))
+    content: bytes = project["pyproject.toml"]
+
+    categories: set[str] = {event.category for event in profiler.events}
+    assert {"load", "path", "remove", "delete", "compile", "render"} <= categories
+    render_events: list[ProfileEvent] = [event for event in profiler.events if event.category == "render"]
+    assert render_events == [
+        ProfileEvent(category="render", name="pyproject.toml", start=render_events[0].start,
+                     seconds=render_events[0].seconds, size=len(content))
+    ]
+    assert [event.name for event in profiler.events if event.category == "delete"] == project.removed_paths
+    assert "rust/Cargo.toml" in project.removed_files["rust"]
+
+
+def _read_tree(folder: Path) -> dict[str, bytes]:
+    return {path.relative_to(folder).as_posix(): path.read_bytes() for path in folder.rglob("*") if path.is_file()}
+
+
+def _without_output_dir(content: bytes) -> dict[str, Any]:
+    data: dict[str, Any] = json.loads(content)
+    data.pop("_output_dir")
+    return data
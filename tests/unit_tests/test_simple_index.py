@@ -0,0 +1,50 @@
+from http.client import HTTPConnection
+from pathlib import Path
+from urllib.parse import SplitResult
+from urllib.parse import urlsplit
+
+import pytest
+
+from tests.simple_index import build_simple_index
+from tests.simple_index import get_distribution_name
+from tests.simple_index import serve_simple_index
+
+
+@pytest.mark.parametrize(
+    argnames=("filename", "expected"),
+    argvalues=[
+        ("typing_extensions-4.13.2-py3-none-any.whl", "typing-extensions"),
+        ("Jinja2-3.1.6-py3-none-any.whl", "jinja2"),
+        ("pre_commit_hooks-5.0.0.tar.gz", "pre-commit-hooks"),
+    ],
+)
+def test_get_distribution_name(filename: str, expected: str) -> None:
+    assert get_distribution_name(filename) == expected
+
+
+def fetch(url: str) -> bytes:
+    """Returns the body of a GET request to the url, which must be served over http."""
+    parts: SplitResult = urlsplit(url)
+    connection: HTTPConnection = HTTPConnection(parts.netloc, timeout=10)
+    try:
+        connection.request("GET", parts.path)
+        return connection.getresponse().read()
+    finally:
+        connection.close()
+
+
+def test_serve_simple_index(tmp_path: Path) -> None:
+    wheelhouse: Path = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+    (wheelhouse / "loguru-0.7.3-py3-none-any.whl").write_bytes(b"wheel")
+    (wheelhouse / "requirements.txt").write_text("loguru==0.7.3")
+    index_folder: Path = tmp_path / "index"
+    index_folder.mkdir()
+
+    projects: dict[str, list[str]] = build_simple_index(wheelhouse=wheelhouse, index_folder=index_folder)
+    assert projects == {"loguru": ["loguru-0.7.3-py3-none-any.whl"]}
+
+    with serve_simple_index(index_folder=index_folder) as url:
+        page: str = fetch(f"{url}loguru/").decode()
+        assert 'href="../../files/loguru-0.7.3-py3-none-any.whl"' in page
+        assert fetch(f"{url}loguru/../../files/loguru-0.7.3-py3-none-any.whl") == b"wheel"
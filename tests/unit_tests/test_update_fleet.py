@@ -0,0 +1,183 @@
+import json
+import subprocess
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import cruft
+import pytest
+
+from tests.util import import_script
+
+
+update_fleet: ModuleType = import_script("update-fleet")
+
+
+def _git(folder: Path, *args: str) -> str:
+    """Runs git within the folder and returns its stripped stdout."""
+    return subprocess.run(["git", "-C", str(folder), *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit(folder: Path, files: dict[str, str], message: str) -> str:
+    """Writes the files relative to the folder and commits everything, returning the new commit."""
+    for relative_path, content in files.items():
+        path: Path = folder / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(folder, "add", "-A")
+    _git(folder, "commit", "-q", "-m", message)
+    return _git(folder, "rev-parse", "HEAD")
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{name}_NAME", "Fleet Test")
+        monkeypatch.setenv(f"GIT_{name}_EMAIL", "fleet@example.com")
+
+
+@pytest.fixture
+def template_folder(tmp_path: Path) -> Path:
+    """A minimal template repository, whose first commit projects are generated from."""
+    folder: Path = tmp_path / "template"
+    folder.mkdir()
+    _git(folder, "init", "-q")
+    _commit(
+        folder,
+        {
+            "cookiecutter.json": json.dumps({"project_name": "fleet-demo", "greeting": "hello"}),
+            "{{cookiecutter.project_name}}/README.md": "# {{cookiecutter.project_name}}\n\n{{cookiecutter.greeting}}\n",
+            "{{cookiecutter.project_name}}/notes.txt": "first\n",
+        },
+        message="Initial template",
+    )
+    return folder
+
+
+def _generate_project(template_folder: Path, output_folder: Path, **extra_context: Any) -> Any:
+    """Generates a project from the template's current commit as its own git repository and loads it."""
+    project_path: Path = cruft.create(
+        str(template_folder), output_dir=output_folder, no_input=True, extra_context=extra_context
+    )
+    _git(project_path, "init", "-q")
+    _commit(project_path, {}, message="Generate project")
+    return update_fleet.load_project(project_path)
+
+
+def _update(template_folder: Path, *projects: Any) -> dict[Path, Any]:
+    """Updates the projects to the template's current commit, returning each result by project path."""
+    results: list[Any] = update_fleet.update_fleet(
+        projects=list(projects), template_folder=template_folder, checkout=None, workers=2
+    )
+    return {result.path: result for result in results}
+
+
+def test_group_projects_by_commit_and_context() -> None:
+    def project(name: str, commit: str, context: dict[str, Any]) -> Any:
+        return update_fleet.Project(path=Path(name), cruft_state={"commit": commit, "context": {"cookiecutter": context}})
+
+    projects: list[Any] = [
+        project("a", "1", {"project_name": "x", "greeting": "hi"}),
+        project("b", "1", {"greeting": "hi", "project_name": "x"}),
+        project("c", "1", {"project_name": "y", "greeting": "hi"}),
+        project("d", "2", {"project_name": "x", "greeting": "hi"}),
+    ]
+    groups: list[list[str]] = [
+        [str(member.path) for member in group] for group in update_fleet.group_projects(projects).values()
+    ]
+    assert groups == [["a", "b"], ["c"], ["d"]]
+
+
+@pytest.mark.parametrize(
+    argnames=("relative_path", "expected"),
+    argvalues=[
+        ("notes.txt", True),
+        ("docs/index.md", True),
+        ("docs", True),
+        ("src/pkg/module.py", True),
+        ("README.md", False),
+        ("documents/index.md", False),
+    ],
+)
+def test_is_skipped(relative_path: str, expected: bool) -> None:
+    assert update_fleet.is_skipped(relative_path, ["notes.txt", "docs/", "src/*.py"]) is expected
+
+
+def test_update_fleet_renders_each_group_once(
+    monkeypatch: pytest.MonkeyPatch, template_folder: Path, tmp_path: Path
+) -> None:
+    projects: list[Any] = [
+        _generate_project(template_folder, tmp_path / "one"),
+        _generate_project(template_folder, tmp_path / "two"),
+        _generate_project(template_folder, tmp_path / "three", greeting="howdy"),
+    ]
+    new_commit: str = _commit(template_folder, {"{{cookiecutter.project_name}}/notes.txt": "second\n"}, "Update")
+    rendered: list[Path] = []
+    render_template_diff = update_fleet.render_template_diff
+
+    def counting_render_template_diff(**kwargs: Any) -> Any:
+        rendered.append(kwargs["project"].path)
+        return render_template_diff(**kwargs)
+
+    monkeypatch.setattr(update_fleet, "render_template_diff", counting_render_template_diff)
+    results: dict[Path, Any] = _update(template_folder, *projects)
+
+    assert len(rendered) == 2
+    assert {result.status for result in results.values()} == {"updated"}
+    for project in projects:
+        assert (project.path / "notes.txt").read_text() == "second\n"
+        assert update_fleet.load_project(project.path).cruft_state["commit"] == new_commit
+
+
+def test_update_fleet_reports_skipped_diff_as_up_to_date(template_folder: Path, tmp_path: Path) -> None:
+    project: Any = _generate_project(template_folder, tmp_path / "out")
+    cruft_state: dict[str, Any] = {**project.cruft_state, "skip": ["notes.txt"]}
+    _commit(project.path, {".cruft.json": json.dumps(cruft_state)}, message="Skip notes")
+    new_commit: str = _commit(template_folder, {"{{cookiecutter.project_name}}/notes.txt": "second\n"}, "Update")
+
+    result: Any = _update(template_folder, update_fleet.load_project(project.path))[project.path]
+
+    assert result.status == "up-to-date"
+    assert result.files == 0
+    assert (project.path / "notes.txt").read_text() == "first\n"
+    assert update_fleet.load_project(project.path).cruft_state["commit"] == new_commit
+
+
+def test_update_fleet_reports_current_commit_as_up_to_date(template_folder: Path, tmp_path: Path) -> None:
+    project: Any = _generate_project(template_folder, tmp_path / "out")
+
+    assert _update(template_folder, project)[project.path].status == "up-to-date"
+    assert _git(project.path, "status", "--porcelain") == ""
+
+
+def test_update_fleet_keeps_cruft_state_on_conflict(template_folder: Path, tmp_path: Path) -> None:
+    project: Any = _generate_project(template_folder, tmp_path / "out")
+    old_commit: str = project.cruft_state["commit"]
+    _commit(project.path, {"notes.txt": "mine\n"}, message="Edit notes")
+    _commit(template_folder, {"{{cookiecutter.project_name}}/notes.txt": "second\n"}, "Update")
+
+    result: Any = _update(template_folder, project)[project.path]
+
+    assert result.status == "conflict"
+    assert update_fleet.load_project(project.path).cruft_state["commit"] == old_commit
+
+
+def test_update_fleet_reports_errors_per_project(
+    monkeypatch: pytest.MonkeyPatch, template_folder: Path, tmp_path: Path
+) -> None:
+    broken: Any = _generate_project(template_folder, tmp_path / "broken")
+    working: Any = _generate_project(template_folder, tmp_path / "working")
+    _commit(template_folder, {"{{cookiecutter.project_name}}/notes.txt": "second\n"}, "Update")
+    update_project = update_fleet.update_project
+
+    def failing_update_project(project: Any, *args: Any) -> Any:
+        if project.path == broken.path:
+            raise OSError("disk full")
+        return update_project(project, *args)
+
+    monkeypatch.setattr(update_fleet, "update_project", failing_update_project)
+    results: dict[Path, Any] = _update(template_folder, broken, working)
+
+    assert results[broken.path].status == "error"
+    assert results[broken.path].detail == "OSError: disk full"
+    assert results[working.path].status == "updated"
@@ -1,9 +1,56 @@
 """Module containing utility functions used by tests."""
+import importlib
+import importlib.machinery
+import importlib.util
+import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Optional
 
 from constants import COOKIECUTTER_FOLDER
+from constants import SCRIPTS_FOLDER
+
+
+# Modules within the scripts folder that the scripts import from each other by name, each after those it imports
+SHARED_SCRIPT_MODULES: tuple[str, ...] = ("cruft_adapter", "renderer", "util")
 
 
 def templates_matching(pattern: str) -> list[Path]:
     """Return a list of relative file paths matching the given pattern."""
     return [path.relative_to(COOKIECUTTER_FOLDER) for path in COOKIECUTTER_FOLDER.glob(pattern)]
+
+
+def import_script(name: str) -> ModuleType:
+    """Imports the script of the given file name from the scripts folder as scripts.<name>, with dashes as underscores.
+
+    Scripts import their shared modules by name, as if the scripts folder were first on sys.path. While the script is
+    imported, those names refer to the shared modules from the scripts folder rather than to any module in tests.
+    """
+    module_name: str = f"scripts.{name.replace('-', '_')}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    previous: dict[str, Optional[ModuleType]] = {
+        shared_name: sys.modules.get(shared_name) for shared_name in SHARED_SCRIPT_MODULES
+    }
+    spec: Optional[importlib.machinery.ModuleSpec] = importlib.util.spec_from_file_location(
+        module_name, SCRIPTS_FOLDER / f"{name}.py"
+    )
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No script named {name!r} in {SCRIPTS_FOLDER}.")
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    try:
+        for shared_name in SHARED_SCRIPT_MODULES:
+            sys.modules[shared_name] = importlib.import_module(f"scripts.{shared_name}")
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    finally:
+        for shared_name, shared_module in previous.items():
+            if shared_module is None:
+                sys.modules.pop(shared_name, None)
+            else:
+                sys.modules[shared_name] = shared_module
+    return module
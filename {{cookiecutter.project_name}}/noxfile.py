@@ -1,14 +1,29 @@
 """Noxfile for the {{cookiecutter.project_name}} project."""
 
+import atexit
+import functools
+import hashlib
+import json
 import os
+import re
 import shlex
+import shutil
+import threading
+import time
 from pathlib import Path
 from textwrap import dedent
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
 
 import nox
+import nox.command
 from nox.command import CommandFailed
 from nox.sessions import Session
+from nox.sessions import SessionRunner
+from nox.virtualenv import VirtualEnv
 
 
 nox.options.default_venv_backend = "uv"
@@ -22,6 +37,11 @@ PYTHON_VERSIONS: List[str] = [
 ]
 DEFAULT_PYTHON_VERSION: str = PYTHON_VERSIONS[-1]
 
+# Free-threaded builds exist from 3.13 onwards and are opt-in, so they're kept out of PYTHON_VERSIONS
+FREE_THREADED_PYTHON_VERSIONS: List[str] = [
+    f"{python_version}t" for python_version in PYTHON_VERSIONS if int(python_version.split(".")[1]) >= 13
+]
+
 REPO_ROOT: Path = Path(__file__).parent.resolve()
 TESTS_FOLDER: Path = REPO_ROOT / "tests"
 SCRIPTS_FOLDER: Path = REPO_ROOT / "scripts"
@@ -32,6 +52,42 @@ PACKAGE_NAME: str = "{{cookiecutter.package_name}}"
 REPOSITORY_HOST: str = "{{cookiecutter.repository_host}}"
 REPOSITORY_PATH: str = "{{cookiecutter.repository_path}}"
 
+ENV_PREFIX: str = f"{PACKAGE_NAME.upper()}__"
+LOCKFILE: Path = REPO_ROOT / "uv.lock"
+WHEELHOUSE_FOLDER: Path = Path(os.getenv(f"{ENV_PREFIX}WHEELHOUSE", REPO_ROOT / ".wheelhouse")).resolve()
+OFFLINE: bool = os.getenv(f"{ENV_PREFIX}OFFLINE", "0").lower() in ("1", "true")
+MEMO_FOLDER: Path = REPO_ROOT / ".nox" / ".memo"
+NO_MEMO: bool = os.getenv(f"{ENV_PREFIX}NO_MEMO", "0").lower() in ("1", "true")
+PRE_COMMIT_CONFIG: Path = REPO_ROOT / ".pre-commit-config.yaml"
+CACHE_HOME: Path = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+PRE_COMMIT_CACHE_FOLDER: Path = Path(
+    os.getenv(f"{ENV_PREFIX}PRE_COMMIT_CACHE", CACHE_HOME / "pre-commit-configs")
+).resolve()
+# Comma separated optimization levels, such as "0,2", to precompile bytecode at when installing and building
+BYTECODE_ENV_VAR: str = f"{ENV_PREFIX}BYTECODE"
+BYTECODE_LEVELS: List[str] = [level.strip() for level in os.getenv(BYTECODE_ENV_VAR, "").split(",") if level.strip()]
+TRACE_PATH: Optional[str] = os.getenv(f"{ENV_PREFIX}TRACE")
+TRACE_SUMMARY_LIMIT: int = 15
+TRACE_EVENTS: List[Dict[str, Any]] = []
+
+# Requirements needed to build the project in isolation, which aren't captured by uv.lock
+{% if cookiecutter.add_rust_extension -%}
+BUILD_REQUIREMENTS: List[str] = ["maturin>=1.9.0,<2.0"]
+{% else -%}
+BUILD_REQUIREMENTS: List[str] = ["setuptools>=61.0"]
+{% endif %}
+if OFFLINE:
+    # Both uv and pip read these, so every install, uvx tool run, and isolated build only sees the wheelhouse
+    os.environ.update(
+        {
+            "UV_OFFLINE": "1",
+            "UV_NO_INDEX": "1",
+            "UV_FIND_LINKS": str(WHEELHOUSE_FOLDER),
+            "PIP_NO_INDEX": "1",
+            "PIP_FIND_LINKS": str(WHEELHOUSE_FOLDER),
+        }
+    )
+
 ENV: str = "env"
 FORMAT: str = "format"
 LINT: str = "lint"
@@ -44,11 +100,239 @@ BUILD: str = "build"
 RELEASE: str = "release"
 QUALITY: str = "quality"
 
+PYTHON_INPUTS: List[str] = ["src/**/*.py", "src/**/*.pyi", "pyproject.toml", "uv.lock"]
+{% if cookiecutter.add_rust_extension -%}
+RUST_INPUTS: List[str] = ["rust/**/*.rs", "rust/Cargo.toml", "rust/Cargo.lock"]
+RUST_MANIFEST: Path = CRATES_FOLDER / "Cargo.toml"
+
+# Every cargo and maturin invocation shares one target dir so sessions reuse each other's compiled dependencies, while
+# sccache caches compilations across target dirs and checkouts when installed. Set CARGO_TARGET_DIR to share further
+os.environ.setdefault("CARGO_TARGET_DIR", str(CRATES_FOLDER / "target"))
+if "RUSTC_WRAPPER" not in os.environ and shutil.which("sccache") is not None:
+    os.environ["RUSTC_WRAPPER"] = "sccache"
+{% else -%}
+RUST_INPUTS: List[str] = []
+{% endif %}
+
+def memoize(
+    inputs: List[str], outputs: Optional[List[str]] = None, env: Optional[List[str]] = None
+) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """Skip the decorated session when its inputs are unchanged since its last successful run.
+
+    The inputs are globs relative to the repo root, hashed by path and content along with this noxfile, the
+    session's posargs, and the values of the provided environment variables. Outputs are stored after each success and
+    restored on a cache hit. Memoization is disabled by setting {{ cookiecutter.package_name|upper }}__NO_MEMO=1.
+
+    Args:
+        inputs: Globs of the files the session depends on.
+        outputs: Paths of the files or folders the session produces.
+        env: Names of the environment variables that change what the session produces.
+    """
+
+    def decorator(func: Callable[..., None]) -> Callable[..., None]:
+        @functools.wraps(func)
+        def wrapper(session: Session, *args: Any, **kwargs: Any) -> None:
+            if NO_MEMO:
+                func(session, *args, **kwargs)
+                return
+
+            memo_name: str = get_memo_name(session)
+            record_path: Path = MEMO_FOLDER / f"{memo_name}.json"
+            artifacts_folder: Path = MEMO_FOLDER / memo_name
+            env_values: List[str] = [f"{name}={os.getenv(name, '')}" for name in env or []]
+            key: str = hash_inputs(
+                inputs=inputs, outputs=outputs or [], extra=[session.name, *session.posargs, *env_values]
+            )
+
+            if record_path.exists() and json.loads(record_path.read_text())["key"] == key:
+                restore_outputs(outputs=outputs or [], artifacts_folder=artifacts_folder)
+                session.skip(f"Cache hit, inputs are unchanged since the last successful run ({key[:12]}).")
+
+            record_path.unlink(missing_ok=True)
+            func(session, *args, **kwargs)
+            store_outputs(outputs=outputs or [], artifacts_folder=artifacts_folder)
+            MEMO_FOLDER.mkdir(parents=True, exist_ok=True)
+            record_path.write_text(json.dumps({"key": key}))
+
+        return wrapper
+
+    return decorator
+
+
+def get_memo_name(session: Session) -> str:
+    """Returns the session's name made safe to use as a file name within the memo folder."""
+    return re.sub(r"[^\w.-]+", "_", session.name)
+
+
+def hash_inputs(inputs: List[str], outputs: List[str], extra: List[str]) -> str:
+    """Returns a hash of the paths and contents of every file matching the inputs, excluding any outputs."""
+    output_paths: List[Path] = [REPO_ROOT / output for output in outputs]
+    files: set[Path] = {REPO_ROOT / "noxfile.py"}
+    for pattern in inputs:
+        for path in REPO_ROOT.glob(pattern):
+            files.update(path.rglob("*") if path.is_dir() else [path])
+
+    digest = hashlib.sha256("\0".join(extra).encode())
+    for path in sorted(files):
+        if not path.is_file() or any(path == output or output in path.parents for output in output_paths):
+            continue
+        digest.update(path.relative_to(REPO_ROOT).as_posix().encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def store_outputs(outputs: List[str], artifacts_folder: Path) -> None:
+    """Copies the session's outputs into its artifacts folder, replacing any previously stored copies."""
+    shutil.rmtree(artifacts_folder, ignore_errors=True)
+    for output in outputs:
+        source: Path = REPO_ROOT / output
+        destination: Path = artifacts_folder / output
+        if source.is_dir():
+            shutil.copytree(source, destination)
+        elif source.is_file():
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, destination)
+
+
+def restore_outputs(outputs: List[str], artifacts_folder: Path) -> None:
+    """Copies any stored outputs back into the repo, replacing whatever is currently there."""
+    for output in outputs:
+        stored: Path = artifacts_folder / output
+        destination: Path = REPO_ROOT / output
+        if stored.is_dir():
+            shutil.rmtree(destination, ignore_errors=True)
+            shutil.copytree(stored, destination)
+        elif stored.is_file():
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(stored, destination)
+
+
+def trace_span(category: str, get_name: Callable[..., str]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Record every call of the decorated function as a complete event in the Chrome trace.
+
+    Args:
+        category: The trace category the events are grouped under.
+        get_name: Returns the event's name when called with the same arguments as the decorated function.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start: float = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                event: Dict[str, Any] = {
+                    "name": get_name(*args, **kwargs)[:200],
+                    "cat": category,
+                    "ph": "X",
+                    "ts": round(start * 1_000_000, 3),
+                    "dur": round((time.perf_counter() - start) * 1_000_000, 3),
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+                TRACE_EVENTS.append(event)
+
+        return wrapper
+
+    return decorator
+
+
+def format_command(*args: Any, **_: Any) -> str:
+    """Returns a command as it would be typed, with the executable shortened to its name."""
+    if args and isinstance(args[0], (list, tuple)):
+        args = tuple(args[0])
+    return shlex.join([Path(args[0]).name, *map(str, args[1:])]) if args else ""
+
+
+def install_tracing(trace_path: Path) -> None:
+    """Patch nox to trace every session, venv, install, run and subprocess, writing the trace when nox exits.
+
+    Set {{ cookiecutter.package_name|upper }}__TRACE to the path of the trace to enable tracing. The trace can be opened
+    in Perfetto or chrome://tracing.
+
+    Args:
+        trace_path: The path to write the trace to.
+    """
+    SessionRunner.execute = trace_span("session", lambda runner: runner.friendly_name)(SessionRunner.execute)
+    VirtualEnv.create = trace_span("venv", lambda venv: f"{Path(venv.location).name} venv")(VirtualEnv.create)
+    Session.install = trace_span("install", lambda _, *args, **__: format_command("install", *args))(Session.install)
+    Session.run = trace_span("run", lambda _, *args, **__: format_command(*args))(Session.run)
+    nox.command.popen = trace_span("subprocess", format_command)(nox.command.popen)
+    atexit.register(write_trace, trace_path)
+
+
+def write_trace(trace_path: Path) -> None:
+    """Write the recorded events as a Chrome trace and print where the time went."""
+    trace_path.parent.mkdir(parents=True, exist_ok=True)
+    trace_path.write_text(json.dumps({"traceEvents": TRACE_EVENTS, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+    for category in ("session", "subprocess"):
+        events: List[Dict[str, Any]] = [event for event in TRACE_EVENTS if event["cat"] == category]
+        print(f"\nSlowest {category} spans:")
+        for event in sorted(events, key=lambda event: event["dur"], reverse=True)[:TRACE_SUMMARY_LIMIT]:
+            print(f"{event['dur'] / 1_000_000:>10.2f}s  {event['name']}")
+    print(f"\nWrote {len(TRACE_EVENTS)} spans to {trace_path}.")
+
+
+if TRACE_PATH:
+    install_tracing(Path(TRACE_PATH).resolve())
+
 
 @nox.session(python=False, name="setup-venv", tags=[ENV])
 def setup_venv(session: Session) -> None:
     """Set up the virtual environment for the current project."""
-    session.run("python", SCRIPTS_FOLDER / "setup-venv.py", REPO_ROOT, "-p", PYTHON_VERSIONS[0], external=True)
+    session.run(
+        "python",
+        SCRIPTS_FOLDER / "setup-venv.py",
+        REPO_ROOT,
+        "-p",
+        PYTHON_VERSIONS[0],
+        *optimize_args(BYTECODE_LEVELS),
+        external=True,
+    )
+
+
+@nox.session(python=PYTHON_VERSIONS, name="prefetch", tags=[ENV])
+def prefetch(session: Session) -> None:
+    """Build a local wheelhouse from uv.lock so that sessions can run offline.
+
+    Set {{ cookiecutter.package_name|upper }}__OFFLINE=1 afterwards to have every session install only from the wheelhouse.
+    """
+    if OFFLINE:
+        session.skip("Prefetching requires network access, unset the offline mode to run it.")
+    if not LOCKFILE.exists():
+        session.error("No uv.lock found. Run `nox -s setup-venv` to create it first.")
+
+    WHEELHOUSE_FOLDER.mkdir(parents=True, exist_ok=True)
+    requirements_path: Path = WHEELHOUSE_FOLDER / "requirements.txt"
+
+    session.log("Exporting locked requirements...")
+    session.run(
+        "uv",
+        "export",
+        "--frozen",
+        "--all-groups",
+        "--no-hashes",
+        "--no-emit-project",
+        "--output-file",
+        str(requirements_path),
+        external=True,
+    )
+
+    session.log(f"Building wheelhouse at {WHEELHOUSE_FOLDER} with py{session.python}.")
+    session.install("pip")
+    session.run(
+        "pip",
+        "wheel",
+        "--wheel-dir",
+        str(WHEELHOUSE_FOLDER),
+        "--find-links",
+        str(WHEELHOUSE_FOLDER),
+        "--requirement",
+        str(requirements_path),
+        *BUILD_REQUIREMENTS,
+    )
 
 
 @nox.session(python=False, name="setup-git", tags=[ENV])
@@ -72,24 +356,38 @@ def setup_remote(session: Session) -> None:
     session.run(*command, external=True)
 
 
-@nox.session(python=DEFAULT_PYTHON_VERSION, name="pre-commit", tags=[QUALITY])
+@nox.session(python=DEFAULT_PYTHON_VERSION, name="pre-commit", tags=[QUALITY], reuse_venv=True)
 def precommit(session: Session) -> None:
     """Lint using pre-commit."""
     args: list[str] = session.posargs or ["run", "--all-files", "--show-diff-on-failure"]
 
     session.log("Installing pre-commit dependencies...")
-    session.install("-e", ".", "--group", "dev")
+    session.install("--group", "dev")
 
-    session.run("pre-commit", *args)
+    session.run("pre-commit", *args, env=get_pre_commit_env())
     if args and args[0] == "install":
         activate_virtualenv_in_precommit_hooks(session)
 
 
+@nox.session(python=DEFAULT_PYTHON_VERSION, name="pre-commit-changed", reuse_venv=True)
+def precommit_changed(session: Session) -> None:
+    """Run pre-commit against only the files changed since HEAD, running read-only hooks concurrently.
+
+    Accepts pre-commit-changed.py args after '--', such as `-- --staged` for only staged files or `-- --ref develop`.
+    """
+    session.log("Installing pre-commit dependencies...")
+    session.install("--group", "dev")
+
+    session.run(
+        "python", SCRIPTS_FOLDER / "pre-commit-changed.py", REPO_ROOT, *session.posargs, env=get_pre_commit_env()
+    )
+
+
 @nox.session(python=False, name="format-python", tags=[FORMAT, QUALITY])
 def format_python(session: Session) -> None:
     """Run Python code formatter (Ruff format)."""
     session.log(f"Running Ruff formatter check with py{session.python}.")
-    session.run("uvx", "ruff", "format", *session.posargs)
+    session.run("uvx", "--from", locked_requirement("ruff"), "ruff", "format", *session.posargs)
 
 
 {% if cookiecutter.add_rust_extension -%}
@@ -104,10 +402,14 @@ def format_rust(session: Session) -> None:
 
 {% endif -%}
 @nox.session(python=False, name="lint-python", tags=[LINT, QUALITY])
+@memoize(inputs=[*PYTHON_INPUTS, "tests/**/*.py", "scripts/**/*.py", "docs/conf.py", ".ruff.toml"])
 def lint_python(session: Session) -> None:
-    """Run Python code linters (Ruff check, Pydocstyle rules)."""
+    """Run Python code linters (Ruff check, Pydocstyle rules).
+
+    Fixes applied by Ruff change the inputs, so the run after one isn't skipped and lints the fixed files again.
+    """
     session.log(f"Running Ruff check with py{session.python}.")
-    session.run("uvx", "ruff", "check", "--fix", "--verbose")
+    session.run("uvx", "--from", locked_requirement("ruff"), "ruff", "check", "--fix", "--verbose")
 
 
 {% if cookiecutter.add_rust_extension -%}
@@ -117,28 +419,67 @@ def lint_rust(session: Session) -> None:
     session.log("Ensuring clippy component is available...")
     session.run("rustup", "component", "add", "clippy", external=True)
     session.log("Running clippy lints...")
-    session.run("cargo", "clippy", "--all-features", "--", "-D", "warnings", external=True)
+    session.run(
+        "cargo", "clippy", "--all-features", "--manifest-path", RUST_MANIFEST, "--", "-D", "warnings", external=True
+    )
 
 
 {% endif -%}
 @nox.session(python=PYTHON_VERSIONS, name="typecheck")
+@memoize(inputs=[*PYTHON_INPUTS, "tests/**/*.py", "pyrightconfig.json"])
 def typecheck(session: Session) -> None:
     """Run static type checking (Pyright) on Python code."""
     session.log("Installing type checking dependencies...")
-    session.install("-e", ".", "--group", "dev")
+    install_project(session, "dev")
 
     session.log(f"Running Pyright check with py{session.python}.")
     session.run("pyright", "--pythonversion", session.python)
 
 
+@nox.session(python=DEFAULT_PYTHON_VERSION, name="typecheck-all")
+def typecheck_all(session: Session) -> None:
+    """Run static type checking (Pyright) for every Python version concurrently from one environment.
+
+    Accepts the Python versions to check after '--', defaulting to every supported version.
+    """
+    session.log("Installing type checking dependencies...")
+    install_project(session, "dev")
+
+    python_versions: list[str] = session.posargs or PYTHON_VERSIONS
+    session.log(f"Running Pyright checks for {', '.join(python_versions)}.")
+    session.run("python", SCRIPTS_FOLDER / "typecheck-watch.py", REPO_ROOT, *python_version_args(python_versions))
+
+
+@nox.session(python=DEFAULT_PYTHON_VERSION, name="typecheck-watch")
+def typecheck_watch(session: Session) -> None:
+    """Run long-lived Pyright watchers that only re-check the files affected by each change.
+
+    Accepts the Python versions to check after '--', defaulting to every supported version.
+    """
+    session.log("Installing type checking dependencies...")
+    install_project(session, "dev")
+
+    python_versions: list[str] = session.posargs or PYTHON_VERSIONS
+    session.log(f"Watching with Pyright for {', '.join(python_versions)}. Press Ctrl+C to stop.")
+    session.run(
+        "python", SCRIPTS_FOLDER / "typecheck-watch.py", REPO_ROOT, *python_version_args(python_versions), "--watch"
+    )
+
+
 @nox.session(python=False, name="security-python", tags=[SECURITY])
+@memoize(inputs=[*PYTHON_INPUTS, "bandit.yml"])
 def security_python(session: Session) -> None:
-    """Run code security checks (Bandit) on Python code."""
+    """Run code security checks (Bandit) on Python code.
+
+    pip-audit checks uv.lock against a live vulnerability database, so a cache hit won't report vulnerabilities
+    published since the last run. CI always starts without a cache, and setting
+    {{ cookiecutter.package_name|upper }}__NO_MEMO=1 forces a recheck locally.
+    """
     session.log(f"Running Bandit static security analysis with py{session.python}.")
-    session.run("uvx", "bandit", "-r", PACKAGE_NAME, "-c", "bandit.yml", "-ll")
+    session.run("uvx", "--from", locked_requirement("bandit"), "bandit", "-r", PACKAGE_NAME, "-c", "bandit.yml", "-ll")
 
     session.log(f"Running pip-audit dependency security check with py{session.python}.")
-    session.run("uvx", "pip-audit")
+    session.run("uvx", "--from", locked_requirement("pip-audit"), "pip-audit")
 
 
 {% if cookiecutter.add_rust_extension -%}
@@ -155,40 +496,93 @@ def security_rust(session: Session) -> None:
 def tests_python(session: Session) -> None:
     """Run the Python test suite (pytest with coverage)."""
     session.log("Installing test dependencies...")
-    session.install("-e", ".", "--group", "dev")
+    install_project(session, "dev")
+    run_test_suite(session)
 
-    session.log(f"Running test suite with py{session.python}.")
-    test_results_dir = TESTS_FOLDER / "results"
-    test_results_dir.mkdir(parents=True, exist_ok=True)
-    junitxml_file = test_results_dir / f"test-results-py{session.python.replace('.', '')}.xml"
 
-    session.run(
-        "pytest",
-        "--cov={}".format(PACKAGE_NAME),
-        "--cov-append",
-        "--cov-report=term",
-        "--cov-report=xml",
-        f"--junitxml={junitxml_file}",
-        "tests/",
-    )
+@nox.session(python=DEFAULT_PYTHON_VERSION, name="memory")
+def memory(session: Session) -> None:
+    """Measure the peak memory of every test, diffing each against the previous run.
+
+    Tests marked with memory_budget fail whenever they exceed their budget, including in tests-python. This session
+    additionally writes tests/results/memory.json with every test's peak and its change since the last report.
+    """
+    session.log("Installing test dependencies...")
+    install_project(session, "dev")
+
+    session.log(f"Measuring test suite memory with py{session.python}.")
+    report_path: Path = TESTS_FOLDER / "results" / "memory.json"
+    session.run("pytest", "--memory", f"--memory-report={report_path}", "tests/", *session.posargs)
+
+
+@nox.session(python=FREE_THREADED_PYTHON_VERSIONS, name="tests-python-free-threaded")
+def tests_python_free_threaded(session: Session) -> None:
+    """Run the Python test suite on free-threaded Python, then check that importing the package keeps the GIL off.
+
+    Opt-in rather than tagged with the other tests, run with `nox -s tests-python-free-threaded`.
+    """
+    session.log("Installing test dependencies...")
+    install_project(session, "dev")
+    run_test_suite(session)
+
+    session.log(f"Checking that {PACKAGE_NAME} supports running without the GIL.")
+    session.run("python", SCRIPTS_FOLDER / "benchmark-threads.py", PACKAGE_NAME, "--threads=1", "--iterations=1")
+
+
+@nox.session(python=FREE_THREADED_PYTHON_VERSIONS, name="benchmark-threads")
+def benchmark_threads(session: Session) -> None:
+    """Report throughput against thread count with and without the GIL on free-threaded Python.
+
+    Accepts benchmark-threads.py args after '--', such as `-- --function module:function --threads 8`.
+    """
+    session.log("Installing the package...")
+    install_project(session)
+
+    session.log(f"Benchmarking thread scaling with py{session.python}.")
+    session.run("python", SCRIPTS_FOLDER / "benchmark-threads.py", PACKAGE_NAME, *session.posargs)
+
+
+@nox.session(python=DEFAULT_PYTHON_VERSION, name="benchmark-fanout")
+def benchmark_fanout(session: Session) -> None:
+    """Report the throughput of fan-out I/O made sequentially and through gather_bounded against a stub server.
+
+    Accepts benchmark-fanout.py args after '--', such as `-- --limit 8 --latency 0.05 --output fanout.json`.
+    """
+    session.log("Installing the package...")
+    install_project(session)
+
+    session.log(f"Benchmarking fan-out I/O with py{session.python}.")
+    session.run("python", SCRIPTS_FOLDER / "benchmark-fanout.py", *session.posargs)
+
+
+@nox.session(python=DEFAULT_PYTHON_VERSION, name="benchmark-logging")
+def benchmark_logging(session: Session) -> None:
+    """Report the per-call overhead of logging at enabled and disabled levels.
+
+    Accepts benchmark-logging.py args after '--', such as `-- --calls 100000 --output logging.json`.
+    """
+    session.log("Installing the package...")
+    install_project(session)
+
+    session.log(f"Benchmarking logging with py{session.python}.")
+    session.run("python", SCRIPTS_FOLDER / "benchmark-logging.py", *session.posargs)
 
 
 {% if cookiecutter.add_rust_extension -%}
 @nox.session(python=False, name="tests-rust", tags=[TEST])
 def tests_rust(session: Session) -> None:
     """Test the project's rust crates."""
-    crates: list[Path] = [cargo_toml.parent for cargo_toml in CRATES_FOLDER.glob("*/Cargo.toml")]
-    crate_kwargs: list[str] = [f"-p {crate.name}" for crate in crates]
-    session.run("cargo", "test", "--all-features", "--no-run", *crate_kwargs, external=True)
-    session.run("cargo", "test", "--all-features", *crate_kwargs, external=True)
+    session.run("cargo", "test", "--all-features", "--manifest-path", RUST_MANIFEST, "--no-run", external=True)
+    session.run("cargo", "test", "--all-features", "--manifest-path", RUST_MANIFEST, external=True)
 
 
 {% endif -%}
 @nox.session(python=DEFAULT_PYTHON_VERSION, name="build-docs", tags=[DOCS, BUILD])
+@memoize(inputs=[*PYTHON_INPUTS, "docs/**", "*.md"], outputs=["docs/_build"])
 def docs_build(session: Session) -> None:
     """Build the project documentation (Sphinx)."""
     session.log("Installing documentation dependencies...")
-    session.install("-e", ".", "--group", "docs")
+    install_project(session, "docs")
 
     session.log(f"Building documentation with py{session.python}.")
     docs_build_dir = Path("docs") / "_build" / "html"
@@ -203,7 +597,7 @@ def docs_build(session: Session) -> None:
 def docs(session: Session) -> None:
     """Build and serve the project documentation (Sphinx)."""
     session.log("Installing documentation dependencies...")
-    session.install("-e", ".", "--group", "docs")
+    install_project(session, "docs")
 
     session.log(f"Building documentation with py{session.python}.")
     docs_build_dir = Path("docs") / "_build" / "html"
@@ -216,14 +610,32 @@ def docs(session: Session) -> None:
 
 
 @nox.session(python=False, name="build-python", tags=[BUILD])
+@memoize(inputs=[*PYTHON_INPUTS, *RUST_INPUTS, "README.md", "LICENSE"], outputs=["dist"], env=[BYTECODE_ENV_VAR])
 def build_python(session: Session) -> None:
-    """Build sdist and wheel packages (uv build)."""
+    """Build sdist and wheel packages ({% if cookiecutter.add_rust_extension %}a single abi3 wheel with maturin{% else %}uv build{% endif %})."""
     session.log(f"Building sdist and wheel packages with py{session.python}.")
     {% if cookiecutter.add_rust_extension -%}
-    session.run("uvx", "maturin", "develop", "--uv")
+    session.run("uvx", "--from", locked_requirement("maturin"), "maturin", "sdist", "--out", "dist", external=True)
+    session.run(
+        "python",
+        SCRIPTS_FOLDER / "build-wheels.py",
+        REPO_ROOT,
+        f"--maturin={locked_requirement('maturin')}",
+        external=True,
+    )
     {% else -%}
     session.run("uv", "build", "--sdist", "--wheel", "--out-dir", "dist/", external=True)
     {% endif -%}
+    if BYTECODE_LEVELS:
+        session.log(f"Adding bytecode at -o {', '.join(BYTECODE_LEVELS)} to the wheels.")
+        session.run(
+            "python",
+            SCRIPTS_FOLDER / "compile-wheels.py",
+            "dist",
+            *python_version_args(PYTHON_VERSIONS),
+            *optimize_args(BYTECODE_LEVELS),
+            external=True,
+        )
 
     session.log("Built packages in ./dist directory:")
     for path in Path("dist/").glob("*"):
@@ -231,11 +643,30 @@ def build_python(session: Session) -> None:
 
 
 {% if cookiecutter.add_rust_extension -%}
+@nox.session(python=False, name="build-wheels")
+def build_wheels(session: Session) -> None:
+    """Build a version specific wheel for each supported Python concurrently instead of a single abi3 wheel.
+
+    Accepts the Python versions to build after '--', defaulting to every supported version. Each build gets its own
+    cargo target dir, and sccache is used as a shared compile cache when it is installed.
+    """
+    python_versions: list[str] = session.posargs or PYTHON_VERSIONS
+    session.log(f"Building wheels for {', '.join(python_versions)}.")
+    session.run(
+        "python",
+        SCRIPTS_FOLDER / "build-wheels.py",
+        REPO_ROOT,
+        f"--maturin={locked_requirement('maturin')}",
+        *python_version_args(python_versions),
+        external=True,
+    )
+
+
 @nox.session(python=False, name="build-rust", tags=[BUILD])
 def build_rust(session: Session) -> None:
     """Build standalone Rust crates for potential independent publishing."""
     session.log("Building Rust crates...")
-    session.run("cargo", "build", "--release", "--manifest-path", "rust/Cargo.toml", external=True)
+    session.run("cargo", "build", "--release", "--all-features", "--manifest-path", RUST_MANIFEST, external=True)
 
 
 {% endif -%}
@@ -261,7 +692,7 @@ def build_container(session: Session) -> None:
 
     current_dir: Path = Path.cwd()
     session.log(f"Ensuring core dependencies are synced in {current_dir.resolve()} for build context...")
-    session.install("-e", ".")
+    install_project(session)
 
     session.log(f"Building Docker image using {container_cli}.")
     project_image_name = PACKAGE_NAME.replace("_", "-").lower()
@@ -289,6 +720,13 @@ def setup_release(session: Session) -> None:
     session.run("python", SCRIPTS_FOLDER / "setup-release.py", *session.posargs, external=True)
 
 
+@nox.session(python=False, name="bump-version", tags=[RELEASE])
+def bump_version(session: Session) -> None:
+    """Bumps the version by an increment or to an explicit version, updating the changelog without committing."""
+    session.log("Bumping version...")
+    session.run("python", SCRIPTS_FOLDER / "bump-version.py", *session.posargs, external=True)
+
+
 @nox.session(python=False, name="get-release-notes", tags=[RELEASE])
 def get_release_notes(session: Session) -> None:
     """Gets the latest release notes if between bumping the version and tagging the release."""
@@ -304,7 +742,7 @@ def publish_python(session: Session) -> None:
     Requires TWINE_USERNAME/TWINE_PASSWORD or TWINE_API_KEY environment variables set (usually in CI).
     """
     session.log("Checking built packages with Twine.")
-    session.run("uvx", "twine", "check", "dist/*")
+    session.run("uvx", "--from", locked_requirement("twine"), "twine", "check", "dist/*")
 
     session.log("Publishing packages to PyPI.")
     session.run("uv", "publish", "dist/*", *session.posargs, external=True)
@@ -331,7 +769,7 @@ def tox(session: Session) -> None:
     Accepts tox args after '--' (e.g., `nox -s tox -- -e py39`).
     """
     session.log("Running Tox test matrix via uvx...")
-    session.install("-e", ".", "--group", "dev")
+    install_project(session, "dev")
 
     tox_ini_path = Path("tox.ini")
     if not tox_ini_path.exists():
@@ -357,7 +795,7 @@ def coverage(session: Session) -> None:
     )
 
     session.log("Installing dependencies for coverage report session...")
-    session.install("-e", ".", "--group", "dev")
+    install_project(session, "dev")
 
     coverage_combined_file: Path = Path.cwd() / ".coverage"
 
@@ -382,6 +820,128 @@ def coverage(session: Session) -> None:
     session.log(f"Coverage reports generated in ./{coverage_html_dir} and terminal.")
 
 
+@nox.session(python=False, name="perf-report")
+def perf_report(session: Session) -> None:
+    """Record the latest test results and coverage in a local history and render it as a static HTML dashboard.
+
+    Run after tests-python, and coverage for the coverage trend, to ingest their artifacts as a new run. Accepts
+    perf-report.py args after '--', such as `-- --no-ingest` to only render the existing history.
+    """
+    session.run("python", SCRIPTS_FOLDER / "perf-report.py", REPO_ROOT, *session.posargs, external=True)
+    session.log(f"Open {REPO_ROOT / 'perf-report' / 'index.html'} to view the dashboard.")
+
+
+def run_test_suite(session: Session) -> None:
+    """Run pytest with coverage, writing JUnit results named after the session's Python version."""
+    session.log(f"Running test suite with py{session.python}.")
+    test_results_dir = TESTS_FOLDER / "results"
+    test_results_dir.mkdir(parents=True, exist_ok=True)
+    junitxml_file = test_results_dir / f"test-results-py{session.python.replace('.', '')}.xml"
+
+    session.run(
+        "pytest",
+        "--cov={}".format(PACKAGE_NAME),
+        "--cov-append",
+        "--cov-report=term",
+        "--cov-report=xml",
+        f"--junitxml={junitxml_file}",
+        "tests/",
+    )
+
+
+def install_project(session: Session, *groups: str) -> None:
+    """Install the project in editable mode along with the provided dependency groups.
+{% if cookiecutter.add_rust_extension %}
+    The extension is built with maturin develop into the shared cargo target dir, with every feature enabled like the
+    other Rust sessions. The build is skipped when the Rust sources, Cargo.toml, and pyproject.toml are unchanged since
+    it was last built for this session, as recorded in the memo folder, and the package is still installed in the
+    session's virtualenv.
+{% endif %}
+    When {{ cookiecutter.package_name|upper }}__BYTECODE is set, the virtualenv and sources are then precompiled at
+    its optimization levels so the session's first imports don't pay for compiling them.
+
+    Args:
+        session: The session whose virtualenv the project is installed into.
+        groups: The names of the dependency groups to install.
+    """
+    group_args: list[str] = [arg for group in groups for arg in ("--group", group)]
+    {%- if cookiecutter.add_rust_extension %}
+    if group_args:
+        session.install(*group_args)
+
+    develop_args: List[str] = ["--uv", "--all-features"]
+    stamp_path: Path = MEMO_FOLDER / "maturin-develop" / get_memo_name(session)
+    key: str = hash_inputs(
+        inputs=[*RUST_INPUTS, "pyproject.toml"], outputs=[], extra=[session.virtualenv.location, *develop_args]
+    )
+    if not NO_MEMO and stamp_path.exists() and stamp_path.read_text() == key and is_installed(session, PACKAGE_NAME):
+        session.log(f"Rust sources are unchanged since the last build ({key[:12]}), skipping maturin develop.")
+    else:
+        stamp_path.unlink(missing_ok=True)
+        session.run("uvx", "--from", locked_requirement("maturin"), "maturin", "develop", *develop_args, external=True)
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp_path.write_text(key)
+    {%- else %}
+    session.install("-e", ".", *group_args)
+    {%- endif %}
+
+    if BYTECODE_LEVELS:
+        session.run("python", SCRIPTS_FOLDER / "compile-bytecode.py", REPO_ROOT, *optimize_args(BYTECODE_LEVELS))
+{%- if cookiecutter.add_rust_extension %}
+
+
+def is_installed(session: Session, module: str) -> bool:
+    """Returns whether the module can be imported from outside the source tree by the session's virtualenv."""
+    output: Optional[Any] = session.run(
+        "python",
+        "-I",
+        "-c",
+        "import importlib.util, sys; print(importlib.util.find_spec(sys.argv[1]) is not None)",
+        module,
+        silent=True,
+    )
+    return str(output).strip().endswith("True")
+{%- endif %}
+
+
+def get_pre_commit_env() -> Dict[str, str]:
+    """Returns the environment pointing pre-commit at hook environments cached by a hash of .pre-commit-config.yaml.
+
+    Every session, worktree and checkout with the same config shares its hook environments, while changing the config
+    starts a fresh cache rather than growing the previous one. An explicitly set PRE_COMMIT_HOME is left alone.
+    """
+    if "PRE_COMMIT_HOME" in os.environ:
+        return {}
+    config_hash: str = hashlib.sha256(PRE_COMMIT_CONFIG.read_bytes()).hexdigest()[:16]
+    return {"PRE_COMMIT_HOME": str(PRE_COMMIT_CACHE_FOLDER / config_hash)}
+
+
+def python_version_args(python_versions: list[str]) -> list[str]:
+    """Returns the script arguments for the provided Python versions."""
+    return [f"--python={python_version}" for python_version in python_versions]
+
+
+def optimize_args(levels: list[str]) -> list[str]:
+    """Returns the bytecode script arguments for the provided optimization levels."""
+    return [f"--optimize={level}" for level in levels]
+
+
+def locked_requirement(name: str) -> str:
+    """Returns a requirement pinning the package to its version in uv.lock, or the bare name if it isn't locked.
+
+    uv.lock is matched with a regex rather than parsed since tomllib isn't available on every supported Python.
+
+    Args:
+        name: The package name as it appears in uv.lock.
+    """
+    if not LOCKFILE.exists():
+        return name
+
+    pattern: re.Pattern = re.compile(rf'^name = "{re.escape(name)}"\nversion = "([^"]+)"', flags=re.MULTILINE)
+    match: Optional[re.Match] = pattern.search(LOCKFILE.read_text(encoding="utf-8"))
+    return name if match is None else f"{name}=={match.group(1)}"
+
+
 def activate_virtualenv_in_precommit_hooks(session: Session) -> None:
     """Activate virtualenv in hooks installed by pre-commit.
 
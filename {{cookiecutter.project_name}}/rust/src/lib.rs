@@ -7,7 +7,9 @@ fn sum_as_string(a: usize, b: usize) -> PyResult<String> {
 }
 
 /// A Python module implemented in Rust.
-#[pymodule]
+///
+/// Declared as safe to use without the GIL so that importing it on free-threaded Python doesn't re-enable the GIL.
+#[pymodule(gil_used = false)]
 fn {{cookiecutter.package_name}}(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(sum_as_string, m)?)?;
     Ok(())
@@ -0,0 +1,150 @@
+"""Script responsible for measuring how fan-out I/O in the {{cookiecutter.project_name}} package scales with concurrency.
+
+A local stub server replies to each request after a fixed latency, standing in for a remote service. The same requests
+are made one at a time and then through gather_bounded at each concurrency limit, reporting the throughput and its
+speedup over the sequential run. Must be run in an environment with the package installed.
+"""
+
+import argparse
+import asyncio
+import json
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from typing import Coroutine
+from typing import Optional
+
+from {{cookiecutter.package_name}}.concurrency import gather_bounded
+
+
+class LatencyHandler(socketserver.StreamRequestHandler):
+    """Echoes a line back after sleeping for the server's latency."""
+
+    server: "LatencyServer"
+
+    def handle(self) -> None:
+        """Handles a single request."""
+        line: bytes = self.rfile.readline()
+        time.sleep(self.server.latency)
+        self.wfile.write(line)
+
+
+class LatencyServer(socketserver.ThreadingTCPServer):
+    """A local server that handles every connection in a thread of its own."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, latency: float) -> None:
+        """Binds to a free port on localhost."""
+        super().__init__(("127.0.0.1", 0), LatencyHandler)
+        self.latency: float = latency
+
+
+def main() -> None:
+    """Parses args and passes through to benchmark_fanout."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    sys.exit(
+        benchmark_fanout(
+            requests=args.requests, limits=args.limits or [4, 16, 64], latency=args.latency, output=args.output
+        )
+    )
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for benchmark-fanout."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="benchmark-fanout", usage="python ./scripts/benchmark-fanout.py -l 8 -l 32"
+    )
+    parser.add_argument(
+        "-n",
+        "--requests",
+        type=int,
+        default=200,
+        help="Number of requests made by each run.",
+    )
+    parser.add_argument(
+        "-l",
+        "--limit",
+        dest="limits",
+        type=int,
+        action="append",
+        help="A concurrency limit to measure. May be passed multiple times, defaults to 4, 16 and 64.",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.01,
+        help="Seconds the stub server waits before replying to each request.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Path to write the results to as JSON.",
+    )
+    return parser
+
+
+async def fetch(port: int, index: int) -> int:
+    """Makes a single request to the stub server, returning the echoed index."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"{index}\n".encode())
+        await writer.drain()
+        return int(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_sequential(port: int, requests: int) -> list[int]:
+    """Makes every request one at a time."""
+    return [await fetch(port, index) for index in range(requests)]
+
+
+async def run_bounded(port: int, requests: int, limit: int) -> list[int]:
+    """Makes every request through gather_bounded."""
+    return await gather_bounded((fetch(port, index) for index in range(requests)), limit=limit)
+
+
+def measure(run: Coroutine[Any, Any, list[int]], requests: int) -> float:
+    """Runs the requests on a fresh event loop, returning the throughput in requests per second."""
+    start: float = time.perf_counter()
+    results: list[int] = asyncio.run(run)
+    seconds: float = time.perf_counter() - start
+    if results != list(range(requests)):
+        raise RuntimeError("The stub server's replies didn't match the requests.")
+    return requests / seconds
+
+
+def benchmark_fanout(requests: int, limits: list[int], latency: float, output: Optional[Path]) -> int:
+    """Reports the throughput of sequential and bounded concurrent requests, returning the exit code."""
+    server: LatencyServer = LatencyServer(latency=latency)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port: int = server.server_address[1]
+    try:
+        throughput: dict[str, float] = {"sequential": measure(run_sequential(port, requests), requests)}
+        for limit in limits:
+            throughput[f"limit={limit}"] = measure(run_bounded(port, requests, limit), requests)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"{requests} requests with {latency * 1000:.1f}ms of latency each")
+    print(" ".join(f"{header:>16}" for header in ["run", "req/s", "speedup"]))
+    for name, value in throughput.items():
+        print(" ".join(f"{cell:>16}" for cell in [name, f"{value:,.0f}", f"{value / throughput['sequential']:.2f}x"]))
+    if output is not None:
+        report: dict[str, Any] = {"requests": requests, "latency": latency, "throughput": throughput}
+        output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
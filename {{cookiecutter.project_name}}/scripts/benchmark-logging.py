@@ -0,0 +1,131 @@
+"""Script responsible for measuring the per-call overhead of logging in the {{cookiecutter.project_name}} package.
+
+Each case logs the same number of records through a handler set up by configure_logging, writing to a temporary file.
+The time spent in the logging calls is reported per call, along with the time spent waiting on exit for a queued
+handler to finish writing, which is the work moved off of the calling thread. Calls below the handler's level measure
+what logging costs a hot loop when it's disabled, both with arguments passed as is and deferred with lazy=True. Must be
+run in an environment with the package installed.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+
+from loguru import logger
+
+from {{cookiecutter.package_name}}.log import LogSettings
+from {{cookiecutter.package_name}}.log import configure_logging
+
+
+class Case(NamedTuple):
+    """A way of logging to measure."""
+
+    name: str
+    level: str
+    serialize: bool
+    enqueue: bool
+    call: Callable[[int], None]
+
+
+class CaseResult(NamedTuple):
+    """The time spent logging in a case."""
+
+    name: str
+    call_ns: float
+    drain_ns: float
+
+
+def expensive(index: int) -> str:
+    """Stands in for an argument that is costly to compute, such as a summary of a large object."""
+    return ",".join(str(value) for value in range(index % 16, index % 16 + 16))
+
+
+CASES: list[Case] = [
+    Case("disabled", "INFO", False, True, lambda index: logger.debug("Processed {}", index)),
+    Case("disabled eager", "INFO", False, True, lambda index: logger.debug("Processed {}", expensive(index))),
+    Case(
+        "disabled lazy",
+        "INFO",
+        False,
+        True,
+        lambda index: logger.opt(lazy=True).debug("Processed {}", lambda: expensive(index)),
+    ),
+    Case("text", "INFO", False, False, lambda index: logger.info("Processed {}", index)),
+    Case("text enqueue", "INFO", False, True, lambda index: logger.info("Processed {}", index)),
+    Case("json", "INFO", True, False, lambda index: logger.info("Processed {}", index)),
+    Case("json enqueue", "INFO", True, True, lambda index: logger.info("Processed {}", index)),
+]
+
+
+def main() -> None:
+    """Parses args and passes through to benchmark_logging."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    sys.exit(benchmark_logging(calls=args.calls, output=args.output))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for benchmark-logging."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="benchmark-logging", usage="python ./scripts/benchmark-logging.py -n 100000"
+    )
+    parser.add_argument(
+        "-n",
+        "--calls",
+        type=int,
+        default=20_000,
+        help="Number of logging calls made by each case.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Path to write the results to as JSON.",
+    )
+    return parser
+
+
+def measure(case: Case, calls: int, folder: Path) -> CaseResult:
+    """Logs from the case the given number of times, returning the time spent per call."""
+    settings: LogSettings = LogSettings(
+        level=case.level, serialize=case.serialize, sink=folder / f"{case.name}.log", enqueue=case.enqueue
+    )
+    with configure_logging(settings):
+        start: float = time.perf_counter()
+        for index in range(calls):
+            case.call(index)
+        called: float = time.perf_counter()
+    drained: float = time.perf_counter()
+    return CaseResult(name=case.name, call_ns=(called - start) * 1e9 / calls, drain_ns=(drained - called) * 1e9 / calls)
+
+
+def benchmark_logging(calls: int, output: Optional[Path]) -> int:
+    """Reports the overhead of each case, returning the exit code."""
+    with tempfile.TemporaryDirectory(prefix="benchmark-logging-") as folder:
+        results: list[CaseResult] = [measure(case=case, calls=calls, folder=Path(folder)) for case in CASES]
+
+    print(f"{calls:,} calls per case")
+    print(" ".join(f"{header:>16}" for header in ["case", "call ns", "drain ns", "total ns"]))
+    for result in results:
+        cells: list[str] = [
+            result.name,
+            f"{result.call_ns:,.0f}",
+            f"{result.drain_ns:,.0f}",
+            f"{result.call_ns + result.drain_ns:,.0f}",
+        ]
+        print(" ".join(f"{cell:>16}" for cell in cells))
+    if output is not None:
+        report: dict[str, Any] = {"calls": calls, "results": [result._asdict() for result in results]}
+        output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
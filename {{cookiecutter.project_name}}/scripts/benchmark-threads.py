@@ -0,0 +1,227 @@
+"""Script responsible for measuring how the {{cookiecutter.project_name}} package scales across threads.
+
+A function from the package is called repeatedly from an increasing number of threads, once with the GIL enabled and
+once with it disabled, each in a fresh interpreter since the GIL can only be toggled at startup through PYTHON_GIL. On
+a build of Python without free-threading only the GIL enabled run is possible. The function defaults to the package's
+command, and any other function of the package that takes no arguments can be passed with --function instead.
+
+Before benchmarking, the package is imported in an interpreter left to decide for itself whether to enable the GIL. An
+extension module that doesn't declare support for running without the GIL re-enables it on import, which is reported
+as a failure.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import sysconfig
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+
+def main() -> None:
+    """Parses args and passes through to benchmark_threads."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    thread_counts: list[int] = args.thread_counts or get_default_thread_counts()
+    function_path: str = args.function or f"{args.package}.__main__:main"
+    if args.worker:
+        function: Callable[[], Any] = load_function(function_path)
+        print(
+            json.dumps(measure_throughput(function=function, thread_counts=thread_counts, iterations=args.iterations))
+        )
+        return
+    sys.exit(
+        benchmark_threads(
+            package=args.package,
+            function_path=function_path,
+            thread_counts=thread_counts,
+            iterations=args.iterations,
+            output=args.output,
+        )
+    )
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for benchmark-threads."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="benchmark-threads",
+        usage="python ./scripts/benchmark-threads.py {{cookiecutter.package_name}} -t 1 -t 4",
+    )
+    parser.add_argument(
+        "package",
+        metavar="PACKAGE",
+        help="Name of the package that must import without re-enabling the GIL.",
+    )
+    parser.add_argument(
+        "-f",
+        "--function",
+        metavar="MODULE:FUNCTION",
+        help="Import path of the package function to call, which must take no arguments. Defaults to the command.",
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        dest="thread_counts",
+        type=int,
+        action="append",
+        help="A number of threads to measure. May be passed multiple times, defaults to powers of two up to the CPUs.",
+    )
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=200_000,
+        help="Calls to the function made by each thread.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Path to write the results to as JSON.",
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+
+def get_default_thread_counts() -> list[int]:
+    """Returns the powers of two up to the number of CPUs, always including the number of CPUs itself."""
+    cpu_count: int = os.cpu_count() or 1
+    thread_counts: list[int] = []
+    count: int = 1
+    while count < cpu_count:
+        thread_counts.append(count)
+        count *= 2
+    return [*thread_counts, cpu_count]
+
+
+def is_free_threaded_build() -> bool:
+    """Checks whether the running interpreter was built with free-threading support."""
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+def load_function(function_path: str) -> Callable[[], Any]:
+    """Imports the function at the import path, given as module:function."""
+    module_name, _, function_name = function_path.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def wait_and_call(barrier: threading.Barrier, function: Callable[[], Any], iterations: int) -> None:
+    """Calls the function repeatedly once every thread is ready, so they all start together."""
+    barrier.wait()
+    for _ in range(iterations):
+        function()
+
+
+def measure_throughput(function: Callable[[], Any], thread_counts: list[int], iterations: int) -> dict[str, Any]:
+    """Calls the function from each number of threads and returns the throughput in calls per second."""
+    throughput: dict[str, float] = {}
+    for thread_count in thread_counts:
+        barrier: threading.Barrier = threading.Barrier(thread_count + 1)
+        threads: list[threading.Thread] = [
+            threading.Thread(target=wait_and_call, args=(barrier, function, iterations)) for _ in range(thread_count)
+        ]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start: float = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        throughput[str(thread_count)] = thread_count * iterations / (time.perf_counter() - start)
+    return {"gil_enabled": is_gil_enabled(), "throughput": throughput}
+
+
+def is_gil_enabled() -> bool:
+    """Checks whether the GIL is currently enabled, which it always is before Python 3.13."""
+    check: Optional[Any] = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def check_package(package: str) -> bool:
+    """Checks that importing the package leaves the GIL disabled on a free-threaded build."""
+    env: dict[str, str] = {key: value for key, value in os.environ.items() if key != "PYTHON_GIL"}
+    code: str = f"import sys, {package}; print(sys._is_gil_enabled())"
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-W", "ignore::RuntimeWarning", "-c", code], env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr, end="", file=sys.stderr)
+        return False
+    return result.stdout.strip() == "False"
+
+
+def run_worker(package: str, function_path: str, thread_counts: list[int], iterations: int, gil: str) -> dict[str, Any]:
+    """Measures the throughput in a fresh interpreter started with the GIL enabled or disabled."""
+    args: list[str] = [
+        sys.executable,
+        __file__,
+        package,
+        "--worker",
+        f"--function={function_path}",
+        "-n",
+        str(iterations),
+    ]
+    args.extend(f"--threads={thread_count}" for thread_count in thread_counts)
+    result: subprocess.CompletedProcess = subprocess.run(
+        args, env={**os.environ, "PYTHON_GIL": gil}, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def benchmark_threads(
+    package: str, function_path: str, thread_counts: list[int], iterations: int, output: Optional[Path]
+) -> int:
+    """Checks the package for free-threading support and reports its thread scaling, returning the exit code."""
+    if not is_free_threaded_build():
+        print(f"Python {sys.version.split()[0]} isn't a free-threaded build, so only the GIL can be measured.")
+        gil_modes: list[str] = ["1"]
+        supports_free_threading: bool = True
+    else:
+        gil_modes = ["1", "0"]
+        supports_free_threading = check_package(package)
+        status: str = "keeps the GIL disabled" if supports_free_threading else "re-enables the GIL"
+        print(f"Importing {package} {status}.")
+
+    print(f"Calling {function_path} {iterations:,} times from each thread.")
+    results: dict[str, dict[str, Any]] = {
+        gil: run_worker(
+            package=package, function_path=function_path, thread_counts=thread_counts, iterations=iterations, gil=gil
+        )
+        for gil in gil_modes
+    }
+    print_report(thread_counts=thread_counts, results=results)
+    if output is not None:
+        report: dict[str, Any] = {
+            "function": function_path,
+            "supports_free_threading": supports_free_threading,
+            "results": results,
+        }
+        output.write_text(json.dumps(report, indent=2))
+    return 0 if supports_free_threading else 1
+
+
+def print_report(thread_counts: list[int], results: dict[str, dict[str, Any]]) -> None:
+    """Prints the throughput and its speedup over a single thread for each number of threads and GIL mode."""
+    headers: list[str] = ["threads"]
+    for gil in results:
+        label: str = "gil" if gil == "1" else "no-gil"
+        headers.extend([f"{label} calls/s", f"{label} speedup"])
+    print(" ".join(f"{header:>16}" for header in headers))
+
+    for thread_count in thread_counts:
+        row: list[str] = [str(thread_count)]
+        for result in results.values():
+            throughput: dict[str, float] = result["throughput"]
+            baseline: float = throughput[str(thread_counts[0])] / thread_counts[0]
+            row.extend([f"{throughput[str(thread_count)]:,.0f}", f"{throughput[str(thread_count)] / baseline:.2f}x"])
+        print(" ".join(f"{cell:>16}" for cell in row))
+
+
+if __name__ == "__main__":
+    main()
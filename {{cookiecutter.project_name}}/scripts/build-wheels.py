@@ -0,0 +1,145 @@
+"""Script responsible for building the wheels of the {{cookiecutter.project_name}} package with maturin.
+
+By default a single abi3 wheel is built, which supports Python {{cookiecutter.min_python_version}} and every later
+version. When Python versions are provided, a version specific wheel is built for each of them instead. Each version
+is built concurrently in its own folder within the cargo target dir so that the builds don't block on each other's
+cargo locks, sharing sccache as their compile cache when it is installed. The abi3 wheel is built in the cargo target
+dir itself, which it shares with the noxfile's other cargo sessions.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import NamedTuple
+
+from util import existing_dir
+from util import find_python
+
+
+TARGET_FOLDER: Path = Path("rust") / "target"
+
+
+class BuildResult(NamedTuple):
+    """The outcome of building a single wheel."""
+
+    name: str
+    returncode: int
+    output: str
+    seconds: float
+
+
+def main() -> None:
+    """Parses args and passes through to build_wheels."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    sys.exit(
+        build_wheels(path=args.path, python_versions=args.python_versions or [], maturin=args.maturin, out=args.out)
+    )
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for build-wheels."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="build-wheels", usage="python ./scripts/build-wheels.py . -p 3.12 -p 3.13"
+    )
+    parser.add_argument(
+        "path",
+        type=existing_dir,
+        metavar="PATH",
+        help="Path to the repo's root directory (must already exist).",
+    )
+    parser.add_argument(
+        "-p",
+        "--python",
+        dest="python_versions",
+        action="append",
+        help="A Python version to build a version specific wheel for. May be passed multiple times.",
+    )
+    parser.add_argument(
+        "--maturin",
+        default="maturin",
+        help="Requirement used to run maturin through uvx.",
+    )
+    parser.add_argument(
+        "-o",
+        "--out",
+        type=Path,
+        default=Path("dist"),
+        help="Directory to write the wheels to.",
+    )
+    return parser
+
+
+def build_wheels(path: Path, python_versions: list[str], maturin: str, out: Path) -> int:
+    """Builds the abi3 wheel, or a wheel for each Python version concurrently, returning the exit code."""
+    if not python_versions:
+        result: BuildResult = build_wheel(
+            path=path, maturin=maturin, out=out, name="abi3", args=["--features", "abi3"], isolated=False
+        )
+        report(result)
+        return result.returncode
+
+    failures: int = 0
+    with ThreadPoolExecutor(max_workers=len(python_versions)) as executor:
+        futures: list[Future] = [
+            executor.submit(
+                build_wheel,
+                path=path,
+                maturin=maturin,
+                out=out,
+                name=python_version,
+                args=["--interpreter", find_python(python_version)],
+                isolated=True,
+            )
+            for python_version in python_versions
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            report(result)
+            failures += result.returncode != 0
+    return 1 if failures else 0
+
+
+def build_wheel(path: Path, maturin: str, out: Path, name: str, args: list[str], isolated: bool) -> BuildResult:
+    """Builds a single release wheel, in a target dir of its own if isolated."""
+    start: float = time.perf_counter()
+    command: list[str] = ["uvx", "--from", maturin, "maturin", "build", "--release", "--out", str(out), *args]
+    process: subprocess.CompletedProcess = subprocess.run(
+        command, cwd=path, env=get_build_env(path=path, name=name, isolated=isolated), capture_output=True, text=True
+    )
+    return BuildResult(
+        name=name,
+        returncode=process.returncode,
+        output=process.stdout + process.stderr,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def get_build_env(path: Path, name: str, isolated: bool) -> dict[str, str]:
+    """Returns the environment for a build, using sccache as the compiler wrapper if it is installed."""
+    target_folder: Path = Path(os.getenv("CARGO_TARGET_DIR", path / TARGET_FOLDER))
+    if isolated:
+        target_folder = target_folder / f"wheel-{name}"
+    env: dict[str, str] = {**os.environ, "CARGO_TARGET_DIR": str(target_folder)}
+    if "RUSTC_WRAPPER" not in env and shutil.which("sccache") is not None:
+        env["RUSTC_WRAPPER"] = "sccache"
+    return env
+
+
+def report(result: BuildResult) -> None:
+    """Prints the outcome of a build, including its output if it failed."""
+    status: str = "built" if result.returncode == 0 else "failed"
+    print(f"{status} {result.name} wheel in {result.seconds:.1f}s")
+    if result.returncode != 0:
+        print(result.output, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
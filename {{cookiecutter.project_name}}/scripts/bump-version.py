@@ -5,11 +5,17 @@ import argparse
 from util import bump_version
 
 
+INCREMENTS: list[str] = ["MAJOR", "MINOR", "PATCH", "PRERELEASE"]
+
+
 def main() -> None:
     """Parses args and passes through to bump_version."""
     parser: argparse.ArgumentParser = get_parser()
     args: argparse.Namespace = parser.parse_args()
-    bump_version(increment=args.increment)
+    if args.increment.upper() in INCREMENTS:
+        bump_version(increment=args.increment.upper())
+    else:
+        bump_version(version=args.increment)
 
 
 def get_parser() -> argparse.ArgumentParser:
@@ -20,8 +26,7 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "increment",
         type=str,
-        help="Increment type to use when preparing the release.",
-        choices=["MAJOR", "MINOR", "PATCH", "PRERELEASE"],
+        help=f"Increment type to use when preparing the release ({', '.join(INCREMENTS)}), or an explicit version.",
     )
     return parser
 
@@ -0,0 +1,61 @@
+"""Script responsible for precompiling the bytecode of the running environment and the project's sources.
+
+Run with the interpreter of the environment to compile, so that its site-packages and version specific bytecode are
+used. Compiling up front at install time means the first import of each module doesn't have to, which otherwise
+dominates the startup of short lived containers and CI jobs.
+"""
+
+import argparse
+import compileall
+import sys
+import sysconfig
+from pathlib import Path
+
+from util import existing_dir
+
+
+def main() -> None:
+    """Parses args and passes through to compile_bytecode."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    sys.exit(compile_bytecode(path=args.path, levels=args.levels or [0]))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for compile-bytecode."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="compile-bytecode", usage="python ./scripts/compile-bytecode.py . -o 0 -o 2"
+    )
+    parser.add_argument(
+        "path",
+        type=existing_dir,
+        metavar="PATH",
+        help="Path to the repo's root directory (must already exist).",
+    )
+    parser.add_argument(
+        "-o",
+        "--optimize",
+        dest="levels",
+        type=int,
+        choices=[0, 1, 2],
+        action="append",
+        help="An optimization level to compile bytecode at. May be passed multiple times, defaults to 0.",
+    )
+    return parser
+
+
+def compile_bytecode(path: Path, levels: list[int]) -> int:
+    """Compiles site-packages and the project's sources at each optimization level, returning 1 if any failed."""
+    folders: set[Path] = {Path(sysconfig.get_path(name)) for name in ("purelib", "platlib")}
+    folders.add(path / "src")
+    succeeded: bool = all(
+        compileall.compile_dir(folder, quiet=1, workers=0, optimize=levels)
+        for folder in sorted(folders)
+        if folder.is_dir()
+    )
+    print(f"Compiled bytecode at -o {', '.join(map(str, levels))} for {', '.join(map(str, sorted(folders)))}")
+    return 0 if succeeded else 1
+
+
+if __name__ == "__main__":
+    main()
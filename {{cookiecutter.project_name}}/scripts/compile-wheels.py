@@ -0,0 +1,182 @@
+"""Script responsible for shipping precompiled bytecode inside the {{cookiecutter.project_name}} wheels.
+
+Installers that don't compile bytecode, such as uv by default, otherwise leave the first import of every module in a
+fresh environment to pay for compiling it. Each wheel has bytecode added for every provided Python version and
+optimization level, compiled by that version's own interpreter, and then its RECORD is rewritten to include it.
+
+The bytecode uses checked hash based invalidation rather than timestamps, since installers don't preserve the mtimes
+of the sources. Every wheel is then verified from within each interpreter, which fails the build if any source is
+missing bytecode, or has bytecode with the wrong magic number, the wrong source hash, or a body that can't be loaded.
+"""
+
+import argparse
+import base64
+import hashlib
+import subprocess
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from util import existing_dir
+from util import find_python
+
+
+# Run by each target interpreter so its own magic number and source hash are checked against
+VERIFY_SOURCE: str = """
+import importlib.util
+import marshal
+import sys
+from pathlib import Path
+
+root = Path(sys.argv[1])
+for source in sorted(root.rglob("*.py")):
+    relative = source.relative_to(root)
+    if relative.parts[0].endswith((".dist-info", ".data")):
+        continue
+    source_hash = importlib.util.source_hash(source.read_bytes())
+    for level in sys.argv[2:]:
+        cache = Path(importlib.util.cache_from_source(str(source), optimization="" if level == "0" else level))
+        name = f"{relative} (-o {level})"
+        if not cache.is_file():
+            print(f"{name}: missing {cache.name}")
+            continue
+        data = cache.read_bytes()
+        if data[:4] != importlib.util.MAGIC_NUMBER:
+            print(f"{name}: bad magic number in {cache.name}")
+        elif int.from_bytes(data[4:8], "little") != 0b11 or data[8:16] != source_hash:
+            print(f"{name}: {cache.name} is not a checked hash of the current source")
+        else:
+            try:
+                marshal.loads(data[16:])
+            except (EOFError, ValueError, TypeError):
+                print(f"{name}: {cache.name} can't be loaded")
+"""
+
+
+def main() -> None:
+    """Parses args and passes through to compile_wheels."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    sys.exit(
+        compile_wheels(
+            dist=args.dist,
+            python_versions=args.python_versions,
+            levels=args.levels or [0],
+            verify_only=args.verify_only,
+        )
+    )
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for compile-wheels."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="compile-wheels", usage="python ./scripts/compile-wheels.py dist -p 3.12 -p 3.13 -o 0 -o 2"
+    )
+    parser.add_argument(
+        "dist",
+        type=existing_dir,
+        metavar="DIST",
+        help="Path to the folder containing the wheels (must already exist).",
+    )
+    parser.add_argument(
+        "-p",
+        "--python",
+        dest="python_versions",
+        action="append",
+        required=True,
+        help="A Python version to compile bytecode for. May be passed multiple times.",
+    )
+    parser.add_argument(
+        "-o",
+        "--optimize",
+        dest="levels",
+        type=int,
+        choices=[0, 1, 2],
+        action="append",
+        help="An optimization level to compile bytecode at. May be passed multiple times, defaults to 0.",
+    )
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Only verify the bytecode already in the wheels without adding any.",
+    )
+    return parser
+
+
+def compile_wheels(dist: Path, python_versions: list[str], levels: list[int], verify_only: bool) -> int:
+    """Adds bytecode to every wheel in dist if requested and verifies it, returning 1 if any wheel is invalid."""
+    wheels: list[Path] = sorted(dist.glob("*.whl"))
+    if not wheels:
+        print(f"No wheels found in {dist}.", file=sys.stderr)
+        return 1
+
+    interpreters: dict[str, str] = {python_version: find_python(python_version) for python_version in python_versions}
+    level_args: list[str] = [str(level) for level in levels]
+    failed: bool = False
+    for wheel in wheels:
+        wheel_failed: bool = False
+        with tempfile.TemporaryDirectory(prefix="compile-wheels-") as folder:
+            root: Path = Path(folder)
+            with zipfile.ZipFile(wheel) as archive:
+                archive.extractall(root)
+            if not verify_only:
+                for interpreter in interpreters.values():
+                    compile_tree(interpreter=interpreter, root=root, levels=level_args)
+                repack_wheel(root=root, wheel=wheel)
+
+            for python_version, interpreter in interpreters.items():
+                problems: list[str] = verify_tree(interpreter=interpreter, root=root, levels=level_args)
+                for problem in problems:
+                    print(f"{wheel.name} py{python_version}: {problem}", file=sys.stderr)
+                wheel_failed = wheel_failed or bool(problems)
+        if not wheel_failed:
+            print(
+                f"Verified bytecode in {wheel.name} for py{', py'.join(python_versions)} at -o {', '.join(level_args)}"
+            )
+        failed = failed or wheel_failed
+    return 1 if failed else 0
+
+
+def compile_tree(interpreter: str, root: Path, levels: list[str]) -> None:
+    """Compiles every source in the extracted wheel with the interpreter at each optimization level."""
+    level_args: list[str] = [arg for level in levels for arg in ("-o", level)]
+    subprocess.run(
+        [interpreter, "-m", "compileall", "-q", "-j", "0", "--invalidation-mode", "checked-hash", *level_args, root],
+        check=True,
+    )
+
+
+def verify_tree(interpreter: str, root: Path, levels: list[str]) -> list[str]:
+    """Returns the problems found by the interpreter with the bytecode in the extracted wheel."""
+    result: subprocess.CompletedProcess = subprocess.run(
+        [interpreter, "-c", VERIFY_SOURCE, root, *levels], capture_output=True, text=True, check=True
+    )
+    return result.stdout.splitlines()
+
+
+def repack_wheel(root: Path, wheel: Path) -> None:
+    """Replaces the wheel with the contents of the extracted folder, rewriting its RECORD to match."""
+    record: Path = next(root.glob("*.dist-info/RECORD"))
+    files: list[Path] = sorted(path for path in root.rglob("*") if path.is_file() and path != record)
+    lines: list[str] = [
+        f"{path.relative_to(root).as_posix()},{get_record_hash(path)},{path.stat().st_size}" for path in files
+    ]
+    lines.append(f"{record.relative_to(root).as_posix()},,")
+    record.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    # The dist-info folder goes last, as recommended by the wheel spec, with RECORD as the very last entry
+    files.sort(key=lambda path: path.relative_to(root).parts[0].endswith(".dist-info"))
+    with zipfile.ZipFile(wheel, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path in [*files, record]:
+            archive.write(path, path.relative_to(root).as_posix())
+
+
+def get_record_hash(path: Path) -> str:
+    """Returns the hash of the file in the format used by RECORD."""
+    digest: bytes = hashlib.sha256(path.read_bytes()).digest()
+    return "sha256=" + base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+if __name__ == "__main__":
+    main()
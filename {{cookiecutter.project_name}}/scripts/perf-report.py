@@ -0,0 +1,381 @@
+"""Script responsible for tracking the {{cookiecutter.project_name}} test suite's performance over time.
+
+Each run ingests the JUnit results written by tests-python for every interpreter along with coverage.xml into a SQLite
+history, then renders the whole history as a static HTML dashboard showing the suite duration and coverage over time,
+the change in each interpreter's duration since the previous run, and the slowest and most regressed tests.
+
+Artifacts that are identical to an already ingested run are skipped, so running the report repeatedly without running
+the tests in between doesn't add duplicate runs.
+"""
+
+import argparse
+import hashlib
+import html
+import re
+import sqlite3
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Optional
+
+from util import existing_dir
+
+
+RESULTS_FOLDER: Path = Path("tests") / "results"
+JUNIT_PATTERN: re.Pattern = re.compile(r"test-results-py(\d)(\d+t?)\.xml")
+COVERAGE_XML: Path = Path("coverage.xml")
+DEFAULT_OUTPUT_FOLDER: Path = Path("perf-report")
+TEST_LIMIT: int = 20
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    revision TEXT,
+    digest TEXT NOT NULL UNIQUE,
+    line_rate REAL,
+    branch_rate REAL
+);
+CREATE TABLE IF NOT EXISTS suites (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    python TEXT NOT NULL,
+    duration REAL NOT NULL,
+    tests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    skipped INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    python TEXT NOT NULL,
+    name TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tests_by_run ON tests (run_id, python, name);
+"""
+TESTS_QUERY: str = """
+SELECT latest.python, latest.name, latest.duration, latest.outcome, previous.duration
+FROM tests AS latest
+LEFT JOIN tests AS previous ON previous.run_id = ? AND previous.python = latest.python AND previous.name = latest.name
+WHERE latest.run_id = ?
+"""
+SLOWEST_QUERY: str = TESTS_QUERY + "ORDER BY latest.duration DESC LIMIT ?"
+SLOWDOWNS_QUERY: str = (
+    TESTS_QUERY + "AND previous.duration IS NOT NULL ORDER BY latest.duration - previous.duration DESC LIMIT ?"
+)
+
+PAGE_TEMPLATE: str = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{{cookiecutter.project_name}} performance</title>
+<style>
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; margin-bottom: 1em; }
+th, td { border: 1px solid #ccc; padding: 0.25em 0.5em; text-align: left; font-size: 0.9em; }
+</style>
+</head>
+<body>
+<h1>{{cookiecutter.project_name}} performance</h1>
+$body
+</body>
+</html>
+"""
+
+CHART_WIDTH: int = 720
+CHART_HEIGHT: int = 200
+CHART_PADDING: int = 40
+CHART_COLORS: list[str] = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f"]
+
+
+def main() -> None:
+    """Parses args and passes through to perf_report."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    output: Path = args.output or args.path / DEFAULT_OUTPUT_FOLDER
+    perf_report(
+        path=args.path,
+        history=args.history or output / "history.sqlite3",
+        output=output,
+        ingest=not args.no_ingest,
+    )
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for perf-report."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="perf-report", usage="python ./scripts/perf-report.py . -o perf-report"
+    )
+    parser.add_argument(
+        "path",
+        type=existing_dir,
+        metavar="PATH",
+        help="Path to the repo's root directory (must already exist).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Folder to write the dashboard to, defaults to ./perf-report.",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        help="Path of the SQLite history, defaults to history.sqlite3 in the output folder.",
+    )
+    parser.add_argument(
+        "--no-ingest",
+        action="store_true",
+        help="Only render the existing history without ingesting the current artifacts.",
+    )
+    return parser
+
+
+def perf_report(path: Path, history: Path, output: Path, ingest: bool) -> None:
+    """Ingests the current artifacts into the history if requested and renders the dashboard."""
+    history.parent.mkdir(parents=True, exist_ok=True)
+    connection: sqlite3.Connection = sqlite3.connect(history)
+    try:
+        connection.executescript(SCHEMA)
+        if ingest:
+            ingest_artifacts(path=path, connection=connection)
+        output.mkdir(parents=True, exist_ok=True)
+        dashboard: Path = output / "index.html"
+        dashboard.write_text(render_dashboard(connection), encoding="utf-8")
+        print(f"Wrote performance dashboard to {dashboard}")
+    finally:
+        connection.close()
+
+
+def ingest_artifacts(path: Path, connection: sqlite3.Connection) -> None:
+    """Records the JUnit results and coverage of the latest test runs as a new run in the history."""
+    junit_paths: dict[str, Path] = {}
+    for junit_path in sorted((path / RESULTS_FOLDER).glob("test-results-py*.xml")):
+        match: Optional[re.Match] = JUNIT_PATTERN.fullmatch(junit_path.name)
+        if match is not None:
+            junit_paths[f"{match.group(1)}.{match.group(2)}"] = junit_path
+    if not junit_paths:
+        print(f"No JUnit results found in {path / RESULTS_FOLDER}, run tests-python first.", file=sys.stderr)
+        return
+
+    coverage_path: Path = path / COVERAGE_XML
+    digest = hashlib.sha256()
+    for artifact in [*junit_paths.values(), coverage_path]:
+        if artifact.is_file():
+            digest.update(artifact.name.encode())
+            digest.update(artifact.read_bytes())
+    if connection.execute("SELECT 1 FROM runs WHERE digest = ?", (digest.hexdigest(),)).fetchone():
+        print("The current artifacts are already in the history, skipping ingestion.")
+        return
+
+    line_rate, branch_rate = read_coverage(coverage_path)
+    with connection:
+        run_id: Optional[int] = connection.execute(
+            "INSERT INTO runs (created, revision, digest, line_rate, branch_rate) VALUES (?, ?, ?, ?, ?)",
+            (
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                get_revision(path),
+                digest.hexdigest(),
+                line_rate,
+                branch_rate,
+            ),
+        ).lastrowid
+        for python, junit_path in junit_paths.items():
+            ingest_junit(connection=connection, run_id=run_id, python=python, junit_path=junit_path)
+    print(f"Ingested {len(junit_paths)} JUnit result(s) as run {run_id}.")
+
+
+def ingest_junit(connection: sqlite3.Connection, run_id: Optional[int], python: str, junit_path: Path) -> None:
+    """Records the suite and test durations of a single interpreter's JUnit results."""
+    root: ET.Element = ET.parse(junit_path).getroot()  # noqa: S314
+    suites: list[ET.Element] = [root] if root.tag == "testsuite" else root.findall("testsuite")
+
+    tests: list[tuple[str, float, str]] = []
+    for testcase in root.iter("testcase"):
+        name: str = f"{testcase.get('classname', '')}::{testcase.get('name', '')}".lstrip(":")
+        tests.append((name, float(testcase.get("time", 0)), get_outcome(testcase)))
+    connection.executemany(
+        "INSERT INTO tests (run_id, python, name, duration, outcome) VALUES (?, ?, ?, ?, ?)",
+        [(run_id, python, *test) for test in tests],
+    )
+    connection.execute(
+        "INSERT INTO suites (run_id, python, duration, tests, failures, skipped) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            run_id,
+            python,
+            sum(float(suite.get("time", 0)) for suite in suites),
+            len(tests),
+            sum(outcome in ("failed", "error") for _, _, outcome in tests),
+            sum(outcome == "skipped" for _, _, outcome in tests),
+        ),
+    )
+
+
+def get_outcome(testcase: ET.Element) -> str:
+    """Returns the outcome of a JUnit testcase."""
+    for tag, outcome in (("failure", "failed"), ("error", "error"), ("skipped", "skipped")):
+        if testcase.find(tag) is not None:
+            return outcome
+    return "passed"
+
+
+def read_coverage(coverage_path: Path) -> tuple[Optional[float], Optional[float]]:
+    """Returns the line and branch rates from coverage.xml as percentages, if it exists."""
+    if not coverage_path.is_file():
+        return None, None
+    root: ET.Element = ET.parse(coverage_path).getroot()  # noqa: S314
+    return float(root.get("line-rate", 0)) * 100, float(root.get("branch-rate", 0)) * 100
+
+
+def get_revision(path: Path) -> Optional[str]:
+    """Returns the short hash of the checked out commit, if the path is a git repo."""
+    try:
+        result: subprocess.CompletedProcess = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=path, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def render_dashboard(connection: sqlite3.Connection) -> str:
+    """Returns the dashboard for the whole history as a standalone HTML page."""
+    runs: list[tuple[int, str, Optional[str], Optional[float], Optional[float]]] = connection.execute(
+        "SELECT id, created, revision, line_rate, branch_rate FROM runs ORDER BY id"
+    ).fetchall()
+    if not runs:
+        return render_page("<p>No runs have been recorded yet. Run tests-python and then perf-report.</p>")
+
+    labels: list[str] = [f"#{run_id} {revision or ''} {created[:16]}" for run_id, created, revision, _, _ in runs]
+    run_index: dict[int, int] = {run[0]: index for index, run in enumerate(runs)}
+    durations: dict[str, list[tuple[int, float]]] = {}
+    for run_id, python, duration in connection.execute("SELECT run_id, python, duration FROM suites ORDER BY run_id"):
+        durations.setdefault(python, []).append((run_index[run_id], duration))
+    coverage: dict[str, list[tuple[int, float]]] = {
+        name: [(index, run[column]) for index, run in enumerate(runs) if run[column] is not None]
+        for name, column in (("lines", 3), ("branches", 4))
+    }
+
+    latest_id: int = runs[-1][0]
+    previous_id: Optional[int] = runs[-2][0] if len(runs) > 1 else None
+    sections: list[str] = [
+        "<h2>Suite duration (s)</h2>",
+        render_line_chart(durations, labels),
+        "<h2>Coverage (%)</h2>",
+        render_line_chart({name: points for name, points in coverage.items() if points}, labels),
+        f"<h2>Latest run: {html.escape(labels[-1])}</h2>",
+        render_suite_table(connection, latest_id=latest_id, previous_id=previous_id),
+        f"<h2>Slowest tests in the latest run (top {TEST_LIMIT})</h2>",
+        render_test_table(connection, latest_id=latest_id, previous_id=previous_id, slowdowns=False),
+    ]
+    if previous_id is not None:
+        sections.extend(
+            [
+                f"<h2>Largest slowdowns since the previous run (top {TEST_LIMIT})</h2>",
+                render_test_table(connection, latest_id=latest_id, previous_id=previous_id, slowdowns=True),
+            ]
+        )
+    return render_page("\n".join(sections))
+
+
+def render_suite_table(connection: sqlite3.Connection, latest_id: int, previous_id: Optional[int]) -> str:
+    """Returns a table of each interpreter's suite in the latest run along with its change in duration."""
+    rows: list[tuple[str, float, int, int, int, Optional[float]]] = connection.execute(
+        """
+        SELECT latest.python, latest.duration, latest.tests, latest.failures, latest.skipped, previous.duration
+        FROM suites AS latest
+        LEFT JOIN suites AS previous ON previous.run_id = ? AND previous.python = latest.python
+        WHERE latest.run_id = ?
+        ORDER BY latest.python
+        """,
+        (previous_id, latest_id),
+    ).fetchall()
+    cells: list[list[str]] = [
+        [python, f"{duration:.2f}", format_change(duration, previous), str(tests), str(failures), str(skipped)]
+        for python, duration, tests, failures, skipped, previous in rows
+    ]
+    return render_table(["Python", "Duration (s)", "Change", "Tests", "Failed", "Skipped"], cells)
+
+
+def render_test_table(
+    connection: sqlite3.Connection, latest_id: int, previous_id: Optional[int], slowdowns: bool
+) -> str:
+    """Returns a table of the latest run's slowest tests, or of its largest slowdowns since the previous run."""
+    query: str = SLOWDOWNS_QUERY if slowdowns else SLOWEST_QUERY
+    rows: list[tuple[str, str, float, str, Optional[float]]] = connection.execute(
+        query, (previous_id, latest_id, TEST_LIMIT)
+    ).fetchall()
+    cells: list[list[str]] = [
+        [python, name, f"{duration:.3f}", format_change(duration, previous), outcome]
+        for python, name, duration, outcome, previous in rows
+    ]
+    return render_table(["Python", "Test", "Duration (s)", "Change", "Outcome"], cells)
+
+
+def format_change(current: float, previous: Optional[float]) -> str:
+    """Returns the change from the previous value in seconds and as a percentage."""
+    if previous is None:
+        return "new"
+    percentage: str = f" ({(current - previous) / previous:+.0%})" if previous else ""
+    return f"{current - previous:+.3f}{percentage}"
+
+
+def render_table(headers: list[str], rows: list[list[str]]) -> str:
+    """Returns an HTML table with escaped cells."""
+    head: str = "".join(f"<th>{html.escape(header)}</th>" for header in headers)
+    body: str = "".join("<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>" for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def render_line_chart(series: dict[str, list[tuple[int, float]]], labels: list[str]) -> str:
+    """Returns an inline SVG line chart of each series, with the run labels shown as point tooltips."""
+    values: list[float] = [value for points in series.values() for _, value in points]
+    if not values:
+        return "<p>No data recorded yet.</p>"
+
+    top: float = max(values) * 1.1 or 1.0
+    plot_width: int = CHART_WIDTH - 2 * CHART_PADDING
+    plot_height: int = CHART_HEIGHT - 2 * CHART_PADDING
+
+    def x(index: int) -> float:
+        return CHART_PADDING + (plot_width * index / (len(labels) - 1) if len(labels) > 1 else plot_width / 2)
+
+    def y(value: float) -> float:
+        return CHART_HEIGHT - CHART_PADDING - plot_height * value / top
+
+    elements: list[str] = [
+        f'<line x1="{CHART_PADDING}" y1="{y(0):.1f}" x2="{CHART_WIDTH - CHART_PADDING}" y2="{y(0):.1f}" '
+        'stroke="#999"/>',
+        f'<text x="4" y="{y(top / 1.1):.1f}" font-size="11">{top / 1.1:.2f}</text>',
+        f'<text x="4" y="{y(0):.1f}" font-size="11">0</text>',
+    ]
+    for number, (name, points) in enumerate(sorted(series.items())):
+        color: str = CHART_COLORS[number % len(CHART_COLORS)]
+        coordinates: str = " ".join(f"{x(index):.1f},{y(value):.1f}" for index, value in points)
+        elements.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{coordinates}"/>')
+        elements.extend(
+            f'<circle cx="{x(index):.1f}" cy="{y(value):.1f}" r="3" fill="{color}">'
+            f"<title>{html.escape(name)} {html.escape(labels[index])}: {value:.2f}</title></circle>"
+            for index, value in points
+        )
+        elements.append(
+            f'<text x="{CHART_WIDTH - CHART_PADDING + 4}" y="{CHART_PADDING + 14 * number}" font-size="11" '
+            f'fill="{color}">{html.escape(name)}</text>'
+        )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{CHART_WIDTH + 60}" height="{CHART_HEIGHT}">'
+        + "".join(elements)
+        + "</svg>"
+    )
+
+
+def render_page(body: str) -> str:
+    """Returns a standalone HTML page around the body."""
+    return PAGE_TEMPLATE.replace("$body", body)
+
+
+if __name__ == "__main__":
+    main()
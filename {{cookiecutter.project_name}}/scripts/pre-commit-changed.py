@@ -0,0 +1,169 @@
+"""Script responsible for running pre-commit against only the files changed since a git ref.
+
+The hooks are split into waves that run one after another. Each wave is made of groups that run concurrently, each as
+its own pre-commit process with every hook outside of the group skipped. pre-commit fails any hook during which files
+in the repo changed, including changes made by another process, so every hook that may rewrite files runs in a wave of
+its own and only the read-only hooks run concurrently. Hooks missing from every wave run in a final group of their own,
+so hooks added to .pre-commit-config.yaml are never skipped.
+
+Since every hook only sees the changed files, pre-commit skips any hook with no matching changed files entirely.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import NamedTuple
+
+import yaml
+from util import existing_dir
+
+
+PRE_COMMIT_CONFIG: Path = Path(".pre-commit-config.yaml")
+
+WAVES: list[list[list[str]]] = [
+    [["end-of-file-fixer", "trailing-whitespace"]],
+    [["ruff-format", "ruff-check"]],
+    [["fmt", "clippy", "cargo-check"]],
+    [["prettier"]],
+    [["check-added-large-files"], ["check-toml"], ["check-yaml"]],
+]
+
+
+class GroupResult(NamedTuple):
+    """The outcome of running a group of hooks."""
+
+    hook_ids: list[str]
+    returncode: int
+    output: str
+    seconds: float
+
+
+def main() -> None:
+    """Parses args and passes through to pre_commit_changed."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    sys.exit(pre_commit_changed(path=args.path, ref=args.ref, staged=args.staged))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for pre-commit-changed."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="pre-commit-changed", usage="python ./scripts/pre-commit-changed.py . --ref develop"
+    )
+    parser.add_argument(
+        "path",
+        type=existing_dir,
+        metavar="PATH",
+        help="Path to the repo's root directory (must already exist).",
+    )
+    parser.add_argument(
+        "-r",
+        "--ref",
+        default="HEAD",
+        help="The git ref to find changed files against, including untracked files.",
+    )
+    parser.add_argument(
+        "-s",
+        "--staged",
+        action="store_true",
+        help="Only check staged files, as the pre-commit git hook does.",
+    )
+    return parser
+
+
+def pre_commit_changed(path: Path, ref: str, staged: bool) -> int:
+    """Runs every wave of hooks against the changed files, returning 1 if any hook failed."""
+    files: list[str] = get_staged_files(path) if staged else get_changed_files(path=path, ref=ref)
+    if not files:
+        print("No changed files to check.")
+        return 0
+
+    hook_ids: list[str] = get_hook_ids(path / PRE_COMMIT_CONFIG)
+    print(f"Checking {len(files)} changed file(s).")
+    # Installing up front keeps the concurrent pre-commit processes from racing to install the same environments
+    install: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-m", "pre_commit", "install-hooks"], cwd=path
+    )
+    if install.returncode != 0:
+        return install.returncode
+
+    failed: bool = False
+    for wave in get_waves(hook_ids):
+        with ThreadPoolExecutor(max_workers=len(wave)) as executor:
+            results: list[GroupResult] = list(
+                executor.map(lambda group: run_group(path=path, group=group, hook_ids=hook_ids, files=files), wave)
+            )
+        for result in results:
+            print(f"{', '.join(result.hook_ids)} ({result.seconds:.1f}s)")
+            print(result.output, end="")
+            failed = failed or result.returncode != 0
+    return 1 if failed else 0
+
+
+def get_changed_files(path: Path, ref: str) -> list[str]:
+    """Returns the existing files that differ from the ref, along with any untracked files."""
+    changed: list[str] = git_lines(path, "diff", "--name-only", "--diff-filter=d", ref)
+    untracked: list[str] = git_lines(path, "ls-files", "--others", "--exclude-standard")
+    return sorted(set(changed + untracked))
+
+
+def get_staged_files(path: Path) -> list[str]:
+    """Returns the staged files that still exist."""
+    return git_lines(path, "diff", "--name-only", "--diff-filter=d", "--cached")
+
+
+def git_lines(path: Path, *args: str) -> list[str]:
+    """Returns the non-empty lines of a git command's output."""
+    result: subprocess.CompletedProcess = subprocess.run(
+        ["git", *args], cwd=path, capture_output=True, text=True, check=True
+    )
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def get_hook_ids(config_path: Path) -> list[str]:
+    """Returns the id of every hook in the pre-commit config, in order."""
+    config: dict[str, Any] = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    return [hook["id"] for repo in config.get("repos", []) for hook in repo.get("hooks", [])]
+
+
+def get_waves(hook_ids: list[str]) -> list[list[list[str]]]:
+    """Returns the waves limited to the configured hooks, with any unplanned hooks in a final wave."""
+    waves: list[list[list[str]]] = []
+    for wave in WAVES:
+        groups: list[list[str]] = [[hook_id for hook_id in group if hook_id in hook_ids] for group in wave]
+        if any(groups):
+            waves.append([group for group in groups if group])
+
+    planned: set[str] = {hook_id for wave in WAVES for group in wave for hook_id in group}
+    unplanned: list[str] = [hook_id for hook_id in hook_ids if hook_id not in planned]
+    if unplanned:
+        waves.append([unplanned])
+    return waves
+
+
+def run_group(path: Path, group: list[str], hook_ids: list[str], files: list[str]) -> GroupResult:
+    """Runs pre-commit against the files with every hook outside of the group skipped."""
+    skipped: list[str] = [hook_id for hook_id in hook_ids if hook_id not in group]
+    start: float = time.perf_counter()
+    process: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-m", "pre_commit", "run", "--color=never", "--files", *files],
+        cwd=path,
+        env={**os.environ, "SKIP": ",".join(skipped)},
+        capture_output=True,
+        text=True,
+    )
+    # Hooks skipped through SKIP are reported without a reason, unlike those with no matching files
+    lines: list[str] = (process.stdout + process.stderr).splitlines(keepends=True)
+    output: str = "".join(line for line in lines if not line.rstrip().endswith(".Skipped"))
+    return GroupResult(
+        hook_ids=group, returncode=process.returncode, output=output, seconds=time.perf_counter() - start
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@ def main() -> None:
     """Parses args and passes through to setup_venv."""
     parser: argparse.ArgumentParser = get_parser()
     args: argparse.Namespace = parser.parse_args()
-    setup_venv(path=args.path, python_version=args.python_version)
+    setup_venv(path=args.path, python_version=args.python_version, levels=args.levels or [])
 
 
 def get_parser() -> argparse.ArgumentParser:
@@ -37,11 +37,20 @@ def get_parser() -> argparse.ArgumentParser:
         dest="python_version",
         help="The Python version that will serve as the main working version used by the IDE.",
     )
+    parser.add_argument(
+        "-o",
+        "--optimize",
+        dest="levels",
+        type=int,
+        choices=[0, 1, 2],
+        action="append",
+        help="An optimization level to precompile the venv's bytecode at. May be passed multiple times.",
+    )
     return parser
 
 
-def setup_venv(path: Path, python_version: str) -> None:
-    """Set up the provided cookiecutter-robust-python project's venv."""
+def setup_venv(path: Path, python_version: str, levels: list[int]) -> None:
+    """Set up the provided cookiecutter-robust-python project's venv, precompiling its bytecode at any levels."""
     commands: list[list[str]] = [
         ["uv", "lock"],
         ["uv", "venv", ".venv"],
@@ -49,6 +58,9 @@ def setup_venv(path: Path, python_version: str) -> None:
         ["uv", "python", "pin", python_version],
         ["uv", "sync", "--all-groups"],
     ]
+    if levels:
+        level_args: list[str] = [f"--optimize={level}" for level in levels]
+        commands.append(["uv", "run", "--no-sync", "python", "scripts/compile-bytecode.py", ".", *level_args])
     check_dependencies(path=path, dependencies=["uv"])
 
     venv_path: Path = path / ".venv"
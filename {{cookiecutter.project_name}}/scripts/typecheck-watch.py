@@ -0,0 +1,92 @@
+"""Script responsible for running Pyright against several Python versions from a single environment.
+
+In watch mode each Pyright process stays alive after its first full analysis and only re-checks the files affected
+by later changes, so the cost of a cold analysis is paid once per version rather than once per run.
+"""
+
+import argparse
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import IO
+from typing import List
+
+from util import existing_dir
+
+
+def main() -> None:
+    """Parses args and passes through to typecheck."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+    sys.exit(typecheck(path=args.path, python_versions=args.python_versions, watch=args.watch))
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for typecheck-watch."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="typecheck-watch", usage="python ./scripts/typecheck-watch.py . -p 3.12 -p 3.13 --watch"
+    )
+    parser.add_argument(
+        "path",
+        type=existing_dir,
+        metavar="PATH",
+        help="Path to the repo's root directory (must already exist).",
+    )
+    parser.add_argument(
+        "-p",
+        "--python",
+        dest="python_versions",
+        action="append",
+        required=True,
+        help="A Python version to type check against. May be passed multiple times.",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep Pyright running and re-check files as they change.",
+    )
+    return parser
+
+
+def typecheck(path: Path, python_versions: List[str], watch: bool) -> int:
+    """Runs Pyright for each Python version concurrently, returning the worst exit code."""
+    processes: List[subprocess.Popen] = [
+        start_pyright(path=path, python_version=python_version, watch=watch) for python_version in python_versions
+    ]
+    threads: List[threading.Thread] = [
+        threading.Thread(target=relay_output, args=(process.stdout, f"[py{python_version}] "), daemon=True)
+        for process, python_version in zip(processes, python_versions)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        return max(process.wait() for process in processes)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for thread in threads:
+            thread.join()
+
+
+def start_pyright(path: Path, python_version: str, watch: bool) -> subprocess.Popen:
+    """Starts a Pyright process for the Python version with its output piped back line by line."""
+    command: List[str] = ["pyright", "--pythonversion", python_version]
+    if watch:
+        command.append("--watch")
+    return subprocess.Popen(command, cwd=path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+
+
+def relay_output(stream: IO[str], prefix: str) -> None:
+    """Writes each line of the stream to stdout with the provided prefix."""
+    for line in stream:
+        sys.stdout.write(f"{prefix}{line}")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
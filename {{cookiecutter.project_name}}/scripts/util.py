@@ -46,6 +46,15 @@ def existing_dir(value: str) -> Path:
     return path
 
 
+def find_python(python_version: str) -> str:
+    """Returns the path of an interpreter for the Python version, installing it through uv if needed."""
+    subprocess.run(["uv", "python", "install", python_version], check=True, capture_output=True)
+    result: subprocess.CompletedProcess = subprocess.run(
+        ["uv", "python", "find", python_version], check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
 def remove_readonly(func: Callable[[str], Any], path: str, _: Any) -> None:
     """Clears the readonly bit and attempts to call the provided function.
 
@@ -82,11 +91,13 @@ def create_release_branch(new_version: str) -> None:
         subprocess.run(command, cwd=REPO_FOLDER, capture_output=True, check=True)
 
 
-def bump_version(increment: Optional[str] = None) -> None:
-    """Bumps the package version."""
+def bump_version(increment: Optional[str] = None, version: Optional[str] = None) -> None:
+    """Bumps the package version, either by the increment or to the explicit version if provided."""
     bump_cmd: list[str] = ["uvx", "--from", "commitizen", "cz", "bump", "--yes", "--files-only", "--changelog"]
     if increment is not None:
         bump_cmd.extend(["--increment", increment])
+    if version is not None:
+        bump_cmd.append(version)
     subprocess.run(bump_cmd, cwd=REPO_FOLDER, check=True)
 
 
@@ -2,6 +2,9 @@
 
 import typer
 
+from {{cookiecutter.package_name}}.log import configure_logging
+from {{cookiecutter.package_name}}.profiling import run
+
 
 app: typer.Typer = typer.Typer()
 
@@ -12,4 +15,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    app()  # pragma: no cover
+    with configure_logging():  # pragma: no cover
+        run(app)
@@ -0,0 +1,82 @@
+"""Async commands and bounded concurrency for fanning out independent I/O.
+
+Commands defined with `async def` are registered through async_command, which runs each invocation on an event loop
+created by asyncio.run and closed once the command returns, along with any tasks or async generators left behind.
+
+Within a command, gather_bounded runs many independent awaitables concurrently while keeping at most a fixed number in
+flight, so that fan-out I/O neither waits on each call in turn nor opens an unbounded number of connections at once.
+"""
+
+import asyncio
+import functools
+import inspect
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Coroutine
+from typing import Iterable
+from typing import Optional
+from typing import TypeVar
+
+from typing_extensions import ParamSpec
+
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def async_command(function: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, T]:
+    """Wraps an async function so it can be registered as a typer command.
+
+    The wrapper keeps the function's signature and annotations, which typer reads to build the command's parameters.
+
+    Args:
+        function: The async function implementing the command.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        return asyncio.run(function(*args, **kwargs))
+
+    return wrapper
+
+
+async def gather_bounded(awaitables: Iterable[Awaitable[T]], limit: int, timeout: Optional[float] = None) -> list[T]:
+    """Awaits every awaitable with at most limit of them running at once, returning their results in order.
+
+    If any awaitable fails or times out, the others are cancelled and the error is raised once they have stopped.
+    Coroutines that never got to start are closed rather than left to warn about never being awaited.
+
+    Args:
+        awaitables: The awaitables to run, usually coroutines such as `fetch(url) for url in urls`.
+        limit: The maximum number of awaitables running at once.
+        timeout: The maximum number of seconds each awaitable may run for, not counting time spent waiting to start.
+
+    Raises:
+        ValueError: If the limit is less than one.
+        asyncio.TimeoutError: If an awaitable runs for longer than the timeout.
+    """
+    if limit < 1:
+        raise ValueError(f"The limit must be at least 1, got {limit}.")
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(limit)
+
+    async def run_bounded(awaitable: Awaitable[T]) -> T:
+        try:
+            async with semaphore:
+                return await asyncio.wait_for(awaitable, timeout=timeout)
+        finally:
+            close_unstarted(awaitable)
+
+    tasks: list[asyncio.Future[T]] = [asyncio.ensure_future(run_bounded(awaitable)) for awaitable in awaitables]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def close_unstarted(awaitable: Awaitable[Any]) -> None:
+    """Closes the awaitable if it's a coroutine that was never started."""
+    if inspect.iscoroutine(awaitable) and inspect.getcoroutinestate(awaitable) == inspect.CORO_CREATED:
+        awaitable.close()
@@ -0,0 +1,144 @@
+"""Logging through loguru, configured from the environment.
+
+The handler is configured by the following environment variables:
+
+- {{ cookiecutter.package_name|upper }}__LOG_LEVEL: the minimum level written, defaulting to INFO.
+- {{ cookiecutter.package_name|upper }}__LOG_FORMAT: text for human readable lines, or json for one serialized record
+  per line, defaulting to text.
+- {{ cookiecutter.package_name|upper }}__LOG_FILE: a file to append to instead of writing to stderr.
+- {{ cookiecutter.package_name|upper }}__LOG_ENQUEUE: 0 to write from the calling thread, rather than handing messages
+  to a background thread through a queue so that slow sinks don't block the caller.
+
+Queued messages are handed over through an in-process queue rather than loguru's own enqueue option, which pickles every
+record through a pipe so that it can be shared across processes, and costs the caller more than writing directly.
+
+Calls below the minimum level return before building a record or formatting the message, so pass values as arguments
+rather than formatting them up front, as in `logger.debug("Loaded {} rows", count)`. Arguments that are expensive to
+compute can be deferred too, as in `logger.opt(lazy=True).debug("Loaded {}", lambda: summarize(rows))`.
+"""
+
+import os
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import TextIO
+from typing import Union
+
+from loguru import logger
+
+
+LOG_LEVEL_ENV_VAR: str = "{{ cookiecutter.package_name|upper }}__LOG_LEVEL"
+LOG_FORMAT_ENV_VAR: str = "{{ cookiecutter.package_name|upper }}__LOG_FORMAT"
+LOG_FILE_ENV_VAR: str = "{{ cookiecutter.package_name|upper }}__LOG_FILE"
+LOG_ENQUEUE_ENV_VAR: str = "{{ cookiecutter.package_name|upper }}__LOG_ENQUEUE"
+
+LOG_FORMATS: tuple[str, ...] = ("text", "json")
+TEXT_FORMAT: str = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+
+
+class LogSettings(NamedTuple):
+    """How records are filtered, formatted and written."""
+
+    level: str
+    serialize: bool
+    sink: Union[TextIO, Path]
+    enqueue: bool
+
+
+def get_log_settings() -> LogSettings:
+    """Returns the settings read from the environment.
+
+    Raises:
+        ValueError: If the log format isn't recognized.
+    """
+    log_format: str = os.getenv(LOG_FORMAT_ENV_VAR, "text").lower()
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format {log_format!r}, expected one of: {', '.join(LOG_FORMATS)}.")
+
+    log_file: Optional[str] = os.getenv(LOG_FILE_ENV_VAR)
+    return LogSettings(
+        level=os.getenv(LOG_LEVEL_ENV_VAR, "INFO").upper(),
+        serialize=log_format == "json",
+        sink=Path(log_file) if log_file else sys.stderr,
+        enqueue=os.getenv(LOG_ENQUEUE_ENV_VAR, "1").lower() not in ("0", "false"),
+    )
+
+
+class QueuedWriter:
+    """A loguru sink that writes messages to a stream from a background thread.
+
+    The stream is only flushed once the queue is empty, so bursts of messages are written together.
+    """
+
+    def __init__(self, stream: TextIO, close: bool) -> None:
+        """Starts the thread writing to the stream.
+
+        Args:
+            stream: The stream to write to.
+            close: Whether to close the stream once stopped.
+        """
+        self._stream: TextIO = stream
+        self._close: bool = close
+        self._queue: queue.SimpleQueue[Optional[str]] = queue.SimpleQueue()
+        self._thread: threading.Thread = threading.Thread(target=self._write_messages, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Queues the message to be written."""
+        self._queue.put(message)
+
+    def isatty(self) -> bool:
+        """Returns whether the stream is a terminal, which loguru checks to decide whether to colorize messages."""
+        return self._stream.isatty()
+
+    def stop(self) -> None:
+        """Waits for every queued message to be written, called by loguru when the handler is removed."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._close:
+            self._stream.close()
+
+    def _write_messages(self) -> None:
+        message: Optional[str] = self._queue.get()
+        while message is not None:
+            self._stream.write(message)
+            if self._queue.empty():
+                self._stream.flush()
+            message = self._queue.get()
+        self._stream.flush()
+
+
+@contextmanager
+def configure_logging(settings: Optional[LogSettings] = None) -> Iterator[int]:
+    """Replaces loguru's handlers with a single one for the body of the with statement, yielding its id.
+
+    The handler is removed on exit, which waits for any queued messages to be written, so none are lost when the process
+    exits without running its atexit hooks.
+
+    Args:
+        settings: The settings of the handler, defaulting to those read from the environment.
+    """
+    settings = settings or get_log_settings()
+    sink: Any = settings.sink
+    if settings.enqueue and isinstance(sink, Path):
+        sink = QueuedWriter(sink.open("a", encoding="utf-8"), close=True)
+    elif settings.enqueue:
+        sink = QueuedWriter(sink, close=False)
+
+    logger.remove()
+    handler_id: int = logger.add(
+        sink, level=settings.level, format=TEXT_FORMAT, serialize=settings.serialize, backtrace=False, diagnose=False
+    )
+    try:
+        yield handler_id
+    finally:
+        logger.remove(handler_id)
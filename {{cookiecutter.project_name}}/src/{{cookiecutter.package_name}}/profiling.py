@@ -0,0 +1,208 @@
+"""Opt-in profiling of a single run of the command-line interface.
+
+Profiling is enabled by setting {{ cookiecutter.package_name|upper }}__PROFILE to one of the following modes:
+
+- cprofile: deterministic profile of every function call, written as pstats data along with a text summary.
+- sample: stack samples taken at a fixed interval, written in the folded format read by flame graph tools.
+- tracemalloc: snapshot of the memory allocated by the end of the run, along with a text summary of the largest sites.
+
+Reports are written to {{ cookiecutter.package_name|upper }}__PROFILE_DIR, defaulting to a profiles folder in the user
+cache directory. When the variable is unset the command is called directly, so there is no overhead.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Callable
+from typing import ContextManager
+from typing import Iterator
+from typing import Optional
+from typing import TypeVar
+
+import platformdirs
+import typer
+
+
+T = TypeVar("T")
+
+PROFILE_ENV_VAR: str = "{{ cookiecutter.package_name|upper }}__PROFILE"
+PROFILE_DIR_ENV_VAR: str = "{{ cookiecutter.package_name|upper }}__PROFILE_DIR"
+
+SAMPLE_INTERVAL: float = 0.001
+TRACEMALLOC_FRAMES: int = 25
+REPORT_LIMIT: int = 50
+
+
+def run(function: Callable[[], T]) -> T:
+    """Calls the function, profiling it if a profile mode is set in the environment.
+
+    Args:
+        function: The command to run, usually the typer app.
+    """
+    mode: Optional[str] = os.getenv(PROFILE_ENV_VAR)
+    if not mode:
+        return function()
+    with profile(mode=mode, profile_dir=get_profile_dir()):
+        return function()
+
+
+def get_profile_dir() -> Path:
+    """Returns the folder reports are written to."""
+    profile_dir: Optional[str] = os.getenv(PROFILE_DIR_ENV_VAR)
+    if profile_dir:
+        return Path(profile_dir)
+    return platformdirs.user_cache_path(appname="{{cookiecutter.project_name}}") / "profiles"
+
+
+@contextmanager
+def profile(mode: str, profile_dir: Path) -> Iterator[list[Path]]:
+    """Profiles the body of the with statement, writing reports even if it raises or exits.
+
+    Args:
+        mode: The profile mode, one of the keys of PROFILERS.
+        profile_dir: The folder to write reports to.
+
+    Raises:
+        ValueError: If the mode isn't recognized.
+    """
+    if mode not in PROFILERS:
+        raise ValueError(f"Unknown profile mode {mode!r}, expected one of: {', '.join(PROFILERS)}.")
+
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    report_path: Path = profile_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{mode}"
+    reports: list[Path] = []
+    try:
+        with PROFILERS[mode](report_path, reports):
+            yield reports
+    finally:
+        for report in reports:
+            typer.echo(f"Wrote {mode} profile to {report}", err=True)
+
+
+@contextmanager
+def profile_cprofile(report_path: Path, reports: list[Path]) -> Iterator[None]:
+    """Profiles every function call with cProfile.
+
+    Args:
+        report_path: The path to write reports to, without a suffix.
+        reports: The list to append the paths of written reports to.
+    """
+    profiler: cProfile.Profile = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(report_path.with_suffix(".prof"))
+        with report_path.with_suffix(".txt").open("w", encoding="utf-8") as stream:
+            pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(REPORT_LIMIT)
+        reports.extend([report_path.with_suffix(".prof"), report_path.with_suffix(".txt")])
+
+
+@contextmanager
+def profile_sample(report_path: Path, reports: list[Path]) -> Iterator[None]:
+    """Samples the stack of the current thread from a background thread.
+
+    Args:
+        report_path: The path to write reports to, without a suffix.
+        reports: The list to append the paths of written reports to.
+    """
+    sampler: StackSampler = StackSampler(thread_id=threading.get_ident(), interval=SAMPLE_INTERVAL)
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        lines: list[str] = [f"{stack} {count}" for stack, count in sampler.counts.most_common()]
+        report_path.with_suffix(".folded").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        reports.append(report_path.with_suffix(".folded"))
+
+
+@contextmanager
+def profile_tracemalloc(report_path: Path, reports: list[Path]) -> Iterator[None]:
+    """Traces memory allocations with tracemalloc and snapshots them at the end.
+
+    Args:
+        report_path: The path to write reports to, without a suffix.
+        reports: The list to append the paths of written reports to.
+    """
+    was_tracing: bool = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        yield
+    finally:
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        if not was_tracing:
+            tracemalloc.stop()
+        snapshot.dump(str(report_path.with_suffix(".tracemalloc")))
+        statistics: list[tracemalloc.Statistic] = snapshot.statistics("lineno")[:REPORT_LIMIT]
+        report_path.with_suffix(".txt").write_text("\n".join(map(str, statistics)) + "\n", encoding="utf-8")
+        reports.extend([report_path.with_suffix(".tracemalloc"), report_path.with_suffix(".txt")])
+
+
+PROFILERS: dict[str, Callable[[Path, list[Path]], ContextManager[None]]] = {
+    "cprofile": profile_cprofile,
+    "sample": profile_sample,
+    "tracemalloc": profile_tracemalloc,
+}
+
+
+class StackSampler:
+    """Counts the stacks of a thread sampled at a fixed interval from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        """Initializes the sampler without starting it.
+
+        Args:
+            thread_id: The identifier of the thread to sample.
+            interval: The seconds to wait between samples.
+        """
+        self.thread_id: int = thread_id
+        self.interval: float = interval
+        self.counts: Counter[str] = Counter()
+        self._stopped: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        """Starts sampling in the background."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling and waits for the background thread to finish."""
+        self._stopped.set()
+        self._thread.join()
+
+    def sample(self) -> None:
+        """Records the current stack of the sampled thread, if it is still running."""
+        frame: Optional[FrameType] = sys._current_frames().get(self.thread_id)  # noqa: SLF001
+        if frame is not None:
+            self.counts[format_stack(frame)] += 1
+
+    def _run(self) -> None:
+        """Samples until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+
+def format_stack(frame: FrameType) -> str:
+    """Returns the stack ending in the frame in the folded format, outermost call first.
+
+    Args:
+        frame: The innermost frame of the stack.
+    """
+    names: list[str] = []
+    current: Optional[FrameType] = frame
+    while current is not None:
+        code = current.f_code
+        names.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        current = current.f_back
+    return ";".join(reversed(names))
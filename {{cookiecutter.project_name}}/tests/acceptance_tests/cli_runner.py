@@ -0,0 +1,250 @@
+"""Runners that invoke the command-line interface in a process of its own, as a user would.
+
+Starting a fresh interpreter and importing typer and {{cookiecutter.package_name}} for every invocation dominates the
+runtime of suites with many invocations. Where fork is available, ForkServerCliRunner starts a single server process
+that imports the app once and then forks a child per invocation, so each one still gets its own process with its own
+exit code, stdio, environment and working directory. SubprocessCliRunner runs `python -m {{cookiecutter.package_name}}`
+for every invocation instead, and is used where fork isn't available or when
+{{ cookiecutter.package_name|upper }}__CLI_RUNNER=subprocess.
+"""
+
+import abc
+import contextlib
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from typing import Mapping
+from typing import NamedTuple
+from typing import NoReturn
+from typing import Optional
+from typing import Sequence
+from typing import Type
+
+from {{cookiecutter.package_name}}.__main__ import app
+from {{cookiecutter.package_name}}.log import configure_logging
+from {{cookiecutter.package_name}}.profiling import run
+
+
+PACKAGE_NAME: str = "{{cookiecutter.package_name}}"
+PROG_NAME: str = f"python -m {PACKAGE_NAME}"
+RUNNER_ENV_VAR: str = "{{ cookiecutter.package_name|upper }}__CLI_RUNNER"
+
+
+class CliResult(NamedTuple):
+    """The outcome of a single invocation of the command-line interface."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+class CliRunner(abc.ABC):
+    """Invokes the command-line interface in a process of its own."""
+
+    @abc.abstractmethod
+    def invoke(
+        self,
+        args: Sequence[str] = (),
+        stdin: str = "",
+        env: Optional[Mapping[str, Optional[str]]] = None,
+        cwd: Optional[Path] = None,
+    ) -> CliResult:
+        """Runs the command-line interface to completion.
+
+        Args:
+            args: The command-line arguments, excluding the program name.
+            stdin: The text written to the command's stdin.
+            env: Environment variables to set, or to unset when their value is None, on top of os.environ.
+            cwd: The working directory of the command, defaulting to the current one.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Releases any resources held by the runner, which runners that hold none needn't override."""
+
+    def __enter__(self) -> "CliRunner":
+        """Returns the runner, closing it when the with statement exits."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the runner."""
+        self.close()
+
+
+class SubprocessCliRunner(CliRunner):
+    """Starts a new interpreter for every invocation."""
+
+    def invoke(
+        self,
+        args: Sequence[str] = (),
+        stdin: str = "",
+        env: Optional[Mapping[str, Optional[str]]] = None,
+        cwd: Optional[Path] = None,
+    ) -> CliResult:
+        """Runs `python -m {{cookiecutter.package_name}}` in a subprocess."""
+        process: subprocess.CompletedProcess = subprocess.run(  # noqa: S603
+            [sys.executable, "-m", PACKAGE_NAME, *args],
+            input=stdin,
+            capture_output=True,
+            encoding="utf-8",
+            env={"PYTHONIOENCODING": "utf-8", **get_env(env)},
+            cwd=cwd,
+        )
+        return CliResult(exit_code=process.returncode, stdout=process.stdout, stderr=process.stderr)
+
+
+class ForkServerCliRunner(CliRunner):  # pragma: no cover - not measured on platforms without fork
+    """Forks every invocation from a server process that has already imported the app.
+
+    Invocations are serialized, so each thread or xdist worker needing concurrency should use a runner of its own.
+    """
+
+    def __init__(self) -> None:
+        """Starts the server, which imports the app before it handles its first invocation."""
+        self._folder: Path = Path(tempfile.mkdtemp(prefix="cli-runner-"))
+        self._lock: threading.Lock = threading.Lock()
+        self._process: subprocess.Popen = subprocess.Popen(  # noqa: S603
+            [sys.executable, __file__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            encoding="utf-8",
+        )
+
+    def invoke(
+        self,
+        args: Sequence[str] = (),
+        stdin: str = "",
+        env: Optional[Mapping[str, Optional[str]]] = None,
+        cwd: Optional[Path] = None,
+    ) -> CliResult:
+        """Runs the app in a child forked from the server, with its stdio redirected to files."""
+        paths: dict[str, Path] = {name: self._folder / name for name in ("stdin", "stdout", "stderr")}
+        with self._lock:
+            paths["stdin"].write_text(stdin, encoding="utf-8")
+            request: dict[str, Any] = {
+                "args": list(args),
+                "env": get_env(env),
+                "cwd": str(cwd or Path.cwd()),
+                **{name: str(path) for name, path in paths.items()},
+            }
+            assert self._process.stdin is not None  # nosec
+            assert self._process.stdout is not None  # nosec
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+                response: str = self._process.stdout.readline()
+            except BrokenPipeError:
+                response = ""
+            if not response:
+                raise RuntimeError(f"The CLI fork server exited with code {self._process.wait()}.")
+            return CliResult(
+                exit_code=json.loads(response)["exit_code"],
+                stdout=paths["stdout"].read_text(encoding="utf-8"),
+                stderr=paths["stderr"].read_text(encoding="utf-8"),
+            )
+
+    def close(self) -> None:
+        """Stops the server and removes the files used for stdio."""
+        if self._process.stdin is not None:
+            with contextlib.suppress(BrokenPipeError):
+                self._process.stdin.close()
+        self._process.wait()
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+        for path in self._folder.iterdir():
+            path.unlink()
+        self._folder.rmdir()
+
+
+def get_cli_runner() -> CliRunner:
+    """Returns a fork server runner where fork is available, falling back to a subprocess runner."""
+    if hasattr(os, "fork") and os.getenv(RUNNER_ENV_VAR, "fork") != "subprocess":
+        return ForkServerCliRunner()
+    return SubprocessCliRunner()
+
+
+def get_env(env: Optional[Mapping[str, Optional[str]]]) -> dict[str, str]:
+    """Returns os.environ with the provided variables set, or unset when their value is None."""
+    merged: dict[str, str] = dict(os.environ)
+    for name, value in (env or {}).items():
+        if value is None:
+            merged.pop(name, None)
+        else:
+            merged[name] = value
+    return merged
+
+
+def invoke_app(args: Sequence[str]) -> int:
+    """Runs the app the same way `python -m {{cookiecutter.package_name}}` does, returning its exit code."""
+    try:
+        with configure_logging():
+            run(lambda: app(list(args), prog_name=PROG_NAME))
+    except SystemExit as exit_:
+        return get_exit_code(exit_.code)
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def get_exit_code(code: Any) -> int:
+    """Returns the process exit code for the code of a SystemExit, printing it to stderr if it's a message."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def serve() -> None:  # pragma: no cover - runs in the fork server, outside of coverage measurement
+    """Handles invocations read from stdin as JSON lines, replying with each one's exit code on stdout."""
+    # typer only imports rich when it renders help or errors, which would otherwise be repeated in every child
+    with contextlib.suppress(ImportError):
+        importlib.import_module("typer.rich_utils")
+
+    for line in sys.stdin:
+        request: dict[str, Any] = json.loads(line)
+        pid: int = os.fork()
+        if pid == 0:
+            run_child(request)
+        _, status = os.waitpid(pid, 0)
+        print(json.dumps({"exit_code": os.waitstatus_to_exitcode(status)}), flush=True)
+
+
+def run_child(request: dict[str, Any]) -> NoReturn:  # pragma: no cover - runs in a forked child
+    """Sets up the process for the invocation, runs it, and exits without returning to the server loop."""
+    exit_code: int = 1
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        for fd, name, flags in ((0, "stdin", os.O_RDONLY), (1, "stdout", os.O_WRONLY), (2, "stderr", os.O_WRONLY)):
+            target: int = os.open(request[name], flags | os.O_CREAT | (os.O_TRUNC if fd else 0))
+            os.dup2(target, fd)
+            os.close(target)
+        sys.stdin = open(0, encoding="utf-8", closefd=False)  # noqa: SIM115
+        sys.stdout = open(1, "w", encoding="utf-8", closefd=False)  # noqa: SIM115
+        sys.stderr = open(2, "w", encoding="utf-8", closefd=False)  # noqa: SIM115
+        sys.argv = [PROG_NAME, *request["args"]]
+        exit_code = invoke_app(request["args"])
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    serve()
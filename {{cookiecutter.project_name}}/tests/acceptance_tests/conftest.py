@@ -1 +1,15 @@
 """Fixtures used in acceptance tests."""
+
+from typing import Iterator
+
+import pytest
+
+from tests.acceptance_tests.cli_runner import CliRunner
+from tests.acceptance_tests.cli_runner import get_cli_runner
+
+
+@pytest.fixture(scope="session")
+def cli() -> Iterator[CliRunner]:
+    """Fixture for invoking the command-line interface in a process of its own, shared by the whole session."""
+    with get_cli_runner() as runner:
+        yield runner
@@ -0,0 +1,141 @@
+"""Test cases for running the command-line interface in a process of its own."""
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from {{cookiecutter.package_name}}.profiling import PROFILE_DIR_ENV_VAR
+from {{cookiecutter.package_name}}.profiling import PROFILE_ENV_VAR
+from tests.acceptance_tests import cli_runner
+from tests.acceptance_tests.cli_runner import CliRunner
+
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork isn't available on this platform")
+
+
+@pytest.fixture(
+    scope="module",
+    params=[pytest.param("fork", marks=requires_fork), "subprocess"],
+)
+def runner(request: FixtureRequest) -> Iterator[CliRunner]:
+    """Fixture for each kind of runner, which should behave identically."""
+    runner_class: type[CliRunner] = (
+        cli_runner.ForkServerCliRunner if request.param == "fork" else cli_runner.SubprocessCliRunner
+    )
+    with runner_class() as runner:
+        yield runner
+
+
+def test_cli_succeeds(cli: CliRunner) -> None:
+    """It exits with a status code of zero."""
+    result = cli.invoke()
+    assert result.exit_code == 0
+
+
+def test_help_is_written_to_stdout(runner: CliRunner) -> None:
+    """It writes the help to stdout under the same program name as python -m."""
+    result = runner.invoke(["--help"])
+    assert result.exit_code == 0
+    assert f"Usage: {cli_runner.PROG_NAME}" in result.stdout
+
+
+def test_usage_errors_exit_with_code_two(runner: CliRunner) -> None:
+    """It reports usage errors on stderr with an exit code of two."""
+    result = runner.invoke(["--bogus"])
+    assert result.exit_code == 2
+    assert "No such option" in result.stderr
+    assert result.stdout == ""
+
+
+def test_env_and_cwd_are_applied(runner: CliRunner, tmp_path: Path) -> None:
+    """It runs the command with the provided environment and working directory."""
+    result = runner.invoke(env={PROFILE_ENV_VAR: "cprofile", PROFILE_DIR_ENV_VAR: "profiles"}, cwd=tmp_path)
+    assert result.exit_code == 0
+    assert "Wrote cprofile profile" in result.stderr
+    assert len(list((tmp_path / "profiles").glob("*.prof"))) == 1
+
+
+def test_env_is_isolated_between_invocations(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It doesn't leak the environment of one invocation into the next, and unsets variables set to None."""
+    runner.invoke(env={PROFILE_ENV_VAR: "cprofile", PROFILE_DIR_ENV_VAR: str(tmp_path)})
+    monkeypatch.setenv(PROFILE_ENV_VAR, "sample")
+    monkeypatch.setenv(PROFILE_DIR_ENV_VAR, str(tmp_path))
+    runner.invoke(env={PROFILE_ENV_VAR: None}, stdin="ignored\n")
+    assert [path.suffix for path in tmp_path.iterdir() if path.suffix != ".txt"] == [".prof"]
+
+
+def test_get_cli_runner_prefers_fork_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It uses the fork server where fork is available."""
+    monkeypatch.delenv(cli_runner.RUNNER_ENV_VAR, raising=False)
+    expected: type[CliRunner] = (
+        cli_runner.ForkServerCliRunner if hasattr(os, "fork") else cli_runner.SubprocessCliRunner
+    )
+    with cli_runner.get_cli_runner() as runner:
+        assert type(runner) is expected
+
+
+def test_get_cli_runner_falls_back_without_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It falls back to subprocesses where fork isn't available."""
+    monkeypatch.delattr(os, "fork", raising=False)
+    assert isinstance(cli_runner.get_cli_runner(), cli_runner.SubprocessCliRunner)
+
+
+def test_get_cli_runner_falls_back_when_requested(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It uses subprocesses when requested through the environment."""
+    monkeypatch.setenv(cli_runner.RUNNER_ENV_VAR, "subprocess")
+    assert isinstance(cli_runner.get_cli_runner(), cli_runner.SubprocessCliRunner)
+
+
+@requires_fork
+def test_fork_server_exit_is_reported() -> None:
+    """It raises a RuntimeError if the fork server is no longer running."""
+    with cli_runner.ForkServerCliRunner() as runner:
+        runner._process.kill()
+        runner._process.wait()
+        with pytest.raises(RuntimeError, match="fork server exited"):
+            runner.invoke()
+
+
+def test_base_runner_is_abstract() -> None:
+    """It requires subclasses to implement invoke."""
+    with pytest.raises(TypeError, match="invoke"):
+        CliRunner()  # pyright: ignore[reportAbstractUsage]
+
+
+def test_invoke_app_returns_exit_code(capsys: pytest.CaptureFixture[str]) -> None:
+    """It returns the exit code the app exits with."""
+    assert cli_runner.invoke_app(["--help"]) == 0
+    assert f"Usage: {cli_runner.PROG_NAME}" in capsys.readouterr().out
+
+
+def test_invoke_app_returns_zero_when_app_returns(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It treats an app that returns without exiting as successful."""
+
+    def succeed(*args: object, **kwargs: object) -> None:
+        return None
+
+    monkeypatch.setattr(cli_runner, "app", succeed)
+    assert cli_runner.invoke_app([]) == 0
+
+
+def test_invoke_app_reports_exceptions(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    """It prints the traceback of an uncaught exception and exits with a status code of one."""
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cli_runner, "app", fail)
+    assert cli_runner.invoke_app([]) == 1
+    assert "RuntimeError: boom" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(argnames=("code", "exit_code"), argvalues=[(None, 0), (3, 3), ("failed", 1)])
+def test_get_exit_code(code: object, exit_code: int, capsys: pytest.CaptureFixture[str]) -> None:
+    """It converts the code of a SystemExit the same way the interpreter does."""
+    assert cli_runner.get_exit_code(code) == exit_code
+    assert capsys.readouterr().err == ("failed\n" if code == "failed" else "")
@@ -1 +1,3 @@
 """Fixtures used in all tests."""
+
+pytest_plugins = ["pytester", "tests.memory_plugin"]
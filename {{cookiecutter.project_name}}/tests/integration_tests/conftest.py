@@ -1 +1,64 @@
 """Fixtures used in integration tests."""
+
+import socketserver
+import threading
+import time
+from typing import Iterator
+
+import pytest
+
+
+class StubHandler(socketserver.StreamRequestHandler):
+    """Replies to a line of `<delay> <value>` with the value after sleeping for the delay, or hangs up on `fail`."""
+
+    server: "StubServer"
+
+    def handle(self) -> None:
+        """Handles a single request, tracking how many are in flight at once."""
+        # A client cancelled before sending its request is hung up on, the same as a request to fail
+        delay, value = self.rfile.readline().decode().split() or ["0", "fail"]
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            time.sleep(float(delay))
+        finally:
+            # Before replying, so the client can't start its next request while this one still counts as in flight
+            with self.server.lock:
+                self.server.in_flight -= 1
+        if value != "fail":
+            self.wfile.write(f"{value}\n".encode())
+
+
+class StubServer(socketserver.ThreadingTCPServer):
+    """A local server standing in for a slow remote service, which handles every connection in a thread of its own."""
+
+    daemon_threads = True
+    # The default backlog of 5 leaves any further connections made at once waiting on a SYN retransmit
+    request_queue_size = 128
+
+    def __init__(self) -> None:
+        """Binds to a free port on localhost."""
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.lock: threading.Lock = threading.Lock()
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    @property
+    def port(self) -> int:
+        """The port the server is listening on."""
+        return self.server_address[1]
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    """Fixture for a stub server running in the background."""
+    server: StubServer = StubServer()
+    thread: threading.Thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
@@ -0,0 +1,83 @@
+"""Test cases for fanning out requests to a stub server with the concurrency module."""
+
+import asyncio
+import time
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from {{cookiecutter.package_name}}.concurrency import async_command
+from {{cookiecutter.package_name}}.concurrency import gather_bounded
+from tests.integration_tests.conftest import StubServer
+
+
+async def fetch(port: int, value: str, delay: float = 0.0) -> str:
+    """Requests the value from the stub server, which replies after the delay."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"{delay} {value}\n".encode())
+        await writer.drain()
+        reply: bytes = await reader.readline()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    if not reply:
+        raise ConnectionError(f"The stub server hung up on {value!r}.")
+    return reply.decode().strip()
+
+
+def test_gather_bounded_returns_results_in_order(stub_server: StubServer) -> None:
+    """It returns each result in the order of the awaitables, regardless of when they finish."""
+    delays: list[float] = [0.05, 0.0, 0.03, 0.01]
+    awaitables = (fetch(stub_server.port, str(index), delay) for index, delay in enumerate(delays))
+    results: list[str] = asyncio.run(gather_bounded(awaitables, limit=4))
+    assert results == ["0", "1", "2", "3"]
+
+
+def test_gather_bounded_limits_requests_in_flight(stub_server: StubServer) -> None:
+    """It never has more requests in flight than the limit, while making use of all of it."""
+    awaitables = (fetch(stub_server.port, str(index), delay=0.05) for index in range(12))
+    asyncio.run(gather_bounded(awaitables, limit=3))
+    assert stub_server.max_in_flight == 3
+
+
+def test_gather_bounded_is_faster_than_sequential(stub_server: StubServer) -> None:
+    """It overlaps the latency of independent requests."""
+    start: float = time.perf_counter()
+    asyncio.run(gather_bounded((fetch(stub_server.port, str(index), delay=0.1) for index in range(10)), limit=10))
+    assert time.perf_counter() - start < 0.5
+
+
+def test_gather_bounded_cancels_remaining_on_failure(stub_server: StubServer) -> None:
+    """It raises the first failure without waiting for the slow requests still in flight."""
+    awaitables = [fetch(stub_server.port, "slow", delay=5.0), fetch(stub_server.port, "fail")]
+    start: float = time.perf_counter()
+    with pytest.raises(ConnectionError):
+        asyncio.run(gather_bounded(awaitables, limit=2))
+    assert time.perf_counter() - start < 2.0
+
+
+def test_gather_bounded_times_out(stub_server: StubServer) -> None:
+    """It raises once a request runs for longer than the timeout."""
+    awaitables = [fetch(stub_server.port, "slow", delay=5.0), fetch(stub_server.port, "fast")]
+    start: float = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(gather_bounded(awaitables, limit=1, timeout=0.1))
+    assert time.perf_counter() - start < 2.0
+
+
+def test_async_command_fans_out(stub_server: StubServer) -> None:
+    """It runs an async command with its parameters parsed by typer."""
+    app: typer.Typer = typer.Typer()
+
+    @app.command()
+    @async_command
+    async def main(count: int, limit: int = 2) -> None:
+        awaitables = (fetch(stub_server.port, str(index)) for index in range(count))
+        typer.echo(" ".join(await gather_bounded(awaitables, limit=limit)))
+
+    result = CliRunner().invoke(app, ["3", "--limit", "1"])
+    assert result.exit_code == 0
+    assert result.output == "0 1 2\n"
+    assert stub_server.max_in_flight == 1
@@ -0,0 +1,195 @@
+"""Pytest plugin that measures the memory used by each test and enforces memory budgets.
+
+Tests marked with memory_budget fail when they exceed their budget, for example:
+
+    @pytest.mark.memory_budget(traced=20 * MiB, rss=200 * MiB)
+    def test_load_large_file() -> None: ...
+
+The traced budget applies to the peak of the memory allocated through Python while the test runs, as measured by
+tracemalloc. The rss budget applies to how far the resident set size of the test process rises above where it was when
+the test started, sampled in the background while the test runs, so that it doesn't depend on which tests ran before.
+Short spikes between samples can be missed, and the resident set size is only available on Linux, where
+/proc/self/statm reports it. Elsewhere rss budgets are ignored.
+
+Running with --memory measures every test and writes a report to --memory-report, along with the change in each
+test's peak since the previous report at that path.
+"""
+
+import json
+import mmap
+import threading
+import tracemalloc
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from typing import Generator
+from typing import Optional
+
+import pytest
+
+
+KiB: int = 1024
+MiB: int = 1024 * KiB
+
+STATM_PATH: Path = Path("/proc/self/statm")
+RSS_SAMPLE_INTERVAL: float = 0.001
+DEFAULT_REPORT_PATH: Path = Path("tests") / "results" / "memory.json"
+SUMMARY_LIMIT: int = 10
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Adds the options for measuring memory."""
+    group: pytest.OptionGroup = parser.getgroup("memory")
+    group.addoption("--memory", action="store_true", help="Measure the memory used by every test.")
+    group.addoption(
+        "--memory-report",
+        type=Path,
+        default=DEFAULT_REPORT_PATH,
+        help="Path to write the memory report to, which is also diffed against.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Registers the memory_budget marker and the tracker that measures tests."""
+    config.addinivalue_line(
+        "markers", "memory_budget(traced=None, rss=None): fail the test if it exceeds these budgets in bytes."
+    )
+    config.pluginmanager.register(MemoryTracker(config), "memory-tracker")
+
+
+def get_current_rss() -> Optional[int]:
+    """Returns the current resident set size of this process in bytes, if the platform reports it."""
+    try:
+        resident_pages: int = int(STATM_PATH.read_text().split()[1])
+    except OSError:  # pragma: no cover
+        return None
+    return resident_pages * mmap.PAGESIZE
+
+
+def format_size(size: Optional[int]) -> str:
+    """Returns the size in bytes as MiB."""
+    return "n/a" if size is None else f"{size / MiB:.2f} MiB"
+
+
+class RssSampler:
+    """Samples the resident set size in a background thread to find how far it rises above its starting point."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL) -> None:
+        """Initializes the sampler, taking the starting point as the current resident set size."""
+        self.interval: float = interval
+        self.baseline: Optional[int] = get_current_rss()
+        self.peak: int = self.baseline or 0
+        self._stopped: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(target=self._sample, name="rss-sampler", daemon=True)
+
+    @property
+    def added(self) -> Optional[int]:
+        """The most the resident set size rose above its starting point, if the platform reports it."""
+        return None if self.baseline is None else self.peak - self.baseline
+
+    def __enter__(self) -> "RssSampler":
+        """Starts sampling."""
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stops sampling after taking a final sample."""
+        self._stopped.set()
+        self._thread.join()
+        self._record()
+
+    def _sample(self) -> None:
+        """Records a sample every interval until stopped."""
+        while not self._stopped.wait(self.interval):
+            self._record()
+
+    def _record(self) -> None:
+        """Records the current resident set size if it is the highest yet."""
+        self.peak = max(self.peak, get_current_rss() or 0)
+
+
+class MemoryTracker:
+    """Measures the memory of each test that is marked with a budget or of every test with --memory."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initializes the tracker from the command line options."""
+        self.enabled: bool = config.getoption("memory")
+        self.report_path: Path = config.getoption("memory_report")
+        self.results: dict[str, dict[str, Optional[int]]] = {}
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, Any, Any]:
+        """Measures the test's call and fails it if it went over its budget."""
+        marker: Optional[pytest.Mark] = item.get_closest_marker("memory_budget")
+        if marker is None and not self.enabled:
+            return (yield)
+
+        was_tracing: bool = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        rss_sampler: RssSampler = RssSampler()
+        try:
+            with rss_sampler:
+                result: Any = yield
+        finally:
+            traced_peak: int = tracemalloc.get_traced_memory()[1] - baseline
+            if not was_tracing:
+                tracemalloc.stop()
+            self.results[item.nodeid] = {"traced_peak": traced_peak, "rss_added": rss_sampler.added}
+
+        if marker is not None:
+            check_budget(marker=marker, traced_peak=traced_peak, rss_added=rss_sampler.added)
+        return result
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        """Writes the memory report and prints the tests whose peaks changed the most since the previous one."""
+        if not self.enabled:
+            return
+        previous: dict[str, dict[str, Any]] = {}
+        if self.report_path.exists():
+            previous = json.loads(self.report_path.read_text(encoding="utf-8"))["tests"]
+
+        changes: dict[str, Optional[int]] = {
+            nodeid: None if nodeid not in previous else result["traced_peak"] - previous[nodeid]["traced_peak"]
+            for nodeid, result in self.results.items()
+        }
+        report: dict[str, Any] = {
+            "tests": {
+                nodeid: {**result, "traced_peak_change": changes[nodeid]} for nodeid, result in self.results.items()
+            }
+        }
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+        terminalreporter.section("memory")
+        terminalreporter.write_line(f"{'traced peak':>14} {'change':>14} {'rss added':>14}  test")
+        ordered: list[str] = sorted(
+            self.results, key=lambda nodeid: (abs(changes[nodeid] or 0), self.results[nodeid]["traced_peak"])
+        )
+        for nodeid in reversed(ordered[-SUMMARY_LIMIT:]):
+            result: dict[str, Optional[int]] = self.results[nodeid]
+            change: str = "new" if changes[nodeid] is None else f"{changes[nodeid] / MiB:+.2f} MiB"
+            terminalreporter.write_line(
+                f"{format_size(result['traced_peak']):>14} {change:>14} {format_size(result['rss_added']):>14}  {nodeid}"
+            )
+        terminalreporter.write_line(f"Wrote memory report for {len(self.results)} test(s) to {self.report_path}")
+
+
+def check_budget(marker: pytest.Mark, traced_peak: int, rss_added: Optional[int]) -> None:
+    """Fails the current test if either measurement is over the budget of its marker."""
+    traced_budget: Optional[int] = marker.kwargs.get("traced")
+    rss_budget: Optional[int] = marker.kwargs.get("rss")
+    failures: list[str] = []
+    if traced_budget is not None and traced_peak > traced_budget:
+        failures.append(f"traced peak {format_size(traced_peak)} exceeded budget {format_size(traced_budget)}")
+    if rss_budget is not None and rss_added is not None and rss_added > rss_budget:
+        failures.append(f"rss added {format_size(rss_added)} exceeded budget {format_size(rss_budget)}")
+    if failures:
+        pytest.fail("Memory budget exceeded: " + ", ".join(failures), pytrace=False)
@@ -0,0 +1,63 @@
+"""Test cases for the concurrency module."""
+
+import asyncio
+import inspect
+
+import pytest
+
+from {{cookiecutter.package_name}}.concurrency import async_command
+from {{cookiecutter.package_name}}.concurrency import gather_bounded
+
+
+async def fail() -> None:
+    """Raises once awaited."""
+    raise RuntimeError("failed")
+
+
+def test_async_command_runs_coroutine() -> None:
+    """It runs the coroutine to completion and returns its result."""
+
+    @async_command
+    async def double(value: int) -> int:
+        await asyncio.sleep(0)
+        return value * 2
+
+    assert double(21) == 42
+
+
+def test_async_command_keeps_signature() -> None:
+    """It keeps the signature that typer reads parameters from."""
+
+    async def command(name: str, count: int = 1) -> None:
+        """Does nothing."""
+
+    assert inspect.signature(async_command(command)) == inspect.signature(command)
+    assert async_command(command).__doc__ == "Does nothing."
+
+
+@pytest.mark.parametrize(argnames="limit", argvalues=[0, -1])
+def test_gather_bounded_rejects_limit(limit: int) -> None:
+    """It raises a ValueError when the limit is less than one."""
+    with pytest.raises(ValueError, match="at least 1"):
+        asyncio.run(gather_bounded([], limit=limit))
+
+
+def test_gather_bounded_accepts_futures() -> None:
+    """It awaits futures and tasks as well as coroutines."""
+
+    async def gather() -> list[int]:
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        future.set_result(1)
+        return await gather_bounded([future, asyncio.ensure_future(asyncio.sleep(0, result=2))], limit=1)
+
+    assert asyncio.run(gather()) == [1, 2]
+
+
+def test_gather_bounded_closes_unstarted_coroutines() -> None:
+    """It closes the coroutines still waiting to start when another fails."""
+    running = asyncio.sleep(1)
+    waiting = asyncio.sleep(0)
+    with pytest.raises(RuntimeError, match="failed"):
+        asyncio.run(gather_bounded([fail(), running, waiting], limit=1))
+    assert inspect.getcoroutinestate(running) == inspect.CORO_CLOSED
+    assert inspect.getcoroutinestate(waiting) == inspect.CORO_CLOSED
@@ -0,0 +1,150 @@
+"""Test cases for the log module."""
+
+import io
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from {{cookiecutter.package_name}} import log
+
+
+class GatedStream(io.StringIO):
+    """A stream whose writes wait for its gate to open, recording each time it's flushed."""
+
+    def __init__(self) -> None:
+        """Starts with the gate open."""
+        super().__init__()
+        self.gate: threading.Event = threading.Event()
+        self.gate.set()
+        self.flushes: list[str] = []
+        self.flushed: threading.Event = threading.Event()
+
+    def write(self, message: str) -> int:
+        """Writes the message once the gate is open."""
+        self.gate.wait()
+        return super().write(message)
+
+    def flush(self) -> None:
+        """Records what has been written so far."""
+        self.flushes.append(self.getvalue())
+        self.flushed.set()
+
+
+@pytest.fixture
+def log_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Fixture for a log file configured through the environment."""
+    path: Path = tmp_path / "app.log"
+    monkeypatch.setenv(log.LOG_FILE_ENV_VAR, str(path))
+    return path
+
+
+def test_get_log_settings_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It writes text at INFO to stderr through a queue by default."""
+    for name in (log.LOG_LEVEL_ENV_VAR, log.LOG_FORMAT_ENV_VAR, log.LOG_FILE_ENV_VAR, log.LOG_ENQUEUE_ENV_VAR):
+        monkeypatch.delenv(name, raising=False)
+    assert log.get_log_settings() == log.LogSettings(level="INFO", serialize=False, sink=sys.stderr, enqueue=True)
+
+
+def test_get_log_settings_from_env(monkeypatch: pytest.MonkeyPatch, log_path: Path) -> None:
+    """It reads every setting from the environment."""
+    monkeypatch.setenv(log.LOG_LEVEL_ENV_VAR, "debug")
+    monkeypatch.setenv(log.LOG_FORMAT_ENV_VAR, "JSON")
+    monkeypatch.setenv(log.LOG_ENQUEUE_ENV_VAR, "0")
+    assert log.get_log_settings() == log.LogSettings(level="DEBUG", serialize=True, sink=log_path, enqueue=False)
+
+
+def test_get_log_settings_rejects_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It raises a ValueError for an unknown log format."""
+    monkeypatch.setenv(log.LOG_FORMAT_ENV_VAR, "xml")
+    with pytest.raises(ValueError, match="Unknown log format 'xml'"):
+        log.get_log_settings()
+
+
+def test_configure_logging_writes_queued_records_on_exit(log_path: Path) -> None:
+    """It writes every queued record at or above the level by the time the with statement exits."""
+    with log.configure_logging():
+        logger.debug("hidden")
+        for index in range(100):
+            logger.info("record {}", index)
+    lines: list[str] = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 100
+    assert "| INFO     | tests.unit_tests.test_log:test_configure_logging_writes_queued_records_on_exit:" in lines[-1]
+    assert lines[-1].endswith(" - record 99")
+
+
+def test_configure_logging_writes_to_stderr(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """It writes to stderr when no log file is set."""
+    monkeypatch.delenv(log.LOG_FILE_ENV_VAR, raising=False)
+    with log.configure_logging():
+        logger.info("to stderr")
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err.endswith(" - to stderr\n")
+    assert not sys.stderr.closed
+
+
+def test_configure_logging_writes_json_lines(monkeypatch: pytest.MonkeyPatch, log_path: Path) -> None:
+    """It writes one serialized record per line in json format, from the calling thread when not enqueued."""
+    monkeypatch.setenv(log.LOG_FORMAT_ENV_VAR, "json")
+    monkeypatch.setenv(log.LOG_ENQUEUE_ENV_VAR, "0")
+    with log.configure_logging():
+        logger.bind(user="alice").warning("Signed in as {}", "alice")
+    record = json.loads(log_path.read_text(encoding="utf-8"))["record"]
+    assert record["message"] == "Signed in as alice"
+    assert record["level"]["name"] == "WARNING"
+    assert record["extra"] == {"user": "alice"}
+
+
+def test_configure_logging_skips_lazy_arguments_below_level(log_path: Path) -> None:
+    """It never calls the lazy arguments of records below the level."""
+    calls: list[str] = []
+
+    def summarize() -> str:
+        calls.append("summarize")
+        return "summary"
+
+    with log.configure_logging(log.get_log_settings()._replace(level="WARNING")):
+        logger.opt(lazy=True).info("Loaded {}", summarize)
+        logger.opt(lazy=True).warning("Loaded {}", summarize)
+    assert calls == ["summarize"]
+    assert log_path.read_text(encoding="utf-8").endswith("- Loaded summary\n")
+
+
+def test_configure_logging_removes_handler_on_exit(log_path: Path) -> None:
+    """It leaves nothing written after the with statement exits."""
+    with log.configure_logging() as handler_id:
+        pass
+    logger.error("after exit")
+    assert log_path.read_text(encoding="utf-8") == ""
+    with pytest.raises(ValueError, match=str(handler_id)):
+        logger.remove(handler_id)
+
+
+def test_queued_writer_flushes_once_queue_is_empty() -> None:
+    """It flushes after writing every message queued so far."""
+    stream: GatedStream = GatedStream()
+    writer: log.QueuedWriter = log.QueuedWriter(stream, close=False)
+    writer.write("first\n")
+    assert stream.flushed.wait(timeout=5)
+    stream.gate.clear()
+    writer.write("second\n")
+    writer.write("third\n")
+    stream.gate.set()
+    writer.stop()
+    assert stream.flushes[0] == "first\n"
+    assert "first\nsecond\n" not in stream.flushes
+    assert stream.flushes[-1] == "first\nsecond\nthird\n"
+    assert not stream.closed
+
+
+def test_queued_writer_reports_tty() -> None:
+    """It reports whether its stream is a terminal so loguru can decide whether to colorize."""
+    writer: log.QueuedWriter = log.QueuedWriter(io.StringIO(), close=True)
+    assert not writer.isatty()
+    writer.stop()
@@ -0,0 +1,126 @@
+"""Test cases for the memory_plugin module."""
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from tests import memory_plugin
+
+
+TEST_FILE: str = """
+import pytest
+
+from tests.memory_plugin import MiB
+
+
+@pytest.mark.memory_budget(traced=1 * MiB)
+def test_within_budget():
+    data = bytearray(MiB // 4)
+    assert data
+
+
+@pytest.mark.memory_budget(traced=1 * MiB)
+def test_over_budget():
+    data = bytearray(4 * MiB)
+    assert data
+
+
+@pytest.mark.memory_budget(traced=1 * MiB)
+def test_fails_on_its_own():
+    assert False
+
+
+def test_unmarked():
+    data = bytearray(2 * MiB)
+    assert data
+"""
+
+RSS_TEST_FILE: str = """
+import time
+
+import pytest
+
+from tests.memory_plugin import MiB
+
+
+@pytest.mark.memory_budget(rss=32 * MiB)
+def test_over_rss_budget():
+    data = b"x" * (64 * MiB)
+    time.sleep(0.05)
+    assert data
+
+
+@pytest.mark.memory_budget(rss=32 * MiB)
+def test_within_rss_budget_after_a_larger_test():
+    pass
+"""
+
+
+@pytest.fixture
+def report_path(pytester: pytest.Pytester) -> Path:
+    """Path of the memory report written by the tests run within pytester."""
+    pytester.makepyfile(test_memory=TEST_FILE)
+    return pytester.path / "memory.json"
+
+
+def test_budgets_are_enforced(pytester: pytest.Pytester, report_path: Path) -> None:
+    """It fails the tests that exceed their budgets without measuring unmarked tests."""
+    result: pytest.RunResult = pytester.runpytest("-p", "tests.memory_plugin")
+    result.assert_outcomes(passed=2, failed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*_ test_over_budget _*",
+            "Memory budget exceeded: traced peak 4.* MiB exceeded budget 1.00 MiB",
+            "*_ test_fails_on_its_own _*",
+        ]
+    )
+    assert not report_path.exists()
+
+
+@pytest.mark.skipif(memory_plugin.get_current_rss() is None, reason="The resident set size is only read on Linux.")
+def test_rss_budgets_measure_each_test(pytester: pytest.Pytester) -> None:
+    """It fails tests by the resident memory they add, whatever the peak reached by the tests before them."""
+    pytester.makepyfile(test_rss=RSS_TEST_FILE)
+    result: pytest.RunResult = pytester.runpytest("-p", "tests.memory_plugin")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        ["*_ test_over_rss_budget _*", "Memory budget exceeded: rss added * MiB exceeded budget 32.00 MiB"]
+    )
+
+
+def test_report_is_written_and_diffed(pytester: pytest.Pytester, report_path: Path) -> None:
+    """It reports every test and the change in each test's peak since the previous report."""
+    args: list[str] = ["-p", "tests.memory_plugin", "--memory", f"--memory-report={report_path}"]
+    pytester.runpytest(*args).stdout.fnmatch_lines(["*memory*", "*new*test_memory.py::*", "Wrote memory report for 4*"])
+    first: dict = json.loads(report_path.read_text())["tests"]
+    assert set(first) == {f"test_memory.py::{name}" for name in memory_plugin_test_names()}
+    assert first["test_memory.py::test_unmarked"]["traced_peak"] >= 2 * memory_plugin.MiB
+    assert first["test_memory.py::test_unmarked"]["traced_peak_change"] is None
+    assert set(first["test_memory.py::test_unmarked"]) == {"traced_peak", "rss_added", "traced_peak_change"}
+
+    pytester.runpytest(*args).stdout.fnmatch_lines(["* MiB*test_memory.py::*"])
+    second: dict = json.loads(report_path.read_text())["tests"]
+    assert all(isinstance(result["traced_peak_change"], int) for result in second.values())
+
+
+def test_existing_trace_is_kept(pytester: pytest.Pytester, report_path: Path) -> None:
+    """It leaves tracemalloc running if it was already tracing."""
+    tracemalloc.start()
+    try:
+        pytester.runpytest("-p", "tests.memory_plugin", "-k", "within_budget").assert_outcomes(passed=1)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def memory_plugin_test_names() -> list[str]:
+    """Returns the names of the tests in TEST_FILE."""
+    return [line[len("def ") : line.index("(")] for line in TEST_FILE.splitlines() if line.startswith("def ")]
+
+
+def test_format_size() -> None:
+    """It formats sizes as MiB."""
+    assert memory_plugin.format_size(3 * memory_plugin.MiB // 2) == "1.50 MiB"
+    assert memory_plugin.format_size(None) == "n/a"
@@ -0,0 +1,128 @@
+"""Test cases for the profiling module."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from {{cookiecutter.package_name}} import __main__
+from {{cookiecutter.package_name}} import profiling
+
+
+class SignalingSampler(profiling.StackSampler):
+    """A stack sampler that signals each time it takes a sample."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        """Initializes the sampler with its event cleared."""
+        super().__init__(thread_id=thread_id, interval=interval)
+        self.sampled: threading.Event = threading.Event()
+
+    def sample(self) -> None:
+        """Records the stack and signals that a sample was taken."""
+        super().sample()
+        self.sampled.set()
+
+
+def busy() -> int:
+    """Does a little CPU and allocation bound work to profile."""
+    return sum(value * value for value in range(20_000))
+
+
+def test_run_without_profile_calls_function(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """It calls the function directly when no profile mode is set."""
+    monkeypatch.delenv(profiling.PROFILE_ENV_VAR, raising=False)
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV_VAR, str(tmp_path))
+    assert profiling.run(lambda: 42) == 42
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    argnames=("mode", "suffixes"),
+    argvalues=[
+        ("cprofile", [".prof", ".txt"]),
+        ("sample", [".folded"]),
+        ("tracemalloc", [".tracemalloc", ".txt"]),
+    ],
+)
+def test_run_writes_reports(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mode: str, suffixes: list[str]) -> None:
+    """It writes the reports of the profile mode to the profile dir."""
+    monkeypatch.setenv(profiling.PROFILE_ENV_VAR, mode)
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV_VAR, str(tmp_path))
+    assert profiling.run(busy) == busy()
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == suffixes
+    assert all(path.stat().st_size > 0 for path in tmp_path.iterdir())
+
+
+def test_run_writes_reports_when_cli_exits(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """It still writes reports when the command exits through SystemExit."""
+    monkeypatch.setenv(profiling.PROFILE_ENV_VAR, "cprofile")
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV_VAR, str(tmp_path))
+    with pytest.raises(SystemExit):
+        profiling.run(lambda: __main__.app([]))
+    assert len(list(tmp_path.glob("*.prof"))) == 1
+
+
+def test_cli_succeeds_with_profile(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """It leaves the command's behavior unchanged when profiling."""
+    monkeypatch.setenv(profiling.PROFILE_DIR_ENV_VAR, str(tmp_path))
+    with profiling.profile(mode="tracemalloc", profile_dir=tmp_path) as reports:
+        result = CliRunner().invoke(__main__.app)
+    assert result.exit_code == 0
+    assert [path.suffix for path in reports] == [".tracemalloc", ".txt"]
+
+
+def test_tracemalloc_keeps_existing_trace(tmp_path: Path) -> None:
+    """It leaves tracemalloc running if it was already tracing."""
+    profiling.tracemalloc.start()
+    try:
+        with profiling.profile(mode="tracemalloc", profile_dir=tmp_path):
+            busy()
+        assert profiling.tracemalloc.is_tracing()
+    finally:
+        profiling.tracemalloc.stop()
+
+
+def test_profile_rejects_unknown_mode(tmp_path: Path) -> None:
+    """It raises a ValueError for an unknown profile mode."""
+    with pytest.raises(ValueError, match="mode 'bogus'"), profiling.profile(mode="bogus", profile_dir=tmp_path):
+        pass  # pragma: no cover
+
+
+def test_get_profile_dir_defaults_to_user_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It defaults to a profiles folder in the user cache directory."""
+    monkeypatch.delenv(profiling.PROFILE_DIR_ENV_VAR, raising=False)
+    cache_path: Path = profiling.platformdirs.user_cache_path(appname="{{cookiecutter.project_name}}")
+    assert profiling.get_profile_dir() == cache_path / "profiles"
+
+
+def test_stack_sampler_records_stacks() -> None:
+    """It records the folded stack of the sampled thread, outermost call first."""
+    sampler = profiling.StackSampler(thread_id=threading.get_ident(), interval=1)
+    sampler.sample()
+    (stack,) = sampler.counts
+    assert stack.split(";")[-1].startswith("sample (")
+    assert "test_stack_sampler_records_stacks (" in stack
+
+
+def test_stack_sampler_ignores_finished_thread() -> None:
+    """It records nothing for a thread that is no longer running."""
+    thread = threading.Thread(target=busy)
+    thread.start()
+    thread.join()
+    sampler = profiling.StackSampler(thread_id=thread.ident or 0, interval=1)
+    sampler.sample()
+    assert not sampler.counts
+
+
+def test_stack_sampler_samples_until_stopped() -> None:
+    """It samples the thread in the background at the interval until stopped."""
+    sampler = SignalingSampler(thread_id=threading.get_ident(), interval=0.0001)
+    sampler.start()
+    assert sampler.sampled.wait(timeout=5)
+    sampler.stop()
+    samples: int = sum(sampler.counts.values())
+    sampler.sampled.clear()
+    assert not sampler.sampled.wait(timeout=0.01)
+    assert sum(sampler.counts.values()) == samples
+    assert any("test_stack_sampler_samples_until_stopped (" in stack for stack in sampler.counts)